@@ -11,4 +11,4 @@ Note:
     not a bad idea to minimize the amount of stale docs in the user's cache
 """
 
-__version_collection_doc_cache__ = "1.1"
+__version_collection_doc_cache__ = "1.2"
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 
-from copy import deepcopy
 from typing import TYPE_CHECKING
 
 from ansible_navigator.actions import kegexes
@@ -119,7 +118,7 @@ class ActionBase:
 
     @staticmethod
     def _copy_args(args: ApplicationConfiguration) -> ApplicationConfiguration:
-        """Deepcopy the args.
+        """Copy the args.
 
         Note: Unmount the collection doc cache (CDC) first
         the CDC will get mounted if the child needs it
@@ -132,7 +131,7 @@ class ActionBase:
             A copy of the current application configuration
         """
         args.internals.collection_doc_cache = C.NOT_SET
-        return deepcopy(args)
+        return args.copy()
 
     def _prepare_to_run(self, app: AppPublic, interaction: Interaction) -> None:
         """Prepare for action run.
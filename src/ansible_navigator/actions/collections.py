@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import curses
 import json
+import logging
 import shlex
 import sys
 
@@ -12,6 +13,8 @@ from json.decoder import JSONDecodeError
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import SupportsIndex
+from typing import overload
 
 from ansible_navigator.action_base import ActionBase
 from ansible_navigator.action_defs import RunStdoutReturn
@@ -34,6 +37,8 @@ from . import run_action
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ansible_navigator.app_public import AppPublic
     from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 
@@ -96,6 +101,65 @@ def filter_content_keys(obj: dict[Any, Any]) -> dict[Any, Any]:
     return {k: v for k, v in obj.items() if not k.startswith("__")}
 
 
+class CollectionContents(list[dict[str, Any]]):
+    """The plugins and roles of a collection, indexing a plugin reads its doc from the cache."""
+
+    def __init__(
+        self,
+        contents: Iterable[dict[str, Any]],
+        collection_cache: KeyValueStore,
+    ) -> None:
+        """Initialize the collection contents.
+
+        Args:
+            contents: The menu entries for the plugins and roles
+            collection_cache: The collection doc cache
+        """
+        super().__init__(contents)
+        self._collection_cache = collection_cache
+        self._logger = logging.getLogger(__name__)
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(
+        self,
+        index: SupportsIndex | slice,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Read the doc for a plugin, the first time it is shown.
+
+        Args:
+            index: The index of the plugin or role
+
+        Returns:
+            The plugin and its doc or the role, or the menu entries for a slice
+        """
+        if isinstance(index, slice):
+            return list.__getitem__(self, index)
+        entry = list.__getitem__(self, index)
+        checksum = entry.get("__checksum")
+        if checksum is None:
+            return entry
+
+        self._collection_cache.open_()
+        try:
+            plugin = json.loads(self._collection_cache[checksum])["plugin"]
+        except (KeyError, JSONDecodeError) as exc:
+            self._logger.exception("error loading plugin doc %s", entry["full_name"])
+            self._logger.debug("error was %s", str(exc))
+            plugin = {}
+        finally:
+            self._collection_cache.close()
+
+        content = {**plugin, **entry}
+        del content["__checksum"]
+        list.__setitem__(self, index, content)
+        return content
+
+
 @actions.register
 class Action(ActionBase):
     """Collections subcommand implementation."""
@@ -312,49 +376,38 @@ class Action(ActionBase):
         Returns:
             The plugin menu definition
         """
-        self._collection_cache.open_()
         selected_collection = self._collections[self.steps.current.index]
         collection_name = f"__{selected_collection['known_as']}"
         collection_contents = []
         for plugin_checksum, details in selected_collection["plugin_checksums"].items():
+            summary = details.get("summary")
+            if summary is None or summary["name"] is None:
+                continue
+            short_name = summary["name"]
+            plugin: dict[str, Any] = {"__checksum": plugin_checksum}
+            plugin[collection_name] = short_name
+            plugin["full_name"] = f"{selected_collection['known_as']}.{short_name}"
+            plugin["__type"] = details["type"]
+            plugin["collection_info"] = selected_collection["collection_info"]
+            plugin["collection_info"]["name"] = selected_collection["known_as"]
+            plugin["collection_info"]["shadowed_by"] = selected_collection["hidden_by"]
+            plugin["collection_info"]["path"] = selected_collection["path"]
+
+            plugin["__added"] = summary["version_added"]
+            plugin["__description"] = summary["short_description"]
+
+            runtime_section = "modules" if details["type"] == "module" else details["type"]
+            plugin["__deprecated"] = "False"
             try:
-                plugin_json = self._collection_cache[plugin_checksum]
-                loaded = json.loads(plugin_json)
-
-                plugin = loaded["plugin"]
-                if plugin["doc"] is not None:
-                    if "name" in plugin["doc"]:
-                        short_name = plugin["doc"]["name"]
-                    else:
-                        short_name = plugin["doc"][details["type"]]
-                    plugin[collection_name] = short_name
-                    plugin["full_name"] = f"{selected_collection['known_as']}.{short_name}"
-                    plugin["__type"] = details["type"]
-                    plugin["collection_info"] = selected_collection["collection_info"]
-                    plugin["collection_info"]["name"] = selected_collection["known_as"]
-                    plugin["collection_info"]["shadowed_by"] = selected_collection["hidden_by"]
-                    plugin["collection_info"]["path"] = selected_collection["path"]
-
-                    plugin["__added"] = plugin["doc"].get("version_added")
-                    plugin["__description"] = plugin["doc"]["short_description"]
-
-                    runtime_section = "modules" if details["type"] == "module" else details["type"]
-                    plugin["__deprecated"] = "False"
-                    try:
-                        routing_info = selected_collection["runtime"]["plugin_routing"]
-                        runtime_info = routing_info[runtime_section][short_name]
-                        plugin["additional_information"] = runtime_info
-                        if "deprecation" in runtime_info:
-                            plugin["__deprecated"] = "True"
-                    except KeyError:
-                        plugin["additional_information"] = {}
-
-                    collection_contents.append(plugin)
-            except (KeyError, JSONDecodeError) as exc:
-                self._logger.exception("error loading plugin doc %s", details)
-                self._logger.debug("error was %s", str(exc))
-
-        self._collection_cache.close()
+                routing_info = selected_collection["runtime"]["plugin_routing"]
+                runtime_info = routing_info[runtime_section][short_name]
+                plugin["additional_information"] = runtime_info
+                if "deprecation" in runtime_info:
+                    plugin["__deprecated"] = "True"
+            except KeyError:
+                plugin["additional_information"] = {}
+
+            collection_contents.append(plugin)
 
         for role in selected_collection["roles"]:
             role[collection_name] = role["short_name"]
@@ -386,7 +439,7 @@ class Action(ActionBase):
         return Step(
             name="collection_content",
             step_type="content",
-            value=self.steps.current.value,
+            value=CollectionContents(self.steps.current.value, self._collection_cache),
             index=self.steps.current.index,
         )
 
@@ -426,6 +479,7 @@ class Action(ActionBase):
             "execution_environment": self._args.execution_environment,
             "navigator_mode": "interactive",
             "pass_environment_variable": self._args.pass_environment_variable,
+            "persistent": self._args.execution_environment_persistent,
             "set_environment_variable": set_environment_variable,
             "private_data_dir": self._args.ansible_runner_artifact_dir,
             "rotate_artifacts": self._args.ansible_runner_rotate_artifacts_count,
@@ -633,41 +687,26 @@ class Action(ActionBase):
         """
         plugins_details: dict[str, Any] = {}
 
-        for plugin_checksum, plugin_info in selected_collection["plugin_checksums"].items():
+        for plugin_info in selected_collection["plugin_checksums"].values():
             plugin_type = plugin_info.get("type")
             if plugin_type not in plugins_details:
                 plugins_details[plugin_type] = []
 
-            plugin_json = self._collection_cache[plugin_checksum]
-            loaded = json.loads(plugin_json)
-
-            plugin = loaded.get("plugin")
+            summary = plugin_info.get("summary")
             plugin_docs = {}
             plugin_path = Path(selected_collection.get("path", "")) / Path(
                 plugin_info.get("path", ""),
             )
             plugin_docs["path"] = str(plugin_path)
-            if plugin and plugin["doc"] is not None:
-                try:
-                    if "name" in plugin["doc"]:
-                        short_name = plugin["doc"]["name"]
-                    else:
-                        short_name = plugin["doc"][plugin_type]
-                except (KeyError, TypeError) as exc:
-                    short_name = None
-                    self._logger.exception(
-                        "Error getting short name from plugin doc %s",
-                        plugin_docs["path"],
-                    )
-                    self._logger.debug("error was %s", str(exc))
-                    self._logger.debug(plugin)
+            if summary is not None:
+                short_name = summary["name"]
                 if short_name is None:
                     plugin_docs["full_name"] = selected_collection["known_as"]
                 else:
                     plugin_docs["full_name"] = f"{selected_collection['known_as']}.{short_name}"
 
-                if "short_description" in plugin["doc"]:
-                    plugin_docs["short_description"] = plugin["doc"]["short_description"]
+                if summary["short_description"] is not None:
+                    plugin_docs["short_description"] = summary["short_description"]
 
             plugins_details[plugin_type].append(plugin_docs)
 
@@ -691,7 +730,6 @@ class Action(ActionBase):
         ]
         roles_exclude_keys = ["readme"]
 
-        self._collection_cache.open_()
         for collection in self._collections:
             plugins_details = self._get_collection_plugins_details(collection)
 
@@ -715,6 +753,5 @@ class Action(ActionBase):
 
             collection_stdout["plugins"] = plugins_details
             collections_info["collections"].append(collection_stdout)
-        self._collection_cache.close()
 
         return collections_info
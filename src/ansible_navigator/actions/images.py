@@ -15,7 +15,9 @@ from ansible_navigator.action_base import ActionBase
 from ansible_navigator.action_defs import RunStdoutReturn
 from ansible_navigator.configuration_subsystem import Constants
 from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.image_manager import IntrospectionCache
 from ansible_navigator.image_manager import inspect_all
+from ansible_navigator.image_manager import inspect_id
 from ansible_navigator.runner import Command
 from ansible_navigator.steps import Step
 from ansible_navigator.ui_framework import CursesLine
@@ -182,12 +184,12 @@ class Action(ActionBase):
             A message and return code
         """
         image_name = self._args.execution_environment_image
+        image_id = inspect_id(container_engine=self._args.container_engine, image_name=image_name)
 
-        output, error, return_code = self._run_runner(image_name=image_name)
+        details, error, return_code = self._introspect(image_name=image_name, image_id=image_id)
         if error or return_code:
             return RunStdoutReturn(message=error, return_code=return_code)
 
-        details = self._parse(output)
         if details is None:
             message = "Image introspection failed, please check the logs and log an issue."
             return RunStdoutReturn(message=message, return_code=1)
@@ -471,6 +473,10 @@ class Action(ActionBase):
                 image["__name_tag"] += " (primary)"
 
             details = image["inspect"]["details"]
+            try:
+                image["__image_id"] = details["id"]
+            except (KeyError, TypeError):
+                image["__image_id"] = ""
 
             try:
                 legacy_check = details["config"]["working_dir"] == "/runner"
@@ -508,8 +514,9 @@ class Action(ActionBase):
 
         self._images.selected["__introspected"] = True
 
-        output, error, _return_code = self._run_runner(
+        parsed, error, _return_code = self._introspect(
             image_name=self._images.selected["__full_name"],
+            image_id=self._images.selected["__image_id"],
         )
 
         if error:
@@ -519,7 +526,6 @@ class Action(ActionBase):
             )
             self.notify_failed()
             return False
-        parsed = self._parse(output)
         if parsed is None:
             self.notify_failed()
             return False
@@ -541,12 +547,50 @@ class Action(ActionBase):
         except KeyError:
             self._logger.exception(
                 "Image introspection failed (keys), the return value was: %s",
-                output[0:1000],
+                str(parsed)[0:1000],
             )
             self.notify_failed()
             return False
         return True
 
+    def _introspect(
+        self,
+        image_name: str,
+        image_id: str,
+    ) -> tuple[dict[Any, Any] | None, str, int]:
+        """Introspect an image, reusing the details cached for the image ID.
+
+        An image is immutable for a given ID, so the details are cached across sessions. The
+        cached details are discarded and collected again if a refresh was requested.
+
+        Args:
+            image_name: The full image name
+            image_id: The image ID, or an empty string if not known
+
+        Returns:
+            The parsed details, or None if they could not be parsed, the errors and the
+            return code
+        """
+        cache = IntrospectionCache(cache_path=self._args.internals.cache_path)
+        try:
+            if image_id and self._args.images_refresh is True:
+                cache.invalidate(image_id)
+            elif image_id:
+                details = cache.get(image_id)
+                if details is not None:
+                    self._logger.debug("Using cached introspection of %s", image_name)
+                    return details, "", 0
+
+            output, error, return_code = self._run_runner(image_name=image_name)
+            if error:
+                return None, error, return_code
+            details = self._parse(output)
+            if details is not None and image_id and not return_code:
+                cache.set(image_id, details)
+            return details, error, return_code
+        finally:
+            cache.close()
+
     def _parse(self, output: str) -> dict[Any, Any] | None:
         """Load and process the ``json`` output from the image introspection process.
 
@@ -598,6 +642,7 @@ class Action(ActionBase):
             "execution_environment_image": image_name,
             "execution_environment": True,
             "navigator_mode": "interactive",
+            "persistent": self._args.execution_environment_persistent,
         }
 
         if isinstance(self._args.container_options, list):
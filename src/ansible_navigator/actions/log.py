@@ -7,6 +7,7 @@ from ansible_navigator.app_public import AppPublic
 from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 from ansible_navigator.content_defs import ContentFormat
 from ansible_navigator.ui_framework import Interaction
+from ansible_navigator.utils.log_tail import LogTail
 
 from . import _actions as actions
 
@@ -15,7 +16,7 @@ from . import _actions as actions
 class Action(ActionBase):
     """``:log`` command implementation."""
 
-    KEGEX = r"^l(?:og)?$"
+    KEGEX = r"^l(?:og)?(\s(?P<older>older))?$"
 
     def __init__(self, args: ApplicationConfiguration) -> None:
         """Initialize the ``:log`` action.
@@ -28,6 +29,9 @@ class Action(ActionBase):
     def run(self, interaction: Interaction, app: AppPublic) -> Interaction:
         """Execute the ``:log`` request for mode interactive.
 
+        The end of the log file is shown and followed as it grows, ``:log older`` pages in
+        older lines from the file.
+
         Args:
             interaction: The interaction from the user
             app: The app instance
@@ -39,17 +43,23 @@ class Action(ActionBase):
         self._logger.debug("log requested")
         self._prepare_to_run(app, interaction)
 
+        log_tail = LogTail(file=Path(self._args.log_file))
         auto_scroll = True
         while True:
             self._calling_app.update()
-            with Path(self._args.log_file).open(encoding="utf-8") as fh:
-                log_contents = fh.read()
+            # Keep the lines in place while they are being read
+            log_tail.update(trim=auto_scroll)
 
-            new_scroll = len(log_contents.splitlines())
+            new_scroll = len(log_tail.lines)
             if auto_scroll:
                 interaction.ui.scroll(new_scroll)
 
-            interaction = interaction.ui.show(obj=log_contents, content_format=ContentFormat.LOG)
+            interaction = interaction.ui.show(obj=log_tail.lines, content_format=ContentFormat.LOG)
+            if interaction.name == "log" and interaction.action.match.groupdict()["older"]:
+                # Show the end of the older lines, above those previously at the top
+                interaction.ui.scroll(log_tail.read_older())
+                auto_scroll = False
+                continue
             if interaction.name != "refresh":
                 break
 
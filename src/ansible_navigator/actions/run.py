@@ -15,6 +15,7 @@ import uuid
 from math import floor
 from operator import itemgetter
 from pathlib import Path
+from queue import Empty
 from queue import Queue
 from typing import TYPE_CHECKING
 from typing import Any
@@ -23,8 +24,6 @@ from ansible_navigator.action_base import ActionBase
 from ansible_navigator.action_defs import RunStdoutReturn
 from ansible_navigator.configuration_subsystem import to_effective
 from ansible_navigator.configuration_subsystem import to_sources
-from ansible_navigator.content_defs import ContentView
-from ansible_navigator.content_defs import SerializationFormat
 from ansible_navigator.runner import CommandAsync
 from ansible_navigator.steps import Step
 from ansible_navigator.ui_framework import CursesLine
@@ -42,7 +41,11 @@ from ansible_navigator.utils.functions import is_jinja
 from ansible_navigator.utils.functions import now_iso
 from ansible_navigator.utils.functions import remove_ansi
 from ansible_navigator.utils.functions import round_half_up
-from ansible_navigator.utils.serialize import serialize_write_file
+from ansible_navigator.utils.playbook_artifact import CORRUPT_ARTIFACT_ERRORS
+from ansible_navigator.utils.playbook_artifact import PlaybookArtifactReader
+from ansible_navigator.utils.playbook_artifact import PlaybookArtifactWriter
+from ansible_navigator.utils.playbook_artifact import TaskRecords
+from ansible_navigator.utils.playbook_artifact import open_artifact
 
 from . import _actions as actions
 from . import run_action
@@ -204,6 +207,25 @@ TASK_LIST_COLUMNS = [
     "__duration",
 ]
 
+PLAY_RESULT_COUNTERS = (
+    "__ok",
+    "__skipped",
+    "__failed",
+    "__unreachable",
+    "__ignored",
+    "__in progress",
+)
+"""The per play counters for each task result, maintained as runner events arrive"""
+
+DEQUEUE_CHUNK_SIZE = 100
+"""The number of runner events handled between checks of the dequeue time budget"""
+
+TASK_INDEX_KEY = ("task_uuid", "host")
+"""The task keys used to match a runner event to the task it completes"""
+
+TASK_SUMMARY_KEYS = (*TASK_LIST_COLUMNS, "task")
+"""The task keys kept in the artifact's index, enough to show the task list menu"""
+
 
 @actions.register
 class Action(ActionBase):
@@ -246,6 +268,14 @@ class Action(ActionBase):
         self._playbook_type: str = check_playbook_type(self._args.playbook)
         self._task_cache: dict[str, str] = {}
         """Task name storage from playbook_on_start using the task uuid as the key"""
+        self._play_index: dict[str, dict[str, Any]] = {}
+        """Plays in ``self._plays.value`` using the play uuid as the key"""
+        self._task_index: dict[tuple[str, str], dict[str, Any]] = {}
+        """Tasks across all plays using the task uuid and host as the key"""
+        self._artifact_journal: PlaybookArtifactWriter | None = None
+        """The records of the current playbook run, written as they arrive"""
+        self._artifact_reader: PlaybookArtifactReader | None = None
+        """The artifact being replayed, if written as records"""
 
     @property
     def mode(self) -> str:
@@ -444,12 +474,23 @@ class Action(ActionBase):
             artifact_file = populated_form["fields"]["artifact_file"]["value"]
 
         try:
-            with Path(artifact_file).open(encoding="utf-8") as fh:
+            version = PlaybookArtifactReader.version(Path(artifact_file))
+        except CORRUPT_ARTIFACT_ERRORS:
+            self._logger.exception("Unable to read artifact file")
+            return False
+        if version is not None:
+            return self._init_replay_records(artifact_file=Path(artifact_file), version=version)
+
+        try:
+            with open_artifact(Path(artifact_file)) as fh:
                 data = json.load(fh)
         except json.JSONDecodeError as exc:
             self._logger.debug("json decode error: %s", str(exc))
             self._logger.exception("Unable to parse artifact file")
             return False
+        except CORRUPT_ARTIFACT_ERRORS:
+            self._logger.exception("Unable to read artifact file")
+            return False
 
         version = data.get("version", "")
         if version.startswith(("1.", "2.")):
@@ -457,6 +498,8 @@ class Action(ActionBase):
                 stdout = data["stdout"]
                 if self.mode == "interactive":
                     self._plays.value = data["plays"]
+                    for play in self._plays.value:
+                        self._recount_play_stats(play)
                     self._interaction.ui.update_status(data["status"], data["status_color"])
                     self.stdout = stdout
                 else:
@@ -480,6 +523,73 @@ class Action(ActionBase):
         self._logger.debug("Completed replay artifact request with mode %s", self.mode)
         return True
 
+    def _init_replay_records(self, artifact_file: Path, version: str) -> bool:
+        """Replay an artifact written as records.
+
+        In mode interactive, only the artifact's footer and stdout are read, task details are
+        read when a task is shown. In mode stdout, the artifact is streamed for stdout.
+
+        Args:
+            artifact_file: The artifact file
+            version: The artifact version from the header record
+
+        Returns:
+            True if replay completes, False if there is an error
+        """
+        if not version.startswith("3."):
+            self._logger.error(
+                "Incompatible artifact version, got '%s', compatible = '3.y.z'",
+                version,
+            )
+            return False
+
+        reader = PlaybookArtifactReader(file=artifact_file)
+        try:
+            if self.mode == "interactive":
+                footer = reader.read_footer()
+                self._plays.value = footer["plays"]
+                for play in self._plays.value:
+                    self._recount_play_stats(play)
+                self._interaction.ui.update_status(footer["status"], footer["status_color"])
+                self.stdout = list(reader.stdout(footer["stdout"]))
+            else:
+                for line in reader.stream_stdout():
+                    if self._args.display_color is True:
+                        print(line)
+                    else:
+                        print(remove_ansi(line))
+        except (KeyError, ValueError, *CORRUPT_ARTIFACT_ERRORS) as exc:
+            reader.close()
+            self._logger.debug("error was: %s", str(exc))
+            self._logger.exception("Unable to read artifact file")
+            return False
+
+        # Task details are read from the artifact when a task is shown
+        self._close_artifact_reader()
+        if self.mode == "interactive":
+            self._artifact_reader = reader
+        else:
+            reader.close()
+
+        self._runner_finished = True
+        self._logger.debug("Completed replay artifact request with mode %s", self.mode)
+        return True
+
+    def _close_artifact_reader(self) -> None:
+        """Close the reader of a replayed artifact, removing its temporary file."""
+        if self._artifact_reader is not None:
+            self._artifact_reader.close()
+            self._artifact_reader = None
+
+    def _prepare_to_exit(self, interaction: Interaction) -> None:
+        """Close the replayed artifact and prepare for action exit.
+
+        Args:
+            interaction: The current interaction from the UI
+        """
+        self._close_artifact_reader()
+        super()._prepare_to_exit(interaction)
+
     def _prompt_for_artifact(self, artifact_file: str) -> dict[Any, Any]:
         """Prompt for a valid artifact file.
 
@@ -645,6 +755,13 @@ class Action(ActionBase):
             pass_through_arg.extend(self._args.cmdline)
         kwargs.update({"cmdline": pass_through_arg})
 
+        if self._artifact_journal is not None:
+            self._artifact_journal.close()
+            self._artifact_journal = None
+        if self.mode != "stdout" and self._args.playbook_artifact_enable:
+            self._artifact_journal = PlaybookArtifactWriter()
+        self._close_artifact_reader()
+
         self.runner = CommandAsync(
             executable_cmd=executable_cmd,
             queue=self._queue,
@@ -655,17 +772,33 @@ class Action(ActionBase):
         self._runner_finished = False
         self._logger.debug("runner requested to start")
 
-    def _dequeue(self) -> None:
-        """Drain the runner queue."""
+    def _dequeue(self, time_budget: float | None = None) -> None:
+        """Drain the runner queue.
+
+        Messages are handled in chunks, after each chunk the time budget is checked so a
+        backlog of messages does not prevent the UI from being refreshed.
+
+        Args:
+            time_budget: The seconds to spend draining the queue, None to drain it fully
+        """
         drain_count = 0
-        while not self._queue.empty():
-            if not self._first_message_received:
-                self._first_message_received = True
-            message = self._queue.get()
-            self._handle_message(message)
-            drain_count += 1
+        start = time.monotonic()
+        while True:
+            try:
+                for _ in range(DEQUEUE_CHUNK_SIZE):
+                    self._handle_message(self._queue.get_nowait())
+                    drain_count += 1
+            except Empty:
+                break
+            if time_budget is not None and time.monotonic() - start >= time_budget:
+                break
         if drain_count:
-            self._logger.debug("Drained %s events", drain_count)
+            self._first_message_received = True
+            self._logger.debug(
+                "Drained %s events, %s remaining",
+                drain_count,
+                self._queue.qsize(),
+            )
 
     def _handle_message(self, message: dict[str, Any]) -> None:
         # pylint: disable=too-many-locals
@@ -676,7 +809,10 @@ class Action(ActionBase):
         """
         # Collect any stdout
         if message.get("stdout"):
-            self.stdout.extend(message["stdout"].splitlines())
+            lines = message["stdout"].splitlines()
+            self.stdout.extend(lines)
+            if self._artifact_journal is not None:
+                self._artifact_journal.add_stdout(lines)
             if self.mode == "stdout_w_artifact":
                 print(message["stdout"])
 
@@ -702,7 +838,10 @@ class Action(ActionBase):
         if event == "playbook_on_play_start":
             event_data["__play_name"] = event_data["name"]
             event_data["tasks"] = []
+            event_data.update(dict.fromkeys(PLAY_RESULT_COUNTERS, 0))
+            event_data["__changed"] = 0
             self._plays.value.append(event_data)
+            self._play_index.setdefault(event_data["uuid"], event_data)
             return
 
         if event == "playbook_on_task_start":
@@ -719,8 +858,8 @@ class Action(ActionBase):
 
         # Find the parent play of the task
         try:
-            play = next(p for p in self._plays.value if p["uuid"] == event_data["play_uuid"])
-        except StopIteration:
+            play = self._play_index[event_data["play_uuid"]]
+        except KeyError:
             self._logger.warning("Playbook event without parent play")
             return
 
@@ -744,15 +883,14 @@ class Action(ActionBase):
                 },
             )
             play["tasks"].append(event_data)
+            self._task_index.setdefault(itemgetter(*TASK_INDEX_KEY)(event_data), event_data)
+            self._count_task(play=play, task=event_data, increment=1)
             return
 
         # The runner event indicates a task has finished, find the task in the play
-        match = ("task_uuid", "host")
         try:
-            task = next(
-                t for t in play["tasks"] if itemgetter(*match)(t) == itemgetter(*match)(event_data)
-            )
-        except StopIteration:
+            task = self._task_index[itemgetter(*TASK_INDEX_KEY)(event_data)]
+        except KeyError:
             self._logger.warning("Task event without parent task")
             return
 
@@ -785,31 +923,54 @@ class Action(ActionBase):
         if no_longer_templated or changed_and_not_templated:
             event_data["__task"] = event_data["task"]
 
+        # Move the task from its previous result to the final one
+        self._count_task(play=play, task=task, increment=-1)
         task.update(event_data)
+        self._count_task(play=play, task=task, increment=1)
+        if self._artifact_journal is not None:
+            self._artifact_journal.add_task(task)
+
+    @staticmethod
+    def _count_task(play: dict[str, Any], task: dict[str, Any], increment: int) -> None:
+        """Adjust the play's result counters for a task.
+
+        Args:
+            play: The parent play of the task
+            task: The task
+            increment: The adjustment to make, 1 to count the task, -1 to uncount it
+        """
+        counter = f"__{task['__result'].lower()}"
+        play[counter] = play.get(counter, 0) + increment
+        if task["__changed"] is True:
+            play["__changed"] = play.get("__changed", 0) + increment
+
+    @staticmethod
+    def _recount_play_stats(play: dict[str, Any]) -> None:
+        """Rebuild the play's result counters from its tasks.
+
+        Used for plays loaded from an artifact, which may not include the counters.
+
+        Args:
+            play: The play
+        """
+        play.update(dict.fromkeys(PLAY_RESULT_COUNTERS, 0))
+        play["__changed"] = 0
+        for task in play["tasks"]:
+            Action._count_task(play=play, task=task, increment=1)
 
     def _play_stats(self) -> None:
-        """Calculate the play's stats based on it's tasks."""
-        for idx, play in enumerate(self._plays.value):
-            total = ["__ok", "__skipped", "__failed", "__unreachable", "__ignored", "__in progress"]
-            self._plays.value[idx].update(
-                {
-                    tot: len([t for t in play["tasks"] if t["__result"].lower() == tot[2:]])
-                    for tot in total
-                },
-            )
-            self._plays.value[idx]["__changed"] = len(
-                [t for t in play["tasks"] if t["__changed"] is True],
-            )
+        """Calculate the play's progress based on it's task counters."""
+        for play in self._plays.value:
             task_count = len(play["tasks"])
-            self._plays.value[idx]["__task_count"] = task_count
-            completed = task_count - self._plays.value[idx]["__in progress"]
+            play["__task_count"] = task_count
+            completed = task_count - play["__in progress"]
             if completed:
                 new = floor(completed / task_count * 100)
-                current = self._plays.value[idx].get("__percent_complete", 0)
-                self._plays.value[idx]["__percent_complete"] = max(new, current)
-                self._plays.value[idx]["__progress"] = str(max(new, current)) + "%"
+                current = play.get("__percent_complete", 0)
+                play["__percent_complete"] = max(new, current)
+                play["__progress"] = str(max(new, current)) + "%"
             else:
-                self._plays.value[idx]["__progress"] = "0%"
+                play["__progress"] = "0%"
 
     def _prepare_to_quit(self, interaction: Interaction) -> bool:
         """Pre-quit tasks.
@@ -827,6 +988,7 @@ class Action(ActionBase):
                 self.runner.cancelled = True
                 while not self.runner.finished:
                     pass
+                self._dequeue()
                 self.write_artifact()
                 return True
             self._logger.warning("Quit requested but playbook running, try q! or quit!")
@@ -857,6 +1019,8 @@ class Action(ActionBase):
             Content which shows a task
         """
         value = self.steps.current.value
+        if self._artifact_reader is not None:
+            value = TaskRecords(summaries=value, reader=self._artifact_reader)
         index = self.steps.current.index
         step = Step(name="task", step_type="content", index=index, value=value)
         return step
@@ -867,10 +1031,10 @@ class Action(ActionBase):
         self._calling_app.update()
 
         if hasattr(self, "runner"):
-            self._dequeue()
+            self._dequeue(time_budget=self._args.ansible_runner_event_time_budget / 1000)
             self._set_status()
 
-            if self.runner.finished and not self._runner_finished:
+            if self.runner.finished and not self._runner_finished and self._queue.empty():
                 self._logger.debug("runner finished")
                 self._logger.info("Playbook complete")
                 self.write_artifact()
@@ -901,8 +1065,12 @@ class Action(ActionBase):
         return status, status_color
 
     def _set_status(self) -> None:
-        """Set the UI status."""
+        """Set the UI status, adding the number of pending runner events if behind."""
         status, status_color = self._get_status()
+        backlog = self._queue.qsize()
+        if backlog:
+            count = f"{backlog // 1000}k" if backlog >= 1000 else str(backlog)
+            status = f"{status}, backlog {count}"
         self._interaction.ui.update_status(status, status_color)
 
     def write_artifact(self, filename: str | None = None) -> None:
@@ -929,22 +1097,25 @@ class Action(ActionBase):
 
             try:
                 Path(Path(filename).parent).mkdir(parents=True, exist_ok=True)
-                artifact = {
-                    "version": "2.0.0",
-                    "plays": self._plays.value,
-                    "stdout": self.stdout,
-                    "status": status,
-                    "status_color": status_color,
-                    "settings_entries": to_effective(self._args),
-                    "settings_sources": to_sources(self._args),
-                }
-                serialize_write_file(
-                    content=artifact,
-                    content_view=ContentView.NORMAL,
-                    file_mode="w",
-                    file=Path(filename),
-                    serialization_format=SerializationFormat.JSON,
-                )
+                if self._artifact_reader is not None:
+                    self._artifact_reader.copy(file=Path(filename))
+                else:
+                    journal = self._artifact_journal
+                    if journal is None:
+                        # Replaying an artifact written as a single document
+                        journal = PlaybookArtifactWriter()
+                        journal.add_stdout(self.stdout)
+                    journal.save(
+                        file=Path(filename),
+                        plays=self._plays.value,
+                        summary_keys=TASK_SUMMARY_KEYS,
+                        status=status,
+                        status_color=status_color,
+                        settings_entries=to_effective(self._args),
+                        settings_sources=to_sources(self._args),
+                    )
+                    if journal is not self._artifact_journal:
+                        journal.close()
                 self._logger.info("Saved artifact as %s", filename)
 
             except OSError as exc:
@@ -963,6 +1134,8 @@ class Action(ActionBase):
             if self.runner.finished:
                 self._plays.value = []
                 self._plays.index = None
+                self._play_index.clear()
+                self._task_index.clear()
                 self._msg_from_plays = (None, None)
                 self._queue.queue.clear()
                 self.stdout = []
@@ -4,6 +4,7 @@ from ansible_navigator.action_base import ActionBase
 from ansible_navigator.app_public import AppPublic
 from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
 from ansible_navigator.content_defs import ContentFormat
+from ansible_navigator.ui_framework import AnsiLines
 from ansible_navigator.ui_framework import Interaction
 
 from . import _actions as actions
@@ -37,6 +38,8 @@ class Action(ActionBase):
         self._logger.debug("stdout requested")
         self._prepare_to_run(app, interaction)
 
+        # Lines are converted for display once, as they arrive
+        lines = AnsiLines(app.stdout)
         auto_scroll = True
         while True:
             self._calling_app.update()
@@ -44,9 +47,8 @@ class Action(ActionBase):
             new_scroll = len(self._calling_app.stdout)
             if auto_scroll:
                 interaction.ui.scroll(new_scroll)
-            obj = "\n".join(app.stdout)
             next_interaction: Interaction = interaction.ui.show(
-                obj=obj,
+                obj=lines,  # type: ignore[arg-type]
                 content_format=ContentFormat.ANSI,
             )
             if next_interaction.name != "refresh":
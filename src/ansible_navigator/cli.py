@@ -4,13 +4,14 @@
 from __future__ import annotations
 
 import filecmp
+import json
 import logging
 import os
 import shutil
 import signal
+import sqlite3
 import sys
 
-from copy import deepcopy
 from curses import wrapper
 from importlib.metadata import version
 from importlib.util import find_spec
@@ -36,6 +37,7 @@ from .utils.definitions import ExitPrefix
 from .utils.definitions import LogMessage
 from .utils.functions import clear_screen
 from .utils.functions import generate_cache_path
+from .utils.key_value_store import KeyValueStore
 from .utils.packaged_data import path_to_file
 
 
@@ -74,15 +76,81 @@ def cache_scripts() -> None:
         logger.log(level=logging.DEBUG, msg=message)
 
 
-def log_dependencies() -> list[LogMessage]:
+DEPENDENCIES_CACHE_FILE = "dependencies.db"
+"""The name of the cache file for the installed packages, within the cache directory"""
+
+DEPENDENCIES_CACHE_TABLE = "dependencies"
+"""The name of the table in the cache file"""
+
+
+def dependencies_key() -> str:
+    """Identify the installed packages by the directories they are imported from.
+
+    Installing or removing a package changes the modification time of the directory
+    it is installed in, eg. site-packages.
+
+    Returns:
+        The interpreter and the path and modification time of each directory in sys.path
+    """
+    paths = []
+    for entry in sys.path:
+        try:
+            paths.append((entry, Path(entry or ".").stat().st_mtime_ns))
+        except OSError:
+            continue
+    return json.dumps([sys.executable, paths])
+
+
+def log_dependencies(cache_path: Path | None = None) -> list[LogMessage]:
     """Retrieve installed packages and log as debug.
 
+    Finding the packages imports the metadata of each installed distribution, so the
+    packages found are cached for as long as the directories in sys.path are unchanged.
+
+    Args:
+        cache_path: The application's cache directory, or None to always find the packages
+
     Returns:
         All packages, version and location
     """
+    if cache_path is None:
+        pkgs = _find_dependencies()
+    else:
+        key = dependencies_key()
+        try:
+            cache_path.mkdir(parents=True, exist_ok=True)
+            store = KeyValueStore(
+                cache_path / DEPENDENCIES_CACHE_FILE,
+                table=DEPENDENCIES_CACHE_TABLE,
+                write_ahead_log=True,
+            )
+        except (OSError, sqlite3.Error):
+            logger.debug("The installed packages cache could not be opened")
+            return log_dependencies()
+        try:
+            pkgs = json.loads(store[key])
+        except (KeyError, ValueError):
+            pkgs = _find_dependencies()
+            # Only the current packages are kept, not those of earlier installations
+            try:
+                with store.transaction():
+                    store.clear()
+                    store[key] = json.dumps(pkgs)
+            except sqlite3.Error:
+                logger.debug("The installed packages could not be cached")
+        finally:
+            store.close()
+    return [LogMessage(level=logging.DEBUG, message=pkg) for pkg in pkgs]
+
+
+def _find_dependencies() -> list[str]:
+    """Find the installed packages.
+
+    Returns:
+        The name, version and location of each package, sorted
+    """
     pkgs = []
     found = []
-    messages: list[LogMessage] = []
     for pkg_names in importlib_metadata.packages_distributions().values():
         for pkg_name in pkg_names:
             if pkg_name not in found:
@@ -90,16 +158,14 @@ def log_dependencies() -> list[LogMessage]:
                 try:
                     spec = find_spec(pkg_name)
                 except ModuleNotFoundError:
-                    message = f"Package '{pkg_name}' is missing"
-                    messages.append(LogMessage(level=logging.DEBUG, message=message))
+                    logger.debug("Package '%s' is missing", pkg_name)
                     continue
                 _location = spec.origin if spec else ""
                 _version = version(pkg_name)
                 pkgs.append(f"{pkg_name}=={_version} {_location}")
 
     pkgs.sort()
-    messages = [LogMessage(level=logging.DEBUG, message=pkg) for pkg in pkgs]
-    return messages
+    return pkgs
 
 
 def pull_image(args: Any) -> None:
@@ -155,10 +221,10 @@ def run(args: ApplicationConfiguration) -> ActionReturn:
 
 def main() -> None:
     """Start application here."""
-    messages: list[LogMessage] = log_dependencies()
+    messages: list[LogMessage] = []
     exit_messages: list[ExitMessage] = []
 
-    args = deepcopy(NavigatorConfiguration)
+    args = NavigatorConfiguration.copy()
     args.application_version = __version__
     args.internals.initializing = True
     messages.extend(args.internals.initialization_messages)
@@ -193,6 +259,10 @@ def main() -> None:
         exit_messages.append(ExitMessage(message=exit_msg))
         error_and_exit_early(exit_messages=exit_messages)
 
+    # Only find the installed packages if they will be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        messages[0:0] = log_dependencies(cache_path=args.internals.cache_path)
+
     for log_message in messages:
         logger.log(level=log_message.level, msg=log_message.message)
 
@@ -5,6 +5,8 @@ from __future__ import annotations
 import multiprocessing
 import subprocess
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from dataclasses import dataclass
 from dataclasses import field
 from typing import TYPE_CHECKING
@@ -13,6 +15,7 @@ from typing import Any
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Iterator
     from queue import Queue
 
     from ansible_navigator.utils.definitions import LogMessage
@@ -20,6 +23,9 @@ if TYPE_CHECKING:
 
 PROCESSES = (multiprocessing.cpu_count() - 1) or 1
 
+THREADS = min(32, multiprocessing.cpu_count() + 4)
+"""The maximum number of commands run at once by threads, the work is waiting on subprocesses"""
+
 
 @dataclass(frozen=False)
 class Command:
@@ -39,6 +45,7 @@ class Command:
     details: list[Any] | dict[Any, Any] | object = field(default_factory=list)
     errors: str = ""
     messages: list[LogMessage] = field(default_factory=list)
+    timeout: float | None = None
 
     @property
     def stderr_lines(self) -> list[str]:
@@ -72,6 +79,7 @@ def run_command(command: Command) -> None:
             check=True,
             text=True,
             shell=True,
+            timeout=command.timeout,
         )
         command.return_code = proc_out.returncode
         command.stdout = proc_out.stdout
@@ -79,6 +87,27 @@ def run_command(command: Command) -> None:
         command.return_code = exc.returncode
         command.stdout = str(exc.stdout)
         command.stderr = str(exc.stderr)
+    except subprocess.TimeoutExpired as exc:
+        command.return_code = -1
+        if isinstance(exc.output, bytes):
+            command.stdout = exc.output.decode(errors="replace")
+        else:
+            command.stdout = exc.output or ""
+        command.errors = f"Command timed out after {exc.timeout} seconds: {command.command}"
+
+
+def _run_and_post_process(command: Command) -> Command:
+    """Run and post process a command.
+
+    Args:
+        command: Command to be run
+
+    Returns:
+        The command
+    """
+    run_command(command)
+    command.post_process(command)
+    return command
 
 
 def worker(
@@ -125,6 +154,49 @@ class CommandRunner:
             results.append(command)
         return results
 
+    @staticmethod
+    def run_multi_thread(
+        commands: list[Command],
+        max_workers: int = THREADS,
+    ) -> list[Command]:
+        """Run commands with multiple threads.
+
+        Args:
+            commands: All commands to be run
+            max_workers: The maximum number of commands run at once
+
+        Returns:
+            The results from running all commands, in the order they were given
+        """
+        if not commands:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(commands), max_workers)) as executor:
+            return list(executor.map(_run_and_post_process, commands))
+
+    @staticmethod
+    def iter_multi_thread(
+        commands: list[Command],
+        max_workers: int = THREADS,
+    ) -> Iterator[Command]:
+        """Run commands with multiple threads, yielding each as it completes.
+
+        Running a command is mostly waiting on its subprocess, so threads are used rather
+        than processes. Each command is run and post processed by a thread of the pool.
+
+        Args:
+            commands: All commands to be run
+            max_workers: The maximum number of commands run at once
+
+        Yields:
+            Each command, once it has been run and post processed
+        """
+        if not commands:
+            return
+        with ThreadPoolExecutor(max_workers=min(len(commands), max_workers)) as executor:
+            futures = [executor.submit(_run_and_post_process, command) for command in commands]
+            for future in as_completed(futures):
+                yield future.result()
+
     def run_multi_process(self, commands: list[Command]) -> list[Command]:
         """Run commands with multiple processes.
 
@@ -4,16 +4,20 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 
 from copy import deepcopy
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
 
 from ansible_navigator.utils.definitions import ExitMessage
 from ansible_navigator.utils.definitions import ExitPrefix
 from ansible_navigator.utils.definitions import LogMessage
 from ansible_navigator.utils.functions import oxfordcomma
 from ansible_navigator.utils.functions import shlex_join
-from ansible_navigator.utils.json_schema import validate
+from ansible_navigator.utils.json_schema import compile_validator
+from ansible_navigator.utils.json_schema import validate_with
 from ansible_navigator.utils.serialize import SafeLoader
 from ansible_navigator.utils.serialize import yaml
 from ansible_navigator.utils.version_migration.definitions import MigrationType
@@ -24,9 +28,28 @@ from .definitions import Constants as C
 from .definitions import SettingsEntry
 from .parser import Parser
 from .transform import to_schema
+from .utils import ParseAnsibleCfgResponse
+from .utils import ansible_cfg_key
 from .utils import parse_ansible_cfg
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
+
+    from jsonschema.protocols import Validator
+
+
+_validated_settings_files: dict[tuple[str, int, int, int], dict[str, Any]] = {}
+"""The contents of settings files which were loaded and validated, keyed by file version"""
+
+_parsed_ansible_cfgs: dict[Hashable, ParseAnsibleCfgResponse] = {}
+"""The ansible.cfg files found and parsed, keyed by what determines which file is used"""
+
+_settings_validators: dict[Hashable, Validator] = {}
+"""The validators for the settings file schema, keyed by application version and entries"""
+
+
 class Configurator:
     """The configuration class."""
 
@@ -55,7 +78,7 @@ class Configurator:
         self._params = params if params is not None else []
         self._sanity_check()
         self._skip_rollback = skip_roll_back
-        self._unaltered_entries = deepcopy(self._config.entries)
+        self._unaltered_entries = [entry.copy() for entry in self._config.entries]
 
     def _sanity_check(self) -> None:
         """Sanity check the configuration.
@@ -106,33 +129,45 @@ class Configurator:
         warning = ExitMessage(message=warn_message, prefix=ExitPrefix.WARNING)
         command = ExitMessage(message=cmd_message, prefix=ExitPrefix.HINT)
 
-        self._restore_original()
-        self._apply_defaults()
-        self._apply_settings_file()
-        self._apply_environment_variables()
-        self._apply_cli_params()
+        self._timed(self._restore_original)
+        self._timed(self._apply_defaults)
+        self._timed(self._apply_settings_file)
+        self._timed(self._apply_environment_variables)
+        self._timed(self._apply_cli_params)
         if self._exit_messages:
             self._exit_messages[0:0] = [warning, command]
             self._roll_back()
             return self._messages, self._exit_messages
 
-        self._apply_previous_cli_to_current()
+        self._timed(self._apply_previous_cli_to_current)
 
-        self._retrieve_ansible_cfg()
-        self._post_process()
-        self._check_choices()
+        self._timed(self._retrieve_ansible_cfg)
+        self._timed(self._post_process)
+        self._timed(self._check_choices)
         if self._exit_messages:
             self._exit_messages[0:0] = [warning, command]
             self._roll_back()
             return self._messages, self._exit_messages
 
         if self._config.internals.initializing:
-            self._config.initial = deepcopy(self._config)
+            self._config.initial = self._config.copy()
             # Our work is done, set the initialization flag to false
             self._config.internals.initializing = False
 
         return self._messages, self._exit_messages
 
+    def _timed(self, stage: Callable[[], None]) -> None:
+        """Run a stage of the configuration and log its duration.
+
+        Args:
+            stage: The stage to run
+        """
+        start = time.perf_counter()
+        stage()
+        duration = time.perf_counter() - start
+        message = f"Configuration stage '{stage.__name__.lstrip('_')}' took {duration:.4f}s"
+        self._messages.append(LogMessage(level=logging.DEBUG, message=message))
+
     def _argparse_error_handler(self, message: str) -> None:
         """Call back for argparser error handling.
 
@@ -163,8 +198,74 @@ class Configurator:
                 self._messages.append(LogMessage(level=logging.INFO, message=message))
 
     def _apply_settings_file(self) -> None:
-        # pylint: disable=too-many-locals
-        """Apply the settings file.
+        """Apply the settings file."""
+        settings_filesystem_path = self._config.internals.settings_file_path
+
+        if not isinstance(settings_filesystem_path, str):
+            return
+
+        config = self._load_settings_file(settings_filesystem_path)
+        if config is None:
+            return
+
+        for entry in self._config.entries:
+            settings_file_path = entry.settings_file_path(self._config.application_name)
+            path_parts = settings_file_path.split(".")
+            data = config
+            try:
+                for key in path_parts:
+                    data = data[key]
+                if self._config.internals.initializing or entry.change_after_initial:
+                    entry.value.current = data
+                    entry.value.source = C.USER_CFG
+                else:
+                    message = f"'{entry.name}' cannot be reconfigured. (settings file)"
+                    self._messages.append(LogMessage(level=logging.INFO, message=message))
+            except TypeError as exc:
+                exit_msg = (
+                    "Errors encountered when loading settings file:"
+                    f" {settings_filesystem_path}"
+                    f" while loading entry {entry.name}, attempted: {settings_file_path}."
+                    f"The resulting error was {exc!s}"
+                )
+                self._exit_messages.append(ExitMessage(message=exit_msg))
+                exit_msg = (
+                    f"Try checking the settings file '{settings_filesystem_path}'"
+                    "and ensure it is properly formatted"
+                )
+                self._exit_messages.append(
+                    ExitMessage(message=exit_msg, prefix=ExitPrefix.HINT),
+                )
+                return
+            except KeyError:
+                message = f"{settings_file_path} not found in settings file"
+                self._messages.append(LogMessage(level=logging.DEBUG, message=message))
+
+    @staticmethod
+    def _settings_file_key(settings_filesystem_path: str) -> tuple[str, int, int, int]:
+        """Identify a version of the settings file by its path, inode, modification time and size.
+
+        Args:
+            settings_filesystem_path: The path to the settings file
+
+        Returns:
+            The key for the settings file
+        """
+        stat = Path(settings_filesystem_path).stat()
+        return (settings_filesystem_path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load_settings_file(self, settings_filesystem_path: str) -> dict[str, Any] | None:
+        """Migrate, load and validate the settings file.
+
+        The contents of a settings file which loaded and validated are kept, they are
+        reused for as long as the file is unchanged, eg. each time a subcommand is run from
+        the text-based user interface.
+
+        Args:
+            settings_filesystem_path: The path to the settings file
+
+        Returns:
+            The contents of the settings file, or None if it is empty or could not be loaded
 
         Raises:
             ValueError: If the settings file is empty
@@ -178,10 +279,11 @@ class Configurator:
             """
             raise ValueError(message)
 
-        settings_filesystem_path = self._config.internals.settings_file_path
-
-        if not isinstance(settings_filesystem_path, str):
-            return
+        key = self._settings_file_key(settings_filesystem_path)
+        if key in _validated_settings_files:
+            message = f"Settings file unchanged, reusing its contents: {settings_filesystem_path}"
+            self._messages.append(LogMessage(level=logging.DEBUG, message=message))
+            return deepcopy(_validated_settings_files[key])
 
         run_all_migrations(
             settings_file_str=settings_filesystem_path,
@@ -195,7 +297,7 @@ class Configurator:
                     # In the case of ansible-navigator settings --sample > ansible-navigator.yml
                     # the file will be empty, but we shouldn't exit.
                     if self._params in (["settings", "--sample"], ["settings", "--gs"]):
-                        return
+                        return None
                     raise_value_error("Settings file cannot be empty.")
             except (yaml.scanner.ScannerError, yaml.parser.ParserError, ValueError) as exc:
                 exit_msg = f"Settings file found {settings_filesystem_path}, but failed to load it."
@@ -209,10 +311,9 @@ class Configurator:
                 self._exit_messages.append(
                     ExitMessage(message=exit_msg, prefix=ExitPrefix.HINT),
                 )
-                return
+                return None
 
-        schema = to_schema(settings=self._config)
-        errors = validate(schema=schema, data=config)
+        errors = validate_with(validator=self._settings_validator(), data=config)
 
         if errors:
             msg = (
@@ -238,40 +339,32 @@ class Configurator:
                 "A sample settings file can be created with 'ansible-navigator settings --sample'"
             )
             self._exit_messages.append(ExitMessage(message=hint, prefix=ExitPrefix.HINT))
-            return
+            return None
 
-        for entry in self._config.entries:
-            settings_file_path = entry.settings_file_path(self._config.application_name)
-            path_parts = settings_file_path.split(".")
-            data = config
-            try:
-                for key in path_parts:
-                    data = data[key]
-                if self._config.internals.initializing or entry.change_after_initial:
-                    entry.value.current = data
-                    entry.value.source = C.USER_CFG
-                else:
-                    message = f"'{entry.name}' cannot be reconfigured. (settings file)"
-                    self._messages.append(LogMessage(level=logging.INFO, message=message))
-            except TypeError as exc:
-                exit_msg = (
-                    "Errors encountered when loading settings file:"
-                    f" {settings_filesystem_path}"
-                    f" while loading entry {entry.name}, attempted: {settings_file_path}."
-                    f"The resulting error was {exc!s}"
-                )
-                self._exit_messages.append(ExitMessage(message=exit_msg))
-                exit_msg = (
-                    f"Try checking the settings file '{settings_filesystem_path}'"
-                    "and ensure it is properly formatted"
-                )
-                self._exit_messages.append(
-                    ExitMessage(message=exit_msg, prefix=ExitPrefix.HINT),
-                )
-                return
-            except KeyError:
-                message = f"{settings_file_path} not found in settings file"
-                self._messages.append(LogMessage(level=logging.DEBUG, message=message))
+        key = self._settings_file_key(settings_filesystem_path)
+        _validated_settings_files[key] = deepcopy(config)
+        return config
+
+    def _settings_validator(self) -> Validator:
+        """Get the validator for the settings file.
+
+        The schema is built from the settings entries, which are defined by the version of
+        the application, so it is built and compiled once. It is the application's own
+        schema, so it is not checked against the JSON schema meta-schema here.
+
+        Returns:
+            The validator for the settings file schema
+        """
+        key = (
+            self._config.application_name,
+            str(self._config.application_version),
+            tuple(entry.name for entry in self._config.entries),
+        )
+        validator = _settings_validators.get(key)
+        if validator is None:
+            validator = compile_validator(to_schema(settings=self._config))
+            _settings_validators[key] = validator
+        return validator
 
     def _apply_environment_variables(self) -> None:
         """Apply the environment variables."""
@@ -447,10 +540,24 @@ class Configurator:
         EE support is needed early on here so the post processors
         can have access to the ansible.cfg file contents as a fallback to
         navigators settings sources. The value won't be set but it is needed to
-        determine where the ansible.cfg file should be pulled from
+        determine where the ansible.cfg file should be pulled from.
+
+        The parsed file is reused for as long as the files ansible would consider, and the
+        environment variables which determine the one used, are unchanged.
         """
         ee_enabled = str(self._config.execution_environment).lower() == "true"
-        parsed_ansible_cfg = parse_ansible_cfg(ee_enabled=ee_enabled)
+        key = ansible_cfg_key(ee_enabled=ee_enabled)
+        parsed_ansible_cfg = _parsed_ansible_cfgs.get(key)
+        if parsed_ansible_cfg is None:
+            parsed_ansible_cfg = parse_ansible_cfg(
+                ee_enabled=ee_enabled,
+                cache_path=self._config.internals.cache_path,
+            )
+            if not parsed_ansible_cfg.exit_messages:
+                _parsed_ansible_cfgs[key] = parsed_ansible_cfg
+        else:
+            message = "Candidate ansible.cfg files unchanged, reusing the parsed ansible.cfg"
+            self._messages.append(LogMessage(level=logging.DEBUG, message=message))
         self._messages.extend(parsed_ansible_cfg.messages)
         self._exit_messages.extend(parsed_ansible_cfg.exit_messages)
         self._config.internals.ansible_configuration = parsed_ansible_cfg.config
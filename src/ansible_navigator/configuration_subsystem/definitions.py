@@ -140,6 +140,37 @@ class SettingsEntryValue:
 
         return new_entry
 
+    def copy(self) -> SettingsEntryValue:
+        """Copy the value, sharing the objects it holds with the copy.
+
+        Values are replaced rather than changed, so they can be shared. Lists and
+        dictionaries are the exception, a post processor may extend one in place, so they
+        are copied, but not their contents.
+
+        Returns:
+            A copy of the value
+        """
+        return SettingsEntryValue(
+            default=_copy_container(self.default),
+            current=_copy_container(self.current),
+            schema_default=self.schema_default,
+            source=self.source,
+        )
+
+
+def _copy_container(value: Any) -> Any:
+    """Copy a list or dictionary, other objects are returned as is.
+
+    Args:
+        value: The value to copy
+
+    Returns:
+        The copy of a list or dictionary, otherwise the value
+    """
+    if isinstance(value, list | dict):
+        return value.copy()
+    return value
+
 
 @dataclass
 class SettingsEntry:
@@ -179,6 +210,18 @@ class SettingsEntry:
         """Perform post initialization actions."""
         version_added_sanity_check(self.version_added)
 
+    def copy(self) -> SettingsEntry:
+        """Copy the entry, sharing its definition with the copy.
+
+        Only the value of an entry changes once defined, the copy has a copy of the value.
+
+        Returns:
+            A copy of the entry
+        """
+        new_entry = copy.copy(self)
+        new_entry.value = self.value.copy()
+        return new_entry
+
     def environment_variable(self, prefix: str = "") -> str:
         """Generate an effective environment variable for this entry.
 
@@ -291,6 +334,25 @@ class ApplicationConfiguration:
         """
         return self.application_name.replace("_", "-")
 
+    def copy(self) -> ApplicationConfiguration:
+        """Copy the configuration, sharing with the copy what configuring it does not change.
+
+        This is used in place of a deep copy, eg. each time an action is started. The
+        entries' values, the internals and the post processor, which collects requests while
+        post processing, are copied so the copy can be configured independently. The
+        entries' definitions, the subcommands, the parsed ansible.cfg and the initial
+        configuration are shared.
+
+        Returns:
+            A copy of the configuration
+        """
+        new_config = copy.copy(self)
+        new_config.entries = [entry.copy() for entry in self.entries]
+        new_config.internals = copy.copy(self.internals)
+        new_config.post_processor = copy.deepcopy(self.post_processor)
+        new_config.original_command = self.original_command.copy()
+        return new_config
+
     def _get_by_name(self, name: str, kind: str) -> SettingsEntry:
         """Retrieve a settings entry by name.
 
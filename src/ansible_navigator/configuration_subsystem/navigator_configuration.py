@@ -231,6 +231,17 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="ansible_runner_event_time_budget",
+            cli_parameters=CliParameters(short="--retb"),
+            settings_file_path_override="ansible-runner.event-time-budget",
+            short_description=(
+                "The milliseconds spent handling ansible-runner events before the interactive"
+                " display is refreshed"
+            ),
+            value=SettingsEntryValue(default=50),
+            version_added="v25.1",
+        ),
         SettingsEntry(
             name="ansible_runner_rotate_artifacts_count",
             cli_parameters=CliParameters(short="--rac"),
@@ -396,6 +407,19 @@ NavigatorConfiguration = ApplicationConfiguration(
             ),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="execution_environment_persistent",
+            choices=[True, False],
+            cli_parameters=CliParameters(short="--eep"),
+            settings_file_path_override="execution-environment.persistent",
+            short_description=(
+                "Keep a helper process running in the execution environment for the session,"
+                " used to catalog collections, introspect the image and show documentation"
+                " and configuration"
+            ),
+            value=SettingsEntryValue(default=False),
+            version_added="v25.1",
+        ),
         SettingsEntry(
             name="execution_environment_volume_mounts",
             cli_parameters=CliParameters(action="append", nargs="+", short="--eev"),
@@ -494,6 +518,22 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(default=["everything"]),
             version_added="v2.0",
         ),
+        SettingsEntry(
+            name="images_refresh",
+            choices=[True, False],
+            cli_parameters=CliParameters(
+                action="store_true",
+                short="-r",
+                long_override="--refresh",
+            ),
+            settings_file_path_override="images.refresh",
+            short_description=(
+                "Introspect images again rather than using the details cached for the image ID"
+            ),
+            subcommands=["images"],
+            value=SettingsEntryValue(default=False),
+            version_added="v25.1",
+        ),
         SettingsEntry(
             name="inventory",
             cli_parameters=CliParameters(action="append", nargs="*", short="-i"),
@@ -545,6 +585,28 @@ NavigatorConfiguration = ApplicationConfiguration(
             value=SettingsEntryValue(default=True),
             version_added="v1.0",
         ),
+        SettingsEntry(
+            name="log_diagnostics_bytes",
+            cli_parameters=CliParameters(short="--ldb"),
+            short_description=(
+                "The maximum number of bytes collected from the end of each log file"
+                " for the diagnostics report"
+            ),
+            settings_file_path_override="logging.diagnostics-bytes",
+            value=SettingsEntryValue(default=10 * 1024 * 1024),
+            version_added="v25.1",
+        ),
+        SettingsEntry(
+            name="log_diagnostics_lines",
+            cli_parameters=CliParameters(short="--ldl"),
+            short_description=(
+                "The maximum number of lines collected from the end of each log file"
+                " for the diagnostics report"
+            ),
+            settings_file_path_override="logging.diagnostics-lines",
+            value=SettingsEntryValue(default=10000),
+            version_added="v25.1",
+        ),
         SettingsEntry(
             name="log_file",
             cli_parameters=CliParameters(short="--lf"),
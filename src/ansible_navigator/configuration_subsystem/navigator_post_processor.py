@@ -118,6 +118,34 @@ class NavigatorPostProcessor:
 
         return messages, exit_messages
 
+    @staticmethod
+    def _positive_integer(
+        entry: SettingsEntry,
+        config: ApplicationConfiguration,
+    ) -> PostProcessorReturn:
+        """Post process a positive integer value.
+
+        Args:
+            entry: The current settings entry
+            config: The full application configuration
+
+        Returns:
+            An instance of the standard post process return object
+        """
+        messages: list[LogMessage] = []
+        exit_messages: list[ExitMessage] = []
+        if entry.value.current is not C.NOT_SET:
+            try:
+                entry.value.current = int(entry.value.current)
+            except ValueError as exc:
+                exit_msg = f"Value should be valid integer. Failed with error {exc!s}"
+                exit_messages.append(ExitMessage(message=exit_msg))
+                return messages, exit_messages
+            if entry.value.current < 1:
+                exit_msg = f"Value should be a positive integer, found '{entry.value.current}'"
+                exit_messages.append(ExitMessage(message=exit_msg))
+        return messages, exit_messages
+
     @staticmethod
     @_post_processor
     def ansible_runner_artifact_dir(
@@ -139,6 +167,9 @@ class NavigatorPostProcessor:
             entry.value.current = str(expand_path(entry.value.current))
         return messages, exit_messages
 
+    # Post process ansible_runner_event_time_budget
+    ansible_runner_event_time_budget = _positive_integer
+
     @staticmethod
     @_post_processor
     def ansible_runner_rotate_artifacts_count(
@@ -393,6 +424,9 @@ class NavigatorPostProcessor:
             entry.value.current = f"{entry.value.current}:latest"
         return messages, exit_messages
 
+    # Post process execution_environment_persistent
+    execution_environment_persistent = _true_or_false
+
     @_post_processor
     def execution_environment_volume_mounts(
         self,
@@ -493,7 +527,11 @@ class NavigatorPostProcessor:
         if self.extra_volume_mounts:
             if not isinstance(entry.value.current, list):
                 entry.value.current = []
-            entry.value.current.extend(v.to_string() for v in self.extra_volume_mounts)
+            # A new list, the current one may be shared with a previous configuration
+            entry.value.current = [
+                *entry.value.current,
+                *(v.to_string() for v in self.extra_volume_mounts),
+            ]
 
         # Finally, ensure the list has no duplicates
         if isinstance(entry.value.current, list):
@@ -628,6 +666,9 @@ class NavigatorPostProcessor:
             messages.append(LogMessage(level=logging.DEBUG, message=message))
         return messages, exit_messages
 
+    # Post process images_refresh
+    images_refresh = _true_or_false
+
     @_post_processor
     def _normalize_path(
         self,
@@ -834,6 +875,12 @@ class NavigatorPostProcessor:
     # Post process log_append.
     log_append = _true_or_false
 
+    # Post process log_diagnostics_bytes
+    log_diagnostics_bytes = _positive_integer
+
+    # Post process log_diagnostics_lines
+    log_diagnostics_lines = _positive_integer
+
     @staticmethod
     @_post_processor
     def log_file(entry: SettingsEntry, config: ApplicationConfiguration) -> PostProcessorReturn:
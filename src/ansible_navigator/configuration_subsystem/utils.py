@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import shutil
+import sqlite3
 
 from collections.abc import Iterable
 from configparser import ConfigParser
@@ -16,6 +20,7 @@ from ansible_navigator.command_runner import Command
 from ansible_navigator.command_runner import CommandRunner
 from ansible_navigator.utils.definitions import ExitMessage
 from ansible_navigator.utils.definitions import LogMessage
+from ansible_navigator.utils.key_value_store import KeyValueStore
 
 from .definitions import Constants
 from .definitions import SettingsFileType
@@ -98,7 +103,151 @@ class ParseAnsibleCfgResponse:
     """An ansible configuration"""
 
 
-def parse_ansible_cfg(ee_enabled: bool) -> ParseAnsibleCfgResponse:
+ANSIBLE_CFG_PATHS = ("ansible.cfg", "~/.ansible.cfg", "/etc/ansible/ansible.cfg")
+"""The paths ansible searches for a configuration file, after ANSIBLE_CONFIG"""
+
+ANSIBLE_VERSION_CACHE_FILE = "ansible_version.db"
+"""The name of the cache file for ``ansible --version``, within the application's cache directory"""
+
+ANSIBLE_VERSION_CACHE_TABLE = "ansible_version"
+"""The name of the table in the cache file"""
+
+
+def _ansible_cfg_files() -> tuple[tuple[str, tuple[int, int, int] | None], ...]:
+    """Fingerprint each file ansible would consider as its configuration file.
+
+    Returns:
+        The path and the inode, modification time and size of each file, or None if missing
+    """
+    candidates = [os.environ.get("ANSIBLE_CONFIG", ""), *ANSIBLE_CFG_PATHS]
+    files: list[tuple[str, tuple[int, int, int] | None]] = []
+    for candidate in candidates:
+        if not candidate:
+            continue
+        path = Path.cwd() / Path(candidate).expanduser()
+        try:
+            stat = path.stat()
+        except OSError:
+            files.append((str(path), None))
+            continue
+        files.append((str(path), (stat.st_ino, stat.st_mtime_ns, stat.st_size)))
+    return tuple(files)
+
+
+def ansible_cfg_key(ee_enabled: bool) -> tuple[Any, ...]:
+    """Identify what determines which ansible.cfg file is found and its contents.
+
+    This is the environment variables which locate the file and ansible, and the path,
+    modification time and size of each file ansible would consider.
+
+    Args:
+        ee_enabled: Indicates if EE support is enabled
+
+    Returns:
+        The key for the ansible.cfg file
+    """
+    return (
+        ee_enabled,
+        os.environ.get("ANSIBLE_CONFIG"),
+        os.environ.get("PATH"),
+        os.environ.get("VIRTUAL_ENV"),
+        _ansible_cfg_files(),
+    )
+
+
+def ansible_version_key(ansible_cmd: str) -> tuple[str, str] | None:
+    """Identify what determines the output of ``ansible --version``.
+
+    This is the resolved ansible executable and its modification time, the ANSIBLE_CONFIG
+    environment variable, the current working directory and the files ansible would
+    consider as its configuration file.
+
+    Args:
+        ansible_cmd: The ansible command
+
+    Returns:
+        The resolved ansible executable and a fingerprint of the rest, or None if the
+        ansible executable cannot be found
+    """
+    executable = shutil.which(ansible_cmd)
+    if executable is None:
+        return None
+    path = Path(executable).resolve()
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    fingerprint = json.dumps(
+        [mtime, os.environ.get("ANSIBLE_CONFIG"), str(Path.cwd()), _ansible_cfg_files()],
+    )
+    return str(path), fingerprint
+
+
+def _read_ansible_version_cache(cache_path: Path, key: tuple[str, str]) -> dict[str, Any] | None:
+    """Read the cached details of ``ansible --version``.
+
+    Args:
+        cache_path: The application's cache directory
+        key: The ansible executable and the fingerprint of what determines the output
+
+    Returns:
+        The details, or None if they are not cached
+    """
+    cache_file = cache_path / ANSIBLE_VERSION_CACHE_FILE
+    if not cache_file.exists():
+        return None
+    try:
+        store = KeyValueStore(cache_file, table=ANSIBLE_VERSION_CACHE_TABLE, write_ahead_log=True)
+    except sqlite3.Error:
+        return None
+    executable, fingerprint = key
+    try:
+        entry = json.loads(store[executable])
+    except (KeyError, ValueError, sqlite3.Error):
+        return None
+    finally:
+        store.close()
+    if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+        return None
+    return entry.get("details")
+
+
+def _write_ansible_version_cache(
+    cache_path: Path,
+    key: tuple[str, str],
+    details: dict[str, Any],
+) -> None:
+    """Cache the details of ``ansible --version``.
+
+    Only the latest details are kept for each ansible executable, replacing those for
+    another working directory or configuration file. A failure to write the cache is not an
+    error, the command is run again next time.
+
+    Args:
+        cache_path: The application's cache directory
+        key: The ansible executable and the fingerprint of what determines the output
+        details: The details parsed from the output
+    """
+    try:
+        cache_path.mkdir(parents=True, exist_ok=True)
+        store = KeyValueStore(
+            cache_path / ANSIBLE_VERSION_CACHE_FILE,
+            table=ANSIBLE_VERSION_CACHE_TABLE,
+            write_ahead_log=True,
+        )
+    except (OSError, sqlite3.Error):
+        return
+    executable, fingerprint = key
+    try:
+        with store.transaction():
+            store[executable] = json.dumps({"fingerprint": fingerprint, "details": details})
+    except sqlite3.Error:
+        pass
+    finally:
+        store.close()
+
+
+def parse_ansible_cfg(ee_enabled: bool, cache_path: Path | None = None) -> ParseAnsibleCfgResponse:
     """Find the ansible.cfg file and parse it.
 
     If running without an EE, use ansible to get it.
@@ -107,6 +256,7 @@ def parse_ansible_cfg(ee_enabled: bool) -> ParseAnsibleCfgResponse:
 
     Args:
         ee_enabled: Indicates if EE support is enabled
+        cache_path: The application's cache directory, to cache ``ansible --version``
 
     Returns:
         The ansible.cfg contents
@@ -134,7 +284,9 @@ def parse_ansible_cfg(ee_enabled: bool) -> ParseAnsibleCfgResponse:
     else:
         msg = "EE support disabled: using 'ansible --version' for 'ansible.cfg'"
         response.messages.append(LogMessage(level=logging.DEBUG, message=msg))
-        new_messages, new_exit_messages, version_details = parse_ansible_verison()
+        new_messages, new_exit_messages, version_details = parse_ansible_verison(
+            cache_path=cache_path
+        )
         response.messages.extend(new_messages)
         response.exit_messages.extend(new_exit_messages)
         if response.exit_messages or version_details is None:
@@ -172,11 +324,17 @@ def parse_ansible_cfg(ee_enabled: bool) -> ParseAnsibleCfgResponse:
 
 def parse_ansible_verison(
     path: Path | None = None,
+    cache_path: Path | None = None,
 ) -> tuple[list[LogMessage], list[ExitMessage], dict[str, Any] | None]:
     """Parse the output of the ansible --version command.
 
+    If a cache directory is provided, the details are reused from an earlier run for as
+    long as the ansible executable, the current working directory and the candidate
+    configuration files are unchanged.
+
     Args:
         path: The path to the ansible executable
+        cache_path: The application's cache directory, or None to always run the command
 
     Returns:
         Log messages, exit messages, and the stdout as a dictionary
@@ -189,6 +347,14 @@ def parse_ansible_verison(
 
     ansible_cmd = "ansible" if path is None else str(path / "ansible")
 
+    key = None if cache_path is None else ansible_version_key(ansible_cmd)
+    if cache_path is not None and key is not None:
+        details = _read_ansible_version_cache(cache_path, key)
+        if details is not None:
+            msg = f"ansible --version details reused from cache: '{details}'"
+            messages.append(LogMessage(level=logging.DEBUG, message=msg))
+            return messages, exit_messages, details
+
     command = Command(
         identity="ansible_version",
         command=f"{ansible_cmd} --version",
@@ -206,8 +372,7 @@ def parse_ansible_verison(
     messages.append(LogMessage(level=logging.DEBUG, message=msg))
     if not isinstance(command.details, Iterable):
         raise TypeError
-    return (
-        messages,
-        exit_messages,
-        command.details[0] if isinstance(command.details, list) else None,
-    )
+    details = command.details[0] if isinstance(command.details, list) else None
+    if cache_path is not None and key is not None and details is not None:
+        _write_ansible_version_cache(cache_path, key, details)
+    return messages, exit_messages, details
@@ -30,10 +30,6 @@ from ansible.utils.plugin_docs import get_docstring
 from yaml.error import YAMLError
 
 
-if TYPE_CHECKING:
-    from collections.abc import Generator
-
-
 try:
     from yaml import CSafeLoader as SafeLoader
 except ImportError:
@@ -53,27 +49,121 @@ except ImportError:
 
 PROCESSES = (multiprocessing.cpu_count() - 1) or 1
 
+BATCH_SIZE = 32
+"""The number of plugins sent to a worker process at a time"""
+
+PROGRESS_INTERVAL = 10
+"""The percentage of plugins retrieved between progress messages"""
+
+CATALOG_INDEX_TABLE = "catalog_index"
+CATALOG_INDEX_VERSION = 1
+
+PLUGIN_SUMMARY_TABLE = "plugin_summary"
+
+ROLE_FILES = ("meta/argument_specs.yml", "defaults/main.yml", "meta/main.yml", "README.md")
+
+
+def fingerprint(path: Path) -> list[int] | None:
+    """Fingerprint a file using its size, modification time and inode.
+
+    Args:
+        path: The path to the file
+
+    Returns:
+        The fingerprint, or None if the file does not exist
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
 
 class CollectionCatalog:
-    """A collection cataloger."""
+    """A collection cataloger.
+
+    When an index is provided, the catalog of each collection is stored in it along with
+    the fingerprint of each file read to catalog the collection. A collection with no
+    changed files is reused from the index, otherwise only plugins and roles with changed
+    files are checksummed or loaded again.
+    """
 
-    def __init__(self, directories: list[Path]) -> None:
+    def __init__(self, directories: list[Path], index: KeyValueStore | None = None) -> None:
         """Initialize the collection cataloger.
 
         Args:
             directories: A list of directories that may contain
                 collections
+            index: The catalog index, keyed by collection path
         """
         self._directories: list[Path] = directories
         self._collections: OrderedDict[str, dict[Any, Any]] = OrderedDict()
         self._errors: list[dict[str, str]] = []
+        self._index = index
         self._messages: list[str] = []
+        self.stats: Counter[str] = Counter()
 
-    def _catalog_plugins(self, collection: dict[Any, Any]) -> None:
+    def _catalog(
+        self,
+        collection: dict[Any, Any],
+        plugin_files: list[tuple[str, Path]],
+        fingerprints: dict[str, list[int] | None],
+        previous: dict[str, Any],
+        errors_start: int,
+    ) -> None:
+        # pylint: disable=too-many-arguments
+        """Catalog the plugins and roles within a collection and store it in the index.
+
+        Args:
+            collection: Details describing the collection
+            plugin_files: The plugin type and path of each plugin file
+            fingerprints: The fingerprint of each file read to catalog the collection
+            previous: The collection's previous entry in the index
+            errors_start: The index of the first error encountered for the collection
+        """
+        previous_fingerprints = previous.get("fingerprints", {})
+        unchanged = {
+            path
+            for path, current in fingerprints.items()
+            if current is not None and previous_fingerprints.get(path) == current
+        }
+        plugins = self._catalog_plugins(
+            collection,
+            plugin_files,
+            {
+                path: checksum
+                for path, checksum in previous.get("plugins", {}).items()
+                if path in unchanged
+            },
+        )
+        roles = self._catalog_roles(collection, fingerprints, previous.get("roles", {}))
+
+        if self._index is not None:
+            entry = {
+                "version": CATALOG_INDEX_VERSION,
+                "fingerprints": fingerprints,
+                "collection": collection,
+                "errors": self._errors[errors_start:],
+                "plugins": plugins,
+                "roles": roles,
+            }
+            self._index[collection["path"]] = json.dumps(entry, default=str)
+
+    def _catalog_plugins(
+        self,
+        collection: dict[Any, Any],
+        plugin_files: list[tuple[str, Path]],
+        known_checksums: dict[str, str],
+    ) -> dict[str, str]:
         """Catalog the plugins within a collection.
 
         Args:
             collection: Details describing the collection
+            plugin_files: The plugin type and path of each plugin file
+            known_checksums: The checksums of unchanged plugin files, keyed by relative path
+
+        Returns:
+            The checksum of each plugin file, keyed by relative path
         """
         file_checksums = {}
 
@@ -88,127 +178,252 @@ class CollectionCatalog:
                     except (JSONDecodeError, KeyError) as exc:
                         self._errors.append({"path": str(file_path), "error": str(exc)})
 
+        plugins = {}
+        for plugin_type, filename in plugin_files:
+            relative_path = str(filename.relative_to(collection["path"]))
+            checksum = known_checksums.get(relative_path)
+            if checksum is None:
+                checksum_dict = file_checksums.get(relative_path)
+                if not checksum_dict:
+                    checksum_dict = self._generate_checksum(filename, Path(relative_path))
+                    self.stats["files_hashed"] += 1
+                checksum = checksum_dict[f"chksum_{checksum_dict['chksum_type']}"]
+            collection["plugin_checksums"][checksum] = {
+                "path": relative_path,
+                "type": plugin_type,
+            }
+            plugins[relative_path] = checksum
+        return plugins
+
+    @staticmethod
+    def _plugin_files(collection_path: Path, builtin: bool) -> list[tuple[str, Path]]:
+        """Find the plugin files within a collection.
+
+        Args:
+            collection_path: The path to the collection
+            builtin: Whether the collection is the pseudo builtin collection
+
+        Returns:
+            The plugin type and path of each plugin file
+        """
         exempt = ["action", "module_utils", "doc_fragments"]
-        plugin_directory = Path(collection["path"], "plugins")
-        if plugin_directory.is_dir():
-            plugin_dirs = [
-                plugin_dir
-                for plugin_dir in plugin_directory.iterdir()
-                if plugin_dir.is_dir() and plugin_dir.name not in exempt
-            ]
-            # builtin modules are found in a sibling of the plugin directory
-            if collection["known_as"] == "ansible.builtin":
-                plugin_dirs.append(Path(collection["path"], "modules"))
-
-            for plugin_dir in plugin_dirs:
-                plugin_type = plugin_dir.name
-                if plugin_type == "modules":
-                    plugin_type = "module"
-                files = list(plugin_dir.glob("**/*.py")) + list(plugin_dir.glob("**/*.yml"))
-                filenames = (x for x in files)
-                self._process_plugin_dir(
-                    plugin_type,
-                    filenames,
-                    file_checksums,
-                    collection,
-                )
+        plugin_directory = collection_path / "plugins"
+        if not plugin_directory.is_dir():
+            return []
+        plugin_dirs = [
+            plugin_dir
+            for plugin_dir in plugin_directory.iterdir()
+            if plugin_dir.is_dir() and plugin_dir.name not in exempt
+        ]
+        # builtin modules are found in a sibling of the plugin directory
+        if builtin:
+            plugin_dirs.append(collection_path / "modules")
+
+        plugin_files = []
+        for plugin_dir in plugin_dirs:
+            plugin_type = plugin_dir.name
+            if plugin_type == "modules":
+                plugin_type = "module"
+            files = list(plugin_dir.glob("**/*.py")) + list(plugin_dir.glob("**/*.yml"))
+            plugin_files.extend(
+                (plugin_type, filename) for filename in files if not filename.name.startswith("__")
+            )
+        return plugin_files
+
+    @staticmethod
+    def _fingerprints(
+        collection_path: Path,
+        plugin_files: list[tuple[str, Path]],
+    ) -> dict[str, list[int] | None]:
+        """Fingerprint the files read to catalog a collection.
+
+        Args:
+            collection_path: The path to the collection
+            plugin_files: The plugin type and path of each plugin file
+
+        Returns:
+            The fingerprint of each file, keyed by relative path
+        """
+        paths = [entry for entry in collection_path.iterdir() if entry.is_file()]
+        paths.append(collection_path / "meta" / "runtime.yml")
+        paths.extend(filename for _plugin_type, filename in plugin_files)
+        roles_directory = collection_path / "roles"
+        if roles_directory.is_dir():
+            for role_directory in roles_directory.iterdir():
+                if role_directory.is_dir():
+                    paths.extend(role_directory / role_file for role_file in ROLE_FILES)
+        return {str(path.relative_to(collection_path)): fingerprint(path) for path in paths}
+
+    def _previous(self, collection_path: Path) -> dict[str, Any]:
+        """Get a collection's previous entry in the index.
 
-    def _catalog_roles(self, collection: dict[str, Any]) -> None:
+        Args:
+            collection_path: The path to the collection
+
+        Returns:
+            The previous entry, empty if there is none or it is from an older index version
+        """
+        if self._index is None:
+            return {}
+        try:
+            previous: dict[str, Any] = json.loads(self._index[str(collection_path)])
+        except (KeyError, JSONDecodeError):
+            return {}
+        if previous.get("version") != CATALOG_INDEX_VERSION:
+            return {}
+        return previous
+
+    def _reuse(self, previous: dict[str, Any]) -> None:
+        """Reuse a collection and its errors from the index.
+
+        Args:
+            previous: The collection's previous entry in the index
+        """
+        collection = previous["collection"]
+        self._collections[collection["path"]] = collection
+        self._errors.extend(previous["errors"])
+        self.stats["collections_reused"] += 1
+
+    def _catalog_roles(
+        self,
+        collection: dict[str, Any],
+        fingerprints: dict[str, list[int] | None],
+        previous_roles: dict[str, dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
         """Catalog the roles within a collection.
 
         Args:
             collection: Details describing the collection
-        """
-        # pylint: disable=too-many-locals
+            fingerprints: The fingerprint of each file read to catalog the collection
+            previous_roles: The roles from the collection's previous entry in the index
 
-        collection_name: str = collection["known_as"]
+        Returns:
+            The fingerprints, catalog and errors of each role, keyed by role name
+        """
         collection["roles"] = []
+        roles: dict[str, dict[str, Any]] = {}
         roles_directory = Path(collection["path"], "roles")
         if not roles_directory.is_dir():
-            return
+            return roles
 
         for role_directory in roles_directory.iterdir():
             if not role_directory.is_dir():
                 continue
-            role: dict[str, str | dict[str, Any]] = {
-                "short_name": role_directory.name,
-                "full_name": f"{collection_name}.{role_directory.name}",
-            }
-            error_cataloging_role = False
-
-            # Argument spec cataloging, it is not required
-            argspec_name = "argument_specs.yml"
-            argspec_path = role_directory / "meta" / argspec_name
-            role["argument_specs"] = {}
-            role["argument_specs_path"] = ""
-            error = {"path": str(argspec_path)}
-            try:
-                with argspec_path.open(encoding="utf-8") as fh:
-                    role["argument_specs"] = yaml.load(fh, Loader=SafeLoader)["argument_specs"]
-                    role["argument_specs_path"] = str(argspec_path)
-            except KeyError:
-                error["error"] = f"Malformed {argspec_name} for role in {collection_name}."
-                self._errors.append(error)
-            except FileNotFoundError:
-                error["error"] = f"Failed to find {argspec_name} for role in {collection_name}."
-                self._errors.append(error)
-            except YAMLError:
-                error["error"] = f"Failed to load {argspec_name} for role in {collection_name}."
-                self._errors.append(error)
-
-            # Defaults cataloging, it is not required
-            defaults_name = "main.yml"
-            defaults_path = role_directory / "defaults" / defaults_name
-            role["defaults"] = {}
-            role["defaults_path"] = ""
-            error = {"path": str(defaults_path)}
-            try:
-                with defaults_path.open(encoding="utf-8") as fh:
-                    role["defaults"] = yaml.load(fh, Loader=SafeLoader)
-                    role["defaults_path"] = str(defaults_path)
-            except FileNotFoundError:
-                pass
-            except YAMLError:
-                error["error"] = f"Failed to load {defaults_name} for role in {collection_name}."
-                self._errors.append(error)
-                error_cataloging_role = True
-
-            # Meta/main.yml cataloging, it is required
-            meta_name = "main.yml"
-            meta_path = role_directory / "meta" / meta_name
-            role["info"] = {}
-            role["info_path"] = ""
-            error = {"path": str(meta_path)}
-            try:
-                with meta_path.open(encoding="utf-8") as fh:
-                    role["info"] = yaml.load(fh, Loader=SafeLoader)
-                    role["info_path"] = str(meta_path)
-            except FileNotFoundError:
-                error["error"] = f"Failed to find {meta_name} for role in {collection_name}."
-                self._errors.append(error)
-                error_cataloging_role = True
-            except YAMLError:
-                error["error"] = f"Failed to load {meta_name} for role in {collection_name}."
-                self._errors.append(error)
-                error_cataloging_role = True
-
-            # Readme.md cataloging, it is required
-            readme_name = "README.md"
-            readme_path = role_directory / readme_name
-            role["readme"] = ""
-            role["readme_path"] = ""
-            error = {"path": str(readme_path)}
-            try:
-                with readme_path.open(encoding="utf-8") as fh:
-                    role["readme"] = fh.read()
-                    role["readme_path"] = str(readme_path)
-            except FileNotFoundError:
-                error["error"] = f"Failed to find {readme_name} for role in {collection_name}."
-                self._errors.append(error)
-                error_cataloging_role = True
-
-            if not error_cataloging_role:
+            role_fingerprints = [
+                fingerprints.get(f"roles/{role_directory.name}/{role_file}")
+                for role_file in ROLE_FILES
+            ]
+            previous = previous_roles.get(role_directory.name, {})
+            if previous.get("fingerprints") == role_fingerprints:
+                role, errors = previous["role"], previous["errors"]
+                self._errors.extend(errors)
+            else:
+                errors_start = len(self._errors)
+                role = self._catalog_role(collection["known_as"], role_directory)
+                errors = self._errors[errors_start:]
+            if role is not None:
                 collection["roles"].append(role)
+            roles[role_directory.name] = {
+                "fingerprints": role_fingerprints,
+                "role": role,
+                "errors": errors,
+            }
+        return roles
+
+    def _catalog_role(
+        self,
+        collection_name: str,
+        role_directory: Path,
+    ) -> dict[str, str | dict[str, Any]] | None:
+        """Catalog one role within a collection.
+
+        Args:
+            collection_name: The name of the collection
+            role_directory: The path to the role
+
+        Returns:
+            Details describing the role, or None if the role could not be cataloged
+        """
+        role: dict[str, str | dict[str, Any]] = {
+            "short_name": role_directory.name,
+            "full_name": f"{collection_name}.{role_directory.name}",
+        }
+        error_cataloging_role = False
+
+        # Argument spec cataloging, it is not required
+        argspec_name = "argument_specs.yml"
+        argspec_path = role_directory / "meta" / argspec_name
+        role["argument_specs"] = {}
+        role["argument_specs_path"] = ""
+        error = {"path": str(argspec_path)}
+        try:
+            with argspec_path.open(encoding="utf-8") as fh:
+                role["argument_specs"] = yaml.load(fh, Loader=SafeLoader)["argument_specs"]
+                role["argument_specs_path"] = str(argspec_path)
+        except KeyError:
+            error["error"] = f"Malformed {argspec_name} for role in {collection_name}."
+            self._errors.append(error)
+        except FileNotFoundError:
+            error["error"] = f"Failed to find {argspec_name} for role in {collection_name}."
+            self._errors.append(error)
+        except YAMLError:
+            error["error"] = f"Failed to load {argspec_name} for role in {collection_name}."
+            self._errors.append(error)
+
+        # Defaults cataloging, it is not required
+        defaults_name = "main.yml"
+        defaults_path = role_directory / "defaults" / defaults_name
+        role["defaults"] = {}
+        role["defaults_path"] = ""
+        error = {"path": str(defaults_path)}
+        try:
+            with defaults_path.open(encoding="utf-8") as fh:
+                role["defaults"] = yaml.load(fh, Loader=SafeLoader)
+                role["defaults_path"] = str(defaults_path)
+        except FileNotFoundError:
+            pass
+        except YAMLError:
+            error["error"] = f"Failed to load {defaults_name} for role in {collection_name}."
+            self._errors.append(error)
+            error_cataloging_role = True
+
+        # Meta/main.yml cataloging, it is required
+        meta_name = "main.yml"
+        meta_path = role_directory / "meta" / meta_name
+        role["info"] = {}
+        role["info_path"] = ""
+        error = {"path": str(meta_path)}
+        try:
+            with meta_path.open(encoding="utf-8") as fh:
+                role["info"] = yaml.load(fh, Loader=SafeLoader)
+                role["info_path"] = str(meta_path)
+        except FileNotFoundError:
+            error["error"] = f"Failed to find {meta_name} for role in {collection_name}."
+            self._errors.append(error)
+            error_cataloging_role = True
+        except YAMLError:
+            error["error"] = f"Failed to load {meta_name} for role in {collection_name}."
+            self._errors.append(error)
+            error_cataloging_role = True
+
+        # Readme.md cataloging, it is required
+        readme_name = "README.md"
+        readme_path = role_directory / readme_name
+        role["readme"] = ""
+        role["readme_path"] = ""
+        error = {"path": str(readme_path)}
+        try:
+            with readme_path.open(encoding="utf-8") as fh:
+                role["readme"] = fh.read()
+                role["readme_path"] = str(readme_path)
+        except FileNotFoundError:
+            error["error"] = f"Failed to find {readme_name} for role in {collection_name}."
+            self._errors.append(error)
+            error_cataloging_role = True
+
+        if error_cataloging_role:
+            return None
+        return role
 
     @staticmethod
     def _generate_checksum(file_path: Path, relative_path: Path) -> dict[str, Any]:
@@ -235,35 +450,6 @@ class CollectionCatalog:
         }
         return res
 
-    def _process_plugin_dir(
-        self,
-        plugin_type: str,
-        filenames: Generator[Path],
-        file_checksums: dict[str, dict[Any, Any]],
-        collection: dict[Any, Any],
-    ) -> None:
-        """Process each plugin within one plugin directory.
-
-        Args:
-            plugin_type: The type of plugins
-            filenames: The filenames of the plugins
-            file_checksums: The checksums for the plugin files
-            collection: The details of the collection
-        """
-        for filename in filenames:
-            if str(filename.name).startswith("__"):
-                continue
-
-            relative_path = Path(filename).relative_to(collection["path"])
-            checksum_dict = file_checksums.get(str(relative_path))
-            if not checksum_dict:
-                checksum_dict = self._generate_checksum(filename, relative_path)
-            checksum = checksum_dict[f"chksum_{checksum_dict['chksum_type']}"]
-            collection["plugin_checksums"][checksum] = {
-                "path": str(relative_path),
-                "type": plugin_type,
-            }
-
     def _one_path(self, directory: Path) -> None:
         """Process the contents of an <...>/ansible_collections/ directory.
 
@@ -272,6 +458,14 @@ class CollectionCatalog:
                 load
         """
         for directory_path in directory.glob("*/*/"):
+            plugin_files = self._plugin_files(directory_path, builtin=False)
+            fingerprints = self._fingerprints(directory_path, plugin_files)
+            previous = self._previous(directory_path)
+            if previous.get("fingerprints") == fingerprints:
+                self._reuse(previous)
+                continue
+
+            errors_start = len(self._errors)
             manifest_file = directory_path / "MANIFEST.json"
             galaxy_file = directory_path / "galaxy.yml"
             collection = None
@@ -314,6 +508,7 @@ class CollectionCatalog:
                             self._errors.append({"path": str(runtime_file), "error": str(exc)})
 
                 self._collections[collection["path"]] = collection
+                self._catalog(collection, plugin_files, fingerprints, previous, errors_start)
             else:
                 msg = (
                     f"collection path '{directory_path}' is ignored as it does not"
@@ -348,90 +543,140 @@ class CollectionCatalog:
             if collection_directory.exists():
                 self._one_path(collection_directory)
         self.add_pseudo_builtin()
-        for collection in self._collections.values():
-            self._catalog_plugins(collection)
-            self._catalog_roles(collection)
         self._find_shadows()
         return self._collections, self._errors
 
     def add_pseudo_builtin(self) -> None:
         """Add the pseudo builtin collection."""
-        collection: dict[str, str | list[str] | dict[Any, Any]] = {}
-        collection["known_as"] = "ansible.builtin"
-        collection["plugin_checksums"] = {}
-        collection["path"] = str(Path(plugins.__file__).parents[1])
-        collection["runtime"] = {}
-        collection["meta_source"] = "None"
-        collection["collection_info"] = {"version": ansible_version}
-        self._collections[str(collection["path"])] = collection
-        msg = f"Added ansible.builtin from: {collection['path']}"
+        collection_path = Path(plugins.__file__).parents[1]
+        plugin_files = self._plugin_files(collection_path, builtin=True)
+        fingerprints = self._fingerprints(collection_path, plugin_files)
+        previous = self._previous(collection_path)
+        if previous.get("fingerprints") == fingerprints:
+            self._reuse(previous)
+        else:
+            collection: dict[str, Any] = {}
+            collection["known_as"] = "ansible.builtin"
+            collection["plugin_checksums"] = {}
+            collection["path"] = str(collection_path)
+            collection["runtime"] = {}
+            collection["meta_source"] = "None"
+            collection["collection_info"] = {"version": ansible_version}
+            self._collections[str(collection["path"])] = collection
+            self._catalog(collection, plugin_files, fingerprints, previous, len(self._errors))
+        msg = f"Added ansible.builtin from: {collection_path}"
         self._messages.append(msg)
 
 
-def worker(
-    pending_queue: multiprocessing.Queue[Any],
-    completed_queue: multiprocessing.Queue[Any],
-) -> None:
-    """Extract the documentation from a plugin, place in completed queue.
+def summarize_doc(doc: Any, plugin_type: str) -> dict[str, Any] | None:
+    """Summarize a plugin's documentation for the menu of a collection's content.
 
     Args:
-        pending_queue: A queue with plugins to process
-        completed_queue: The queue in which extracted documentation will
-            be placed
+        doc: The plugin's documentation
+        plugin_type: The type of the plugin
+
+    Returns:
+        The plugin's name, the version it was added in and its short description, or None
+        if the plugin is not documented
     """
-    # pylint: disable=import-outside-toplevel
-    # pylint: disable=too-many-locals
+    if not isinstance(doc, dict):
+        return None
+    return {
+        "name": doc.get("name", doc.get(plugin_type)),
+        "version_added": doc.get("version_added"),
+        "short_description": doc.get("short_description"),
+    }
 
-    # load the fragment_loader _after_ the path is set
-    from ansible.plugins.loader import fragment_loader
 
-    while True:
-        entry = pending_queue.get()
-        if entry is None:
-            break
-        collection_name, checksum, plugin_path = entry
+def extract_doc(
+    collection_name: str,
+    checksum: str,
+    plugin_path: Path,
+    *,
+    plugin_type: str,
+    fragment_loader: Any,
+) -> tuple[str, tuple[Any, ...]]:
+    # pylint: disable=too-many-arguments
+    """Extract the documentation from a plugin.
 
+    Args:
+        collection_name: The name of the collection the plugin is in
+        checksum: The checksum of the plugin file
+        plugin_path: The path to the plugin file
+        plugin_type: The type of the plugin
+        fragment_loader: Ansible's documentation fragment loader
+
+    Returns:
+        The message type, either plugin or error, and the message
+    """
+    try:
+        if ansible_version.startswith("2.9"):
+            (doc, examples, returndocs, metadata) = get_docstring(
+                filename=str(plugin_path),
+                fragment_loader=fragment_loader,
+            )
+        else:
+            (doc, examples, returndocs, metadata) = get_docstring(
+                filename=str(plugin_path),
+                fragment_loader=fragment_loader,
+                collection_name=collection_name,
+            )
+
+    except Exception:  # noqa: BLE001
         try:
-            if ansible_version.startswith("2.9"):
-                (doc, examples, returndocs, metadata) = get_docstring(
-                    filename=str(plugin_path),
-                    fragment_loader=fragment_loader,
-                )
-            else:
-                (doc, examples, returndocs, metadata) = get_docstring(
-                    filename=str(plugin_path),
-                    fragment_loader=fragment_loader,
-                    collection_name=collection_name,
-                )
+            with plugin_path.open(mode="r", encoding="utf-8") as f:
+                content = f.read()
+            doc, examples, returndocs, metadata = get_doc_withast(content)
+            doc, examples, returndocs, metadata = (
+                yaml.load(value, Loader=yaml.SafeLoader)
+                for value in (doc, examples, returndocs, metadata)
+            )
+        except Exception as exc:  # noqa: BLE001
+            err_message = f"{type(exc).__name__} (get_docstring): {exc!s}"
+            return "error", (checksum, plugin_path, err_message)
 
-        except Exception:  # noqa: BLE001
-            try:
-                with plugin_path.open(mode="r", encoding="utf-8") as f:
-                    content = f.read()
-                doc, examples, returndocs, metadata = get_doc_withast(content)
-                doc, examples, returndocs, metadata = (
-                    yaml.load(value, Loader=yaml.SafeLoader)
-                    for value in (doc, examples, returndocs, metadata)
-                )
-            except Exception as exc:  # noqa: BLE001
-                err_message = f"{type(exc).__name__} (get_docstring): {exc!s}"
-                completed_queue.put(("error", (checksum, plugin_path, err_message)))
-                continue
+    try:
+        q_message = {
+            "plugin": {
+                "doc": doc,
+                "examples": examples,
+                "returndocs": returndocs,
+                "metadata": metadata,
+            },
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        summary = summarize_doc(doc, plugin_type)
+        return "plugin", (checksum, json.dumps(q_message, default=str), summary)
+    except JSONDecodeError as exc:
+        err_message = f"{type(exc).__name__} (json_decode_doc): {exc!s}"
+        return "error", (checksum, plugin_path, err_message)
 
-        try:
-            q_message = {
-                "plugin": {
-                    "doc": doc,
-                    "examples": examples,
-                    "returndocs": returndocs,
-                    "metadata": metadata,
-                },
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-            completed_queue.put(("plugin", (checksum, json.dumps(q_message, default=str))))
-        except JSONDecodeError as exc:
-            err_message = f"{type(exc).__name__} (json_decode_doc): {exc!s}"
-            completed_queue.put(("error", (checksum, plugin_path, err_message)))
+
+def extract_docs(batch: list[tuple[str, str, Path, str]]) -> list[tuple[str, tuple[Any, ...]]]:
+    """Extract the documentation from a batch of plugins, run in a worker process.
+
+    Args:
+        batch: The collection name, checksum, path and type of each plugin
+
+    Returns:
+        The message type and message for each plugin
+    """
+    # pylint: disable=import-outside-toplevel
+
+    # load the fragment_loader _after_ the path is set, it is only
+    # imported once per worker process
+    from ansible.plugins.loader import fragment_loader
+
+    return [
+        extract_doc(
+            collection_name,
+            checksum,
+            plugin_path,
+            plugin_type=plugin_type,
+            fragment_loader=fragment_loader,
+        )
+        for collection_name, checksum, plugin_path, plugin_type in batch
+    ]
 
 
 def identify_missing(
@@ -451,16 +696,24 @@ def identify_missing(
     handled = set()
     missing = []
     plugin_count = 0
+    cached = collection_cache.contains_many(
+        {
+            checksum
+            for collection in collections.values()
+            for checksum in collection["plugin_checksums"]
+        },
+    )
     for collection in collections.values():
         for checksum, details in collection["plugin_checksums"].items():
             plugin_count += 1
             if checksum not in handled:
-                if checksum not in collection_cache:
+                if checksum not in cached:
                     missing.append(
                         (
                             collection["known_as"],
                             checksum,
                             Path(collection["path"], details["path"]),
+                            details["type"],
                         ),
                     )
                 handled.add(checksum)
@@ -529,45 +782,60 @@ def retrieve_collections_paths() -> dict[Any, Any]:
 
 def retrieve_docs(
     collection_cache: KeyValueStore,
+    plugin_summaries: KeyValueStore,
     errors: list[dict[str, str]],
-    missing: list[str],
+    missing: list[tuple[str, str, Path, str]],
+    *,
     stats: dict[Any, Any],
+    messages: list[str],
 ) -> None:
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-arguments
     """Extract the docs from the plugins.
 
+    The plugins are extracted in batches by a pool of worker processes. The results of
+    each batch are written to the cache and committed as soon as the batch completes, the
+    docs and their summaries in one transaction.
+
     Args:
         collection_cache: The key value interface to a sqlite database
+        plugin_summaries: The summary of each plugin's doc, sharing the collection cache's
+            connection
         errors: Previous errors encountered
         missing: Plugins missing from the collection cache
         stats: Statistics related to the collection cataloging process
+        messages: Messages about the progress of the collection cataloging process
     """
-    pending_queue = multiprocessing.Manager().Queue()
-    completed_queue = multiprocessing.Manager().Queue()
-    processes = []
-    for _proc in range(PROCESSES):
-        proc = multiprocessing.Process(target=worker, args=(pending_queue, completed_queue))
-        processes.append(proc)
-        proc.start()
-
-    for entry in missing:
-        pending_queue.put(entry)
-    for _proc in range(PROCESSES):
-        pending_queue.put(None)
-    for proc in processes:
-        proc.join()
-
-    while not completed_queue.empty():
-        message_type, message = completed_queue.get()
-        if message_type == "plugin":
-            checksum, plugin = message
-            collection_cache[checksum] = plugin
-            stats["cache_added_success"] += 1
-        elif message_type == "error":
-            checksum, plugin_path, error = message
-            collection_cache[checksum] = json.dumps({"error": error})
-            errors.append({"path": str(plugin_path), "error": error})
-            stats["cache_added_errors"] += 1
+    batches = [missing[idx : idx + BATCH_SIZE] for idx in range(0, len(missing), BATCH_SIZE)]
+    start_time = datetime.now(timezone.utc)
+    processed = 0
+    next_progress = PROGRESS_INTERVAL
+    with multiprocessing.Pool(processes=min(PROCESSES, len(batches))) as pool:
+        for results in pool.imap_unordered(extract_docs, batches):
+            docs = {}
+            summaries = {}
+            for message_type, message in results:
+                if message_type == "plugin":
+                    checksum, plugin, summary = message
+                    docs[checksum] = plugin
+                    if summary is not None:
+                        summaries[checksum] = json.dumps(summary, default=str)
+                    stats["cache_added_success"] += 1
+                elif message_type == "error":
+                    checksum, plugin_path, error = message
+                    docs[checksum] = json.dumps({"error": error})
+                    errors.append({"path": str(plugin_path), "error": error})
+                    stats["cache_added_errors"] += 1
+            with collection_cache.transaction():
+                collection_cache.set_many(docs)
+                plugin_summaries.set_many(summaries)
+
+            processed += len(results)
+            if processed * 100 >= next_progress * len(missing) or processed == len(missing):
+                elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
+                messages.append(
+                    f"Retrieved docs for {processed}/{len(missing)} plugins in {elapsed:.1f}s",
+                )
+                next_progress = (processed * 100 // len(missing)) + PROGRESS_INTERVAL
 
 
 def get_doc_withast(content: Any) -> tuple[Any, Any, Any, Any]:
@@ -633,12 +901,19 @@ def main() -> dict[Any, Any]:
     stats["cache_added_success"] = 0
     stats["cache_added_errors"] = 0
 
-    cc_obj = CollectionCatalog(directories=parent_directories)
+    collection_cache_path = Path(args.collection_cache_path).resolve().expanduser()
+
+    # The index is committed before the cache is written to, they share the database
+    catalog_index = KeyValueStore(collection_cache_path, table=CATALOG_INDEX_TABLE)
+    cc_obj = CollectionCatalog(directories=parent_directories, index=catalog_index)
     collections, errors = cc_obj.process_directories()
+    catalog_index.close()
     stats["collection_count"] = len(collections)
+    stats["collections_reused"] = cc_obj.stats["collections_reused"]
+    stats["files_hashed"] = cc_obj.stats["files_hashed"]
 
-    collection_cache_path = Path(args.collection_cache_path).resolve().expanduser()
     collection_cache = KeyValueStore(collection_cache_path)
+    plugin_summaries = collection_cache.table(PLUGIN_SUMMARY_TABLE)
 
     handled, missing, plugin_count = identify_missing(collections, collection_cache)
     stats["plugin_count"] = plugin_count
@@ -646,14 +921,27 @@ def main() -> dict[Any, Any]:
     stats["processed"] = len(missing)
 
     if missing:
-        retrieve_docs(collection_cache, errors, missing, stats)
+        retrieve_docs(
+            collection_cache,
+            plugin_summaries,
+            errors,
+            missing,
+            stats=stats,
+            messages=cc_obj._messages,  # noqa: SLF001
+        )
 
-    cached_checksums = collection_cache.keys()
-    stats["cache_length"] = len(collection_cache.keys())
+    cached_checksums = collection_cache.contains_many(handled)
+    stats["cache_length"] = len(collection_cache)
 
+    # The menu of a collection's content is built from the summaries, without reading
+    # each plugin's doc from the cache
+    summaries = plugin_summaries.get_many(cached_checksums)
     for collection in collections.values():
-        for no_doc in set(collection["plugin_checksums"].keys()) - set(cached_checksums):
+        for no_doc in set(collection["plugin_checksums"].keys()) - cached_checksums:
             del collection["plugin_checksums"][no_doc]
+        for checksum, details in collection["plugin_checksums"].items():
+            if checksum in summaries:
+                details["summary"] = json.loads(summaries[checksum])
 
     collection_cache.close()
     return {
@@ -0,0 +1,46 @@
+"""Run commands on request within a long-lived execution environment container.
+
+Each request is a line of JSON on stdin, with the command to run. The command's output,
+error and return code are written as a line of JSON on stdout, as ansible-runner returns
+them for a command run in a container of its own. The server exits when stdin is closed.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+
+def run(request: dict[str, list[str]]) -> dict[str, str | int]:
+    """Run the command in a request.
+
+    Args:
+        request: The request, with the command to run
+
+    Returns:
+        The output, error and return code of the command
+    """
+    try:
+        proc = subprocess.run(
+            request["command"],
+            check=False,
+            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError as exc:
+        return {"output": "", "error": str(exc), "return_code": 127}
+    return {"output": proc.stdout, "error": proc.stderr, "return_code": proc.returncode}
+
+
+def main() -> None:
+    """Serve requests until stdin is closed."""
+    for line in sys.stdin:
+        response = run(json.loads(line))
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
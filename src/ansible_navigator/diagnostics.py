@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import sys
+import threading
+import time
 import traceback
 
 from dataclasses import asdict
 from dataclasses import dataclass
 from datetime import datetime
 from datetime import timezone
+from functools import wraps
 from importlib.util import find_spec
 from pathlib import Path
+from queue import Empty
+from queue import Queue
 from sys import stdout
 from typing import TYPE_CHECKING
 from typing import Any
@@ -26,6 +31,7 @@ from .utils import ansi
 from .utils.compatibility import importlib_metadata
 from .utils.functions import now_iso
 from .utils.functions import shlex_join
+from .utils.log_tail import read_tail
 from .utils.serialize import Loader
 from .utils.serialize import write_diagnostics_json
 from .utils.serialize import yaml
@@ -42,22 +48,19 @@ if TYPE_CHECKING:
 
 JSONTypes = bool | int | str | dict[Any, Any] | list[Any]
 
+COLLECTOR_TIMEOUT = 120
+"""The number of seconds a collector is given to finish before it is reported as failed"""
+
+COMMAND_TIMEOUT = 30
+"""The number of seconds a command run by a collector is given to finish"""
+
 
 @dataclass
 class Collector:
     """Data class for a collector."""
 
     name: str
-
-    def start(self, color: bool) -> None:
-        """Output start information to the console.
-
-        Args:
-            color: Whether to color the message
-        """
-        message = f"Collecting {self.name} information"
-        information = f"{message:.<60}"
-        ansi.working(color=color, message=information)
+    timeout: float = COLLECTOR_TIMEOUT
 
     def fail(self, color: bool, duration: float) -> None:
         """Output fail information to the console.
@@ -129,6 +132,9 @@ def register(collector: Collector) -> Callable[..., Any]:
 
 DIAGNOSTIC_FAILURES = 0
 
+_LOCK = threading.RLock()
+"""Serialize console output and failure counting by the collectors, which run concurrently"""
+
 
 class FailedCollectionError(Exception):
     """Exception for a failed collection."""
@@ -143,6 +149,20 @@ class FailedCollectionError(Exception):
         self.errors = errors
 
 
+def record_failure(collector: Collector, color: bool, duration: float) -> None:
+    """Count a failed collection and output fail information to the console.
+
+    Args:
+        collector: The collector which failed
+        color: Whether to color the message
+        duration: The duration of the collection
+    """
+    global DIAGNOSTIC_FAILURES
+    with _LOCK:
+        collector.fail(color=color, duration=duration)
+        DIAGNOSTIC_FAILURES += 1
+
+
 def diagnostic_runner(func: Callable[..., Any]) -> Callable[..., Any]:
     """Wrap and run a collector.
 
@@ -153,6 +173,7 @@ def diagnostic_runner(func: Callable[..., Any]) -> Callable[..., Any]:
         The decorator
     """
 
+    @wraps(func)
     def wrapper(*args: Any, **kwargs: dict[str, Any]) -> Callable[..., Any]:
         """Wrap and run the collector.
 
@@ -163,28 +184,28 @@ def diagnostic_runner(func: Callable[..., Any]) -> Callable[..., Any]:
         Returns:
             The result of the function with elapsed or error information
         """
-        global DIAGNOSTIC_FAILURES
         start = datetime.now(timezone.utc)
-        color = args[0].color
+        instance = args[0]
         collector = func.__collector__  # type: ignore[attr-defined]
-        collector.start(color=color)
+        failed = True
         try:
             result = func(*args, **kwargs)
-            duration = (datetime.now(timezone.utc) - start).total_seconds()
-            collector.finish(color=color, duration=duration)
+            failed = False
         except FailedCollectionError as error:
             # A collector exception, has data
             result = error.errors
-            duration = (datetime.now(timezone.utc) - start).total_seconds()
-            collector.fail(color=color, duration=duration)
-            DIAGNOSTIC_FAILURES += 1
         except Exception as error:  # noqa: BLE001
             # Any other exception, has no data
             result = {"error": str(error) + "\n" + traceback.format_exc()}
-            duration = (datetime.now(timezone.utc) - start).total_seconds()
-            collector.fail(color=color, duration=duration)
-            DIAGNOSTIC_FAILURES += 1
-        result["duration"] = round(duration)
+        duration = (datetime.now(timezone.utc) - start).total_seconds()
+        with _LOCK:
+            # A collector which timed out was reported as failed then, it finishes silently
+            if collector.name not in instance.timed_out:
+                if failed:
+                    record_failure(collector=collector, color=instance.color, duration=duration)
+                else:
+                    collector.finish(color=instance.color, duration=duration)
+        result["duration"] = round(duration, 2)
         return result
 
     return wrapper
@@ -212,6 +233,24 @@ class DiagnosticsCollector:
         self.color = args.display_color and stdout.isatty()
         self._messages = messages
         self._exit_messages = exit_messages
+        self._log_lines = self._integer_setting("log_diagnostics_lines")
+        self._log_bytes = self._integer_setting("log_diagnostics_bytes")
+        # The names of the collectors which timed out
+        self.timed_out: set[str] = set()
+
+    def _integer_setting(self, name: str) -> int:
+        """Get an integer setting, diagnostics may be requested when it could not be resolved.
+
+        Args:
+            name: The name of the settings entry
+
+        Returns:
+            The value of the setting, or its default if it is not an integer
+        """
+        value = self._args.entry(name).value
+        if isinstance(value.current, int):
+            return value.current
+        return value.default
 
     @property
     def registered(self) -> Iterator[Callable[..., Any]]:
@@ -225,18 +264,19 @@ class DiagnosticsCollector:
     def run(self) -> None:
         """Collect as much information as possible about everything and dump to a json file."""
         ansi.warning(color=self.color, message=self.WARNING)
-        diagnostics = Diagnostics(
-            __WARNING__=self._warning(),
-            basics=self._basics(),
-            container_engines=self._container_engines(),
-            execution_environment=self._execution_environment(),
-            initialization=self._initialization(),
-            local_system=self._local_system(),
-            logs=self._log_collector(),
-            python_packages=self._python_packages(),
-            settings=self._settings(),
-            settings_file=self._settings_file(),
-        )
+        collectors = {
+            "__WARNING__": self._warning,
+            "basics": self._basics,
+            "container_engines": self._container_engines,
+            "execution_environment": self._execution_environment,
+            "initialization": self._initialization,
+            "local_system": self._local_system,
+            "logs": self._log_collector,
+            "python_packages": self._python_packages,
+            "settings": self._settings,
+            "settings_file": self._settings_file,
+        }
+        diagnostics = Diagnostics(**self._collect(collectors))
 
         time = now_iso("local")
         file_name = f"diagnostics-{time}.json"
@@ -251,6 +291,76 @@ class DiagnosticsCollector:
             ansi.success(color=self.color, message=message)
         sys.exit(0)
 
+    def _collect(
+        self,
+        collectors: dict[str, Callable[[], dict[str, JSONTypes]]],
+    ) -> dict[str, dict[str, JSONTypes]]:
+        """Run the collectors concurrently, each in a thread of its own.
+
+        The collectors are independent, so the collection takes as long as the slowest of
+        them. A collector which does not finish within its timeout is reported as failed,
+        its thread is left to finish in the background without reporting again.
+
+        Args:
+            collectors: The collectors, keyed by the name of their diagnostics
+
+        Returns:
+            The result of each collector, keyed by the name of its diagnostics
+        """
+        completed: Queue[tuple[str, dict[str, JSONTypes]]] = Queue()
+
+        def collect(name: str, collector: Callable[[], dict[str, JSONTypes]]) -> None:
+            """Run a collector and queue its result.
+
+            Args:
+                name: The name of the collector's diagnostics
+                collector: The collector
+            """
+            completed.put((name, collector()))
+
+        ansi.working(color=self.color, message=f"Running {len(collectors)} collectors...")
+        start = time.monotonic()
+        for name, collector in collectors.items():
+            threading.Thread(
+                target=collect,
+                args=(name, collector),
+                name=f"diagnostics_{name}",
+                daemon=True,
+            ).start()
+
+        registrations: dict[str, Collector] = {
+            name: collector.__collector__  # type: ignore[attr-defined]
+            for name, collector in collectors.items()
+        }
+        pending = {name: start + registrations[name].timeout for name in collectors}
+        results: dict[str, dict[str, JSONTypes]] = {}
+        while pending:
+            try:
+                name, result = completed.get(
+                    timeout=max(0, min(pending.values()) - time.monotonic()),
+                )
+            except Empty:
+                expired = [
+                    name for name, deadline in pending.items() if deadline <= time.monotonic()
+                ]
+                for name in expired:
+                    del pending[name]
+                    timeout = registrations[name].timeout
+                    with _LOCK:
+                        self.timed_out.add(registrations[name].name)
+                        record_failure(
+                            collector=registrations[name], color=self.color, duration=timeout
+                        )
+                    results[name] = {
+                        "error": f"Collection timed out after {timeout} seconds",
+                        "duration": timeout,
+                    }
+                continue
+            # The result of a collector which timed out is discarded
+            if pending.pop(name, None) is not None:
+                results[name] = result
+        return results
+
     @diagnostic_runner
     @register(Collector(name="warning"))
     def _warning(self) -> dict[str, JSONTypes]:
@@ -289,10 +399,15 @@ class DiagnosticsCollector:
             The container engines
         """
         commands = [
-            Command(identity="podman", command="podman --version", post_process=lambda c: c),
-            Command(identity="docker", command="docker --version", post_process=lambda c: c),
+            Command(
+                identity=engine,
+                command=f"{engine} --version",
+                post_process=lambda c: c,
+                timeout=COMMAND_TIMEOUT,
+            )
+            for engine in ("podman", "docker")
         ]
-        CommandRunner().run_single_process(commands)
+        CommandRunner().run_multi_thread(commands)
         engines: dict[str, JSONTypes] = {}
         for command in commands:
             engines[command.identity] = {
@@ -304,7 +419,7 @@ class DiagnosticsCollector:
         return engines
 
     @diagnostic_runner
-    @register(Collector(name="execution environment"))
+    @register(Collector(name="execution environment", timeout=300))
     def _execution_environment(self) -> dict[str, JSONTypes]:
         """Add execution environment information.
 
@@ -344,26 +459,30 @@ class DiagnosticsCollector:
     def _log_collector(self) -> dict[str, JSONTypes]:
         """Add log collector information.
 
+        Only the end of each log file is collected, up to a number of lines and bytes.
+
         Returns:
             The log collector information
         """
         logs: list[JSONTypes] = []
         cwd_log = Path("./ansible-navigator.log")
-        if cwd_log.exists():
-            contents = cwd_log.read_text(encoding="utf-8").splitlines()
-            log = {
-                "name": str(cwd_log),
-                "contents": contents,
-                "date": cwd_log.stat().st_mtime,
-            }
-            logs.append(log)
         settings_log = Path(self._args.log_file)
-        if cwd_log != settings_log and settings_log.exists():
-            contents = settings_log.read_text(encoding="utf-8").splitlines()
+        log_files = {log_file.resolve(): log_file for log_file in (cwd_log, settings_log)}
+        for log_file in log_files.values():
+            if not log_file.exists():
+                continue
+            contents, truncated = read_tail(
+                file=log_file,
+                lines=self._log_lines,
+                max_bytes=self._log_bytes,
+            )
+            stat = log_file.stat()
             log = {
-                "name": str(settings_log),
+                "name": str(log_file),
                 "contents": contents,
-                "date": settings_log.stat().st_mtime,
+                "date": stat.st_mtime,
+                "size": stat.st_size,
+                "truncated": truncated,
             }
             logs.append(log)
         return {"found": bool(logs), "logs": logs}
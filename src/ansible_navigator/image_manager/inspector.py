@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import re
+import shlex
 
 from collections.abc import Iterable
 from typing import Any
@@ -13,8 +14,24 @@ from ansible_navigator.command_runner import CommandRunner
 from ansible_navigator.utils.functions import pascal_to_snake
 
 
+IMAGES_LIST_FORMAT = (
+    '{"repository":{{json .Repository}},"tag":{{json .Tag}},"image_id":{{json .ID}},'
+    '"created":{{json .CreatedSince}},"size":{{json .Size}}}'
+)
+"""The format of each image listed by the container engine, as JSON"""
+
+INSPECT_CHUNK_SIZE = 100
+"""The number of images inspected by each container engine call, well within argv limits"""
+
+COMMAND_TIMEOUT = 60
+"""The seconds a container engine call is given to finish before it is reported as failed"""
+
+
 class ImagesInspect:
-    """Functionality for inspecting container images."""
+    """Functionality for inspecting container images.
+
+    Images are inspected in chunks, with one container engine call for each chunk.
+    """
 
     def __init__(self, container_engine: str, ids: list[str]) -> None:
         """Initialize the container image inspector.
@@ -31,39 +48,65 @@ class ImagesInspect:
         """Generate image inspection commands.
 
         Returns:
-            List of image inspection command objects
+            List of image inspection command objects, one for each chunk of images
         """
+        chunks = [
+            self._image_ids[start : start + INSPECT_CHUNK_SIZE]
+            for start in range(0, len(self._image_ids), INSPECT_CHUNK_SIZE)
+        ]
         return [
             Command(
-                identity=image_id,
-                command=f"{self._container_engine} inspect {image_id}",
+                identity=" ".join(chunk),
+                command=f"{self._container_engine} inspect {' '.join(chunk)}",
                 post_process=self.parse,
+                timeout=COMMAND_TIMEOUT,
             )
-            for image_id in self._image_ids
+            for chunk in chunks
         ]
 
     @staticmethod
     def parse(command: Command) -> None:
         """Parse the image inspection command output.
 
+        The container engine reports the images found, even if some of the images in the
+        chunk could not be inspected. Each is matched to the requested id it starts with.
+
         Args:
             command: Image inspection command object
         """
-        obj = json.loads(command.stdout)
-        snake = pascal_to_snake(obj[0])
-        command.details = snake
+        image_ids = command.identity.split()
+        try:
+            objs = json.loads(command.stdout)
+        except ValueError:
+            objs = []
+        details = {}
+        for obj in objs:
+            full_id = obj.get("Id", "").removeprefix("sha256:")
+            for image_id in image_ids:
+                if full_id.startswith(image_id.removeprefix("sha256:")):
+                    details[image_id] = pascal_to_snake(obj)
+        command.details = details
+        if not command.errors and len(details) < len(image_ids):
+            command.errors = command.stderr
 
 
 class ImagesList:
-    """Functionality for listing container images."""
+    """Functionality for listing container images.
+
+    The images are listed as JSON, formatted by the container engine, with the same keys
+    as the columns of the table listed by default. If the container engine cannot format
+    the list, the table is parsed.
+    """
 
-    def __init__(self, container_engine: str) -> None:
+    def __init__(self, container_engine: str, formatted: bool = True) -> None:
         """Initialize the container image lister.
 
         Args:
             container_engine: The name of the container engine to use
+            formatted: Request the list formatted as JSON rather than a table
         """
         self._container_engine = container_engine
+        self._formatted = formatted
 
     @property
     def commands(self) -> list[Command]:
@@ -72,14 +115,34 @@ class ImagesList:
         Returns:
             List of the image lister commands
         """
+        command = f"{self._container_engine} images"
+        if self._formatted:
+            command += f" --format {shlex.quote(IMAGES_LIST_FORMAT)}"
         return [
             Command(
                 identity="images",
-                command=f"{self._container_engine} images",
-                post_process=self.parse,
+                command=command,
+                post_process=self.parse_json if self._formatted else self.parse,
+                timeout=COMMAND_TIMEOUT,
             ),
         ]
 
+    @staticmethod
+    def parse_json(command: Command) -> None:
+        """Parse the image lister command output, one JSON object for each image.
+
+        Args:
+            command: Image lister command object
+        """
+        if command.return_code:
+            return
+        try:
+            local_images = [json.loads(line) for line in command.stdout_lines if line]
+        except ValueError:
+            return
+        valid_images = [image for image in local_images if image["tag"] != "<none>"]
+        command.details = valid_images
+
     @staticmethod
     def parse(command: Command) -> None:
         """Parse the image lister command output.
@@ -98,6 +161,64 @@ class ImagesList:
             command.details = valid_images
 
 
+class ImageId:
+    """Functionality for finding the ID of a container image."""
+
+    def __init__(self, container_engine: str, image_name: str) -> None:
+        """Initialize the container image ID finder.
+
+        Args:
+            container_engine: The name of the container engine to use
+            image_name: The name of the container image
+        """
+        self._container_engine = container_engine
+        self._image_name = image_name
+
+    @property
+    def commands(self) -> list[Command]:
+        """Generate the image ID command.
+
+        Returns:
+            List of the image ID commands
+        """
+        return [
+            Command(
+                identity=self._image_name,
+                command=(
+                    f"{self._container_engine} image inspect --format '{{{{.Id}}}}'"
+                    f" {self._image_name}"
+                ),
+                post_process=self.parse,
+                timeout=COMMAND_TIMEOUT,
+            ),
+        ]
+
+    @staticmethod
+    def parse(command: Command) -> None:
+        """Parse the image ID command output.
+
+        Args:
+            command: Image ID command object
+        """
+        if not command.return_code:
+            command.details = command.stdout.strip()
+
+
+def inspect_id(container_engine: str, image_name: str) -> str:
+    """Find the ID of an image.
+
+    Args:
+        container_engine: Name of the container engine
+        image_name: The name of the image
+
+    Returns:
+        The full ID of the image, or an empty string if the image is not available locally
+    """
+    image_id_class = ImageId(container_engine=container_engine, image_name=image_name)
+    result = CommandRunner.run_single_process(commands=image_id_class.commands)
+    return result[0].details if isinstance(result[0].details, str) else ""
+
+
 def inspect_all(container_engine: str) -> tuple[list[dict[str, Any]], str]:
     """Run inspect against all images in the list.
 
@@ -114,6 +235,11 @@ def inspect_all(container_engine: str) -> tuple[list[dict[str, Any]], str]:
     images_list_class = ImagesList(container_engine=container_engine)
     result = cmd_runner.run_single_process(commands=images_list_class.commands)
     images_list = result[0]
+    if images_list.return_code and not images_list.errors:
+        # The container engine may not support formatting the list
+        images_list_class = ImagesList(container_engine=container_engine, formatted=False)
+        result = cmd_runner.run_single_process(commands=images_list_class.commands)
+        images_list = result[0]
     if images_list.errors:
         return [], images_list.errors
     if images_list.stderr and not images_list.details:
@@ -121,9 +247,14 @@ def inspect_all(container_engine: str) -> tuple[list[dict[str, Any]], str]:
     if not isinstance(images_list.details, Iterable):
         raise TypeError
     images = {image["image_id"]: image for image in images_list.details}
-    image_ids = [image["image_id"] for image in images.values()]
+    image_ids = list(images)
     images_inspect_class = ImagesInspect(container_engine=container_engine, ids=image_ids)
-    inspects = cmd_runner.run_single_process(commands=images_inspect_class.commands)
-    for inspect in inspects:
-        images[inspect.identity]["inspect"] = {"details": inspect.details, "errors": inspect.errors}
+    for inspect in cmd_runner.iter_multi_thread(commands=images_inspect_class.commands):
+        if not isinstance(inspect.details, dict):
+            raise TypeError
+        for image_id in inspect.identity.split():
+            images[image_id]["inspect"] = {
+                "details": inspect.details.get(image_id, []),
+                "errors": "" if image_id in inspect.details else inspect.errors,
+            }
     return list(images.values()), images_list.stderr
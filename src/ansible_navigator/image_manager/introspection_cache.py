@@ -0,0 +1,93 @@
+"""A cache of image introspection details, keyed by image ID.
+
+An image is immutable for a given ID, the details collected by introspecting it do not
+change and can be reused across sessions. Each entry records a checksum of the
+introspection script, entries collected by another version of the script are ignored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from ansible_navigator.utils.key_value_store import KeyValueStore
+from ansible_navigator.utils.packaged_data import path_to_file
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+INTROSPECTION_CACHE_FILE = "image_introspection.db"
+"""The name of the cache file, within the application's cache directory"""
+
+INTROSPECTION_CACHE_TABLE = "introspection"
+"""The name of the table in the cache file"""
+
+logger = logging.getLogger(__name__)
+
+
+class IntrospectionCache:
+    """The introspection details of images, keyed by image ID."""
+
+    def __init__(self, cache_path: Path) -> None:
+        """Initialize the introspection cache.
+
+        Args:
+            cache_path: The application's cache directory
+        """
+        self._store = KeyValueStore(
+            cache_path / INTROSPECTION_CACHE_FILE,
+            table=INTROSPECTION_CACHE_TABLE,
+            write_ahead_log=True,
+        )
+        script = path_to_file(filename="image_introspect.py")
+        self._script = hashlib.sha256(script.read_bytes()).hexdigest()
+
+    def get(self, image_id: str) -> dict[str, Any] | None:
+        """Get the introspection details for an image.
+
+        Args:
+            image_id: The image ID
+
+        Returns:
+            The introspection details, or None if the image has not been introspected
+        """
+        try:
+            entry = json.loads(self._store[image_id])
+        except KeyError:
+            return None
+        except ValueError:
+            logger.warning("Discarding unreadable introspection cache entry for %s", image_id)
+            return None
+        if entry.get("script") != self._script:
+            logger.debug("Introspection cache entry for %s is from another script", image_id)
+            return None
+        return entry["details"]
+
+    def set(self, image_id: str, details: dict[str, Any]) -> None:
+        """Set the introspection details for an image.
+
+        Args:
+            image_id: The image ID
+            details: The introspection details
+        """
+        with self._store.transaction():
+            self._store[image_id] = json.dumps({"script": self._script, "details": details})
+
+    def invalidate(self, image_id: str) -> None:
+        """Remove the introspection details for an image.
+
+        Args:
+            image_id: The image ID
+        """
+        with self._store.transaction():
+            self._store.pop(image_id, None)
+
+    def close(self) -> None:
+        """Close the cache file."""
+        self._store.close()
@@ -42,6 +42,16 @@ class AnsibleConfig(Base):
         Returns:
             A tuple of response and error string (if any)
         """
+        # The command as ansible-runner builds it
+        cmdline = [action]
+        if config_file:
+            cmdline.extend(["-c", config_file])
+        if only_changed:
+            cmdline.append("--only-changed")
+        result = self._run_persistent("ansible-config", cmdline)
+        if result is not None:
+            output, error, _return_code = result
+            return output, error
         return get_ansible_config(
             action,
             config_file=config_file,
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
+
 from typing import Any
 
 from ansible_runner import get_plugin_docs
+from ansible_runner.utils import sanitize_json_response
 
 from .base import Base
 
@@ -49,6 +52,25 @@ class AnsibleDoc(Base):
             ``response_format`` is ``json`` it returns a python
             dictionary object.
         """
+        # The command as ansible-runner builds it
+        cmdline: list[str] = []
+        if response_format == "json":
+            cmdline.append("-j")
+        if snippet:
+            cmdline.append("-s")
+        if plugin_type:
+            cmdline.extend(["-t", plugin_type])
+        if playbook_dir:
+            cmdline.extend(["--playbook-dir", playbook_dir])
+        if module_path:
+            cmdline.extend(["-M", module_path])
+        cmdline.extend(name for name in plugin_names if name is not None)
+        result = self._run_persistent("ansible-doc", cmdline)
+        if result is not None:
+            output, error, _return_code = result
+            if output and response_format == "json":
+                return json.loads(sanitize_json_response(output)), error
+            return output, error
         return get_plugin_docs(
             plugin_names,
             plugin_type=plugin_type,
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
+
 from typing import Any
 
 from ansible_runner import get_inventory
+from ansible_runner.utils import sanitize_json_response
 
 from .base import Base
 
@@ -45,6 +48,26 @@ class AnsibleInventory(Base):
         Returns:
             A tuple of response and error string (if any)
         """
+        # The command as ansible-runner builds it
+        cmdline = [f"--{action}"]
+        if action == "host" and host is not None:
+            cmdline.append(host)
+        for inventory in inventories:
+            cmdline.extend(["-i", inventory])
+        if response_format in ("yaml", "toml"):
+            cmdline.append(f"--{response_format}")
+        if playbook_dir:
+            cmdline.extend(["--playbook-dir", playbook_dir])
+        if vault_ids:
+            cmdline.extend(["--vault-id", vault_ids])
+        if vault_password_file:
+            cmdline.extend(["--vault-password-file", vault_password_file])
+        result = self._run_persistent("ansible-inventory", cmdline)
+        if result is not None:
+            output, error, _return_code = result
+            if output and response_format == "json":
+                return json.loads(sanitize_json_response(output)), error
+            return output, error
         return get_inventory(
             action,
             inventories=inventories,
@@ -16,6 +16,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 
+from .command_server import CommandServer
+
 
 if TYPE_CHECKING:
     from ansible_runner import Runner
@@ -41,6 +43,8 @@ class Base:
         host_cwd: str | None = None,
         rotate_artifacts: int | None = None,
         timeout: int | None = None,
+        *,
+        persistent: bool = False,
     ) -> None:
         """Handle the common argument for the ansible-runner interface class.
 
@@ -80,6 +84,8 @@ class Base:
                 on ``runner_mode`` selected) while executing command. It
                 the timeout is triggered it will force cancel the
                 execution.
+            persistent: Run commands in a long-lived execution environment container,
+                rather than a container of their own
         """
         self._logger = logging.getLogger(__name__)
 
@@ -97,6 +103,7 @@ class Base:
         self._host_cwd = host_cwd
         self._rotate_artifacts = rotate_artifacts if isinstance(rotate_artifacts, int) else None
         self._timeout = timeout if isinstance(timeout, int) else None
+        self._persistent = persistent
         self.ansible_runner_instance: Runner
         self.cancelled: bool = False
         self.finished: bool = False
@@ -211,6 +218,35 @@ class Base:
         self.status = runner.status
         self.finished = True
 
+    def _run_persistent(
+        self, executable_cmd: str, cmdline: list[str]
+    ) -> tuple[str, str, int] | None:
+        """Run a command in the long-lived execution environment container, if enabled.
+
+        Commands run in stdout mode or with a timeout always run in a container of
+        their own.
+
+        Args:
+            executable_cmd: The command to run
+            cmdline: The arguments for the command
+
+        Returns:
+            Output, error and return code, or None if the command should be run in a
+            container of its own
+        """
+        if (
+            not self._persistent
+            or not self._ee
+            or self._navigator_mode == "stdout"
+            or self._timeout is not None
+        ):
+            return None
+        server = CommandServer.for_args(self._runner_args)
+        result = server.run(executable_cmd, cmdline)
+        if result is None:
+            self._logger.warning("Command server failed, running the command in a new container")
+        return result
+
     def _add_env_vars_to_args(self) -> None:
         """Add environment variables to runner args."""
         self._runner_args["envvars"] = {
@@ -17,5 +17,8 @@ class Command(CommandBase):
             Output, error, and error code
         """
         self.generate_run_command_args()
+        result = self._run_persistent(self._executable_cmd, self._cmdline)
+        if result is not None:
+            return result
         out, err, ret_code = run_command(**self._runner_args)
         return out, err, ret_code
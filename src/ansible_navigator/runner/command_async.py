@@ -6,7 +6,6 @@ standard out and error from the command run and populates the
 queue with messages.
 """
 
-from copy import deepcopy
 from queue import Queue
 from threading import Thread
 from typing import Any
@@ -41,9 +40,15 @@ class CommandAsync(CommandBase):
         self._write_job_events = write_job_events
         super().__init__(executable_cmd, **kwargs)
 
-    def _event_handler(self, event: Any) -> bool:
+    def _event_handler(self, event: dict[str, Any]) -> bool:
         """Handle the event from ansible-runner.
 
+        ``ansible-runner`` continues to use the event after the handler returns, it is
+        written to the job events directory and passed to any plugins. Only the top level
+        of the event and its ``event_data`` are updated once the event has been queued, so
+        these are copied rather than deep copying the entire event, which for modules
+        like ``setup`` may contain a large nested result.
+
         Args:
             event: The event from ansible-runner
 
@@ -51,7 +56,9 @@ class CommandAsync(CommandBase):
             The value of ``self._write_job_events``, a boolean
         """
         self._logger.debug("ansible-runner event handle: %s", event)
-        new_event = deepcopy(event)
+        new_event = {**event}
+        if isinstance(event.get("event_data"), dict):
+            new_event["event_data"] = {**event["event_data"]}
         self._queue.put(new_event)
         return self._write_job_events
 
@@ -0,0 +1,234 @@
+"""Run commands in a long-lived execution environment container.
+
+Starting a container for each command adds the container start-up time to every command.
+A command server is a container started once and kept running for the session, commands
+are sent to it and run within the container. The container is started by ansible-runner's
+own command configuration, so a command runs as it would in a container of its own.
+
+A server is started for each distinct container configuration, eg. image, volume mounts
+and environment variables. If a server cannot be started, fails or does not respond in
+time, it is stopped and forgotten, ``None`` is returned and the caller falls back to running
+the command in a container of its own. The next command starts a new server.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import logging
+import os
+import select
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+from pathlib import Path
+from typing import IO
+from typing import Any
+
+from ansible_runner.exceptions import ConfigurationError
+from ansible_runner.interface import init_command_config
+
+from ansible_navigator.utils.packaged_data import retrieve_content
+
+
+SERVER_KEY_ARGS = (
+    "container_image",
+    "container_options",
+    "container_volume_mounts",
+    "container_workdir",
+    "envvars",
+    "host_cwd",
+    "process_isolation_executable",
+)
+"""The runner arguments that configure the container, a server is started for each"""
+
+SHUTDOWN_TIMEOUT = 10
+"""The number of seconds to wait for a server to exit once its stdin is closed"""
+
+RESPONSE_TIMEOUT = 300
+"""The number of seconds to wait for the response to a command before giving up on a server"""
+
+
+class CommandServer:
+    """A long-lived container that runs commands on request."""
+
+    _servers: dict[str, CommandServer] = {}
+    _servers_lock = threading.Lock()
+
+    def __init__(self, runner_args: dict[str, Any]) -> None:
+        """Initialize the command server.
+
+        Args:
+            runner_args: The ansible-runner arguments for the container
+        """
+        self._logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._private_data_dir = tempfile.mkdtemp(prefix="ansible-navigator_")
+        self._stderr: IO[bytes] = tempfile.TemporaryFile()  # noqa: SIM115
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._buffer = bytearray()
+
+        args = {key: runner_args[key] for key in SERVER_KEY_ARGS if key in runner_args}
+        try:
+            config = init_command_config(
+                executable_cmd="python3",
+                cmdline_args=["-c", retrieve_content("command_server.py")],
+                private_data_dir=self._private_data_dir,
+                process_isolation=True,
+                runner_mode="subprocess",
+                **args,
+            ).config
+            if not config.containerized:
+                self._logger.error("Command server requires a container engine")
+                return
+            # As ansible-runner does for a container, the environment variables for the
+            # container are passed in a file and the engine is run from the current directory
+            env_file = Path(config.artifact_dir) / "env.list"
+            env_file.write_text(
+                "\n".join(f"{key}={value}" for key, value in config.env.items()),
+                encoding="utf-8",
+            )
+            self._logger.debug("Starting command server: %s", " ".join(config.command[:-1]))
+            self._proc = subprocess.Popen(
+                config.command,
+                env={**os.environ, **config.env},
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=self._stderr,
+            )
+        except (ConfigurationError, OSError):
+            self._logger.exception("Failed to start command server")
+
+    @classmethod
+    def for_args(cls, runner_args: dict[str, Any]) -> CommandServer:
+        """Get the command server for a container configuration, starting it if needed.
+
+        Args:
+            runner_args: The ansible-runner arguments for the container
+
+        Returns:
+            The command server
+        """
+        key = json.dumps(
+            {key: runner_args.get(key) for key in SERVER_KEY_ARGS},
+            sort_keys=True,
+            default=str,
+        )
+        with cls._servers_lock:
+            server = cls._servers.get(key)
+            if server is None:
+                server = cls._servers[key] = cls(runner_args)
+        return server
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Stop all command servers."""
+        with cls._servers_lock:
+            servers = list(cls._servers.values())
+            cls._servers.clear()
+        for server in servers:
+            server.close()
+
+    @classmethod
+    def _evict(cls, server: CommandServer) -> None:
+        """Forget a server, so the next command for its configuration starts a new one.
+
+        Args:
+            server: The server to forget
+        """
+        with cls._servers_lock:
+            for key, value in list(cls._servers.items()):
+                if value is server:
+                    del cls._servers[key]
+
+    def run(self, executable_cmd: str, cmdline: list[str]) -> tuple[str, str, int] | None:
+        """Run a command in the container.
+
+        Args:
+            executable_cmd: The command to run
+            cmdline: The arguments for the command
+
+        Returns:
+            The output, error and return code of the command, or None if the server failed
+        """
+        with self._lock:
+            response = None
+            if self._proc is not None and self._proc.stdin is not None:
+                request = json.dumps({"command": [executable_cmd, *cmdline]})
+                try:
+                    self._proc.stdin.write(request.encode("utf-8") + b"\n")
+                    self._proc.stdin.flush()
+                    line = self._read_line(deadline=time.monotonic() + RESPONSE_TIMEOUT)
+                    response = json.loads(line)
+                except (OSError, ValueError):
+                    self._stderr.seek(0)
+                    self._logger.exception(
+                        "Command server failed: %s",
+                        self._stderr.read().decode("utf-8", errors="replace"),
+                    )
+            if response is None:
+                self._stop()
+        if response is None:
+            self._evict(self)
+            return None
+        return response["output"], response["error"], response["return_code"]
+
+    def _read_line(self, deadline: float) -> bytes:
+        """Read a line from the server, waiting no later than the deadline.
+
+        Args:
+            deadline: The time, as from time.monotonic(), to stop waiting
+
+        Returns:
+            The line, without the newline
+
+        Raises:
+            OSError: If the deadline passed or the server exited before a line was read
+        """
+        if self._proc is None or self._proc.stdout is None:
+            msg = "Command server is not running"
+            raise OSError(msg)
+        file_descriptor = self._proc.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                msg = f"No response from the command server within {RESPONSE_TIMEOUT} seconds"
+                raise OSError(msg)
+            ready, _, _ = select.select([file_descriptor], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(file_descriptor, 65536)
+            if not chunk:
+                msg = "Command server exited"
+                raise OSError(msg)
+            self._buffer.extend(chunk)
+        line, _, remainder = self._buffer.partition(b"\n")
+        self._buffer = bytearray(remainder)
+        return bytes(line)
+
+    def close(self) -> None:
+        """Stop the command server."""
+        with self._lock:
+            self._stop()
+
+    def _stop(self) -> None:
+        """Stop the container by closing its stdin and clean up."""
+        if self._proc is not None:
+            if self._proc.stdin is not None:
+                with contextlib.suppress(OSError):
+                    self._proc.stdin.close()
+            try:
+                self._proc.wait(timeout=SHUTDOWN_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+            self._proc = None
+        self._stderr.close()
+        shutil.rmtree(self._private_data_dir, ignore_errors=True)
+
+
+atexit.register(CommandServer.close_all)
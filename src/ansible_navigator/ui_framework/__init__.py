@@ -1,5 +1,8 @@
 """Initialization file for the ui_framework."""
 
+from ansible_navigator.utils.log_tail import AppendOnlyLines
+
+from .colorize import AnsiLines
 from .curses_defs import CursesLine
 from .curses_defs import CursesLinePart
 from .curses_defs import CursesLines
@@ -21,6 +24,8 @@ from .ui_constants import Decoration
 
 __all__ = (
     "Action",
+    "AnsiLines",
+    "AppendOnlyLines",
     "Color",
     "Content",
     "CursesLine",
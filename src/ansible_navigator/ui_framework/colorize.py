@@ -3,18 +3,23 @@
 
 from __future__ import annotations
 
+import bisect
 import colorsys
 import copy
 import curses
 import functools
 import json
 import logging
+import operator
 import re
 
+from collections.abc import Sequence
 from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import SupportsIndex
+from typing import overload
 
 from ansible_navigator.tm_tokenize.grammars import Grammars
 from ansible_navigator.tm_tokenize.tokenize import tokenize
@@ -29,7 +34,9 @@ from .ui_constants import Decoration
 
 
 if TYPE_CHECKING:
+    from ansible_navigator.tm_tokenize.compiler import Compiler
     from ansible_navigator.tm_tokenize.region import Regions
+    from ansible_navigator.tm_tokenize.state import State
     from ansible_navigator.utils.compatibility import Traversable
 
 
@@ -45,6 +52,12 @@ CURSES_STYLES = {
     8: getattr(curses, "A_INVIS", None),
 }
 
+CHECKPOINT_INTERVAL = 500
+"""The number of lines between tokenizer state checkpoints kept for a document"""
+
+RENDERED_CACHE_SIZE = 5000
+"""The number of rendered lines kept for a document before they are discarded"""
+
 
 class ColorSchema:
     """A storage mechanism for the schema (theme)."""
@@ -138,47 +151,200 @@ class Colorize:
         Returns:
             A list of lines, each a list of dicts
         """
+        rendered = self.render_lines(lines=doc.splitlines(), scope=scope)
+        assembled = rendered[:]
+        if rendered.colored and scope == "text.html.markdown":
+            assembled = strip_markdown(assembled)
+        return assembled
+
+    @functools.lru_cache(maxsize=100)  # noqa: B019
+    def render_lazy(self, doc: str, scope: str) -> Sequence[list[SimpleLinePart]]:
+        """Render text lines into lines of columns and colors as they are accessed.
+
+        Markdown is rendered in full, removing the markdown changes the number of lines.
+
+        Args:
+            doc: The string to split, tokenize and color
+            scope: The scope, aka the format of the string
+
+        Returns:
+            A sequence of lines, each a list of line parts
+        """
+        if scope == "text.html.markdown":
+            return self.render(doc=doc, scope=scope)
+        return self.render_lines(lines=doc.splitlines(), scope=scope)
+
+    def render_lines(self, lines: list[str], scope: str) -> RenderedLines:
+        """Prepare lines of text for rendering as they are accessed.
+
+        Lines appended to the list later are rendered as they are accessed.
+
+        Args:
+            lines: The lines of text to tokenize and color
+            scope: The scope, aka the format of the lines
+
+        Returns:
+            The lines, rendered as they are accessed
+        """
         try:
             compiler = self._grammars.compiler_for_scope(scope)
         except KeyError:
             compiler = None
+        if scope == "no_color":
+            compiler = None
+        return RenderedLines(lines=lines, scope=scope, compiler=compiler, schema=self._schema)
 
-        if compiler and scope != "no_color":
-            state = compiler.root_state
-            lines = []
-            for line_idx, line in enumerate(doc.splitlines()):
-                line += "\n"
-                first_line = line_idx == 0
-                try:
-                    state, regions = tokenize(compiler, state, line, first_line)
-                except Exception as exc:  # noqa: BLE001
-                    self._logger.critical(
-                        (
-                            "An unexpected error occurred within the tokenization"
-                            " subsystem.  Please log an issue with the following:"
-                        ),
-                    )
-                    self._logger.critical(
-                        "  Err: '%s', Scope: '%s', Line follows....",
-                        str(exc),
-                        scope,
-                    )
-                    self._logger.critical("  '%s'", line)
-                    self._logger.critical("  The current content will be rendered without color")
-                    break
-                else:
-                    lines.append((regions, line))
-            else:
-                assembled = columns_and_colors(lines, self._schema)
-                if scope == "text.html.markdown":
-                    assembled = strip_markdown(assembled)
-                return assembled
 
-        res = [
-            [SimpleLinePart(column=0, chars=doc_line, color=None, style=None)]
-            for doc_line in doc.splitlines()
-        ]
-        return res
+class RenderedLines(Sequence[list[SimpleLinePart]]):
+    """The lines of a document, tokenized and colored only as they are accessed.
+
+    Tokenizing a line depends on the state left by the lines before it, so the state is
+    kept every ``CHECKPOINT_INTERVAL`` lines and after the last line tokenized. Accessing
+    a range of lines resumes from the nearest of these before it rather than the start of
+    the document. Lines may be appended to the list of lines after it has been rendered.
+    """
+
+    def __init__(
+        self,
+        lines: list[str],
+        scope: str,
+        compiler: Compiler | None,
+        schema: ColorSchema,
+    ) -> None:
+        """Initialize the rendered lines.
+
+        Args:
+            lines: The lines of text to tokenize and color
+            scope: The scope, aka the format of the lines
+            compiler: The grammar compiler for the scope, None to render without color
+            schema: The color schema
+        """
+        self._logger = logging.getLogger(__name__)
+        self._lines = lines
+        self._scope = scope
+        self._compiler = compiler
+        self._schema = schema
+        self._checkpoints: list[State] = [] if compiler is None else [compiler.root_state]
+        self._resume: tuple[int, State] | None = None
+        self._rendered: dict[int, list[SimpleLinePart]] = {}
+
+    @property
+    def colored(self) -> bool:
+        """Determine if the lines are colored.
+
+        Returns:
+            False if there is no grammar for the scope or tokenization failed
+        """
+        return self._compiler is not None
+
+    def __len__(self) -> int:
+        """Provide the number of lines.
+
+        Returns:
+            The number of lines
+        """
+        return len(self._lines)
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> list[SimpleLinePart]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[list[SimpleLinePart]]: ...
+
+    def __getitem__(
+        self,
+        index: SupportsIndex | slice,
+    ) -> list[SimpleLinePart] | list[list[SimpleLinePart]]:
+        """Render one line or a range of lines.
+
+        Args:
+            index: The index of the line or a slice of lines
+
+        Raises:
+            IndexError: If the line index is out of range
+
+        Returns:
+            The line, or a list of lines for a slice
+        """
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self._lines)))
+            if indices:
+                self._render(start=min(indices), stop=max(indices) + 1)
+            return [self._line(line_idx) for line_idx in indices]
+
+        line_idx = operator.index(index)
+        if line_idx < 0:
+            line_idx += len(self._lines)
+        if not 0 <= line_idx < len(self._lines):
+            msg = "line index out of range"
+            raise IndexError(msg)
+        self._render(start=line_idx, stop=line_idx + 1)
+        return self._line(line_idx)
+
+    def _line(self, line_idx: int) -> list[SimpleLinePart]:
+        """Get a rendered line, or the line without color if it could not be tokenized.
+
+        Args:
+            line_idx: The index of the line
+
+        Returns:
+            The line parts
+        """
+        try:
+            return self._rendered[line_idx]
+        except KeyError:
+            return [SimpleLinePart(column=0, chars=self._lines[line_idx], color=None, style=None)]
+
+    def _render(self, start: int, stop: int) -> None:
+        """Tokenize and color a range of lines not yet rendered.
+
+        Args:
+            start: The index of the first line
+            stop: The index after the last line
+        """
+        if self._compiler is None:
+            return
+        missing = [line_idx for line_idx in range(start, stop) if line_idx not in self._rendered]
+        if not missing:
+            return
+        start, stop = missing[0], missing[-1] + 1
+        if len(self._rendered) + stop - start > RENDERED_CACHE_SIZE:
+            self._rendered.clear()
+
+        checkpoint = min(start // CHECKPOINT_INTERVAL, len(self._checkpoints) - 1)
+        resume_idx, state = checkpoint * CHECKPOINT_INTERVAL, self._checkpoints[checkpoint]
+        if self._resume is not None and resume_idx < self._resume[0] <= start:
+            resume_idx, state = self._resume
+        lines = []
+        for line_idx in range(resume_idx, stop):
+            if line_idx == len(self._checkpoints) * CHECKPOINT_INTERVAL:
+                self._checkpoints.append(state)
+            line = self._lines[line_idx] + "\n"
+            try:
+                state, regions = tokenize(self._compiler, state, line, line_idx == 0)
+            except Exception as exc:  # noqa: BLE001
+                self._logger.critical(
+                    (
+                        "An unexpected error occurred within the tokenization"
+                        " subsystem.  Please log an issue with the following:"
+                    ),
+                )
+                self._logger.critical(
+                    "  Err: '%s', Scope: '%s', Line follows....",
+                    str(exc),
+                    self._scope,
+                )
+                self._logger.critical("  '%s'", line)
+                self._logger.critical("  The current content will be rendered without color")
+                self._compiler = None
+                self._rendered.clear()
+                return
+            if line_idx >= start:
+                lines.append((regions, line))
+
+        self._resume = (stop, state)
+        assembled = columns_and_colors(lines, self._schema)
+        self._rendered.update(enumerate(assembled, start=start))
 
 
 def scope_to_list(scope: str | list[Any]) -> list[Any]:
@@ -291,6 +457,10 @@ def columns_and_colors(
 ) -> list[list[SimpleLinePart]]:
     """Convert to colors and columns.
 
+    The region boundaries split each line into segments. Each region colors and styles
+    the segments it spans, with later regions taking precedence, and adjacent segments
+    of like color and style are merged into one part.
+
     Args:
         lines: Lines of text and their regions
         schema: An instance of the ColorSchema
@@ -300,42 +470,48 @@ def columns_and_colors(
     """
     results: list[list[SimpleLinePart]] = []
 
-    for line in lines:
-        # Break the into 1 character parts, temporarily set the column to 0
-        line_parts = [
-            SimpleLinePart(chars=character, color=None, column=0, style=None)
-            for character in line[1]
-        ]
+    for regions, text in lines:
+        boundaries = sorted(
+            {0, len(text)}.union(*((region.start, region.end) for region in regions)),
+        )
+        colors: list[RgbTuple | None] = [None] * (len(boundaries) - 1)
+        styles: list[str | None] = [None] * (len(boundaries) - 1)
 
-        # Replace the color with the RgbTuple
-        for region in line[0]:
+        for region in regions:
             color, style = schema.get_color_and_style(region.scope)
-            if color:
-                for idx in range(region.start, region.end):
-                    line_parts[idx].color = color
-            if style:
-                for idx in range(region.start, region.end):
-                    line_parts[idx].style = style
-
-        # Compress the line, grouping characters of like color and decoration
+            if not color and not style:
+                continue
+            first = bisect.bisect_left(boundaries, region.start)
+            last = bisect.bisect_left(boundaries, region.end, lo=first)
+            for segment in range(first, last):
+                if color:
+                    colors[segment] = color
+                if style:
+                    styles[segment] = style
+
+        # Group segments of like color and decoration, the column is where the part starts
+        line_parts: list[SimpleLinePart] = []
+        part_start = 0
+        for segment in range(1, len(boundaries)):
+            if (
+                segment == len(boundaries) - 1
+                or colors[segment] != colors[part_start]
+                or styles[segment] != styles[part_start]
+            ):
+                line_parts.append(
+                    SimpleLinePart(
+                        chars=text[boundaries[part_start] : boundaries[segment]],
+                        color=colors[part_start],
+                        column=boundaries[part_start],
+                        style=styles[part_start],
+                    ),
+                )
+                part_start = segment
+
         if line_parts:
-            grouped = [line_parts.pop(0)]
-            while line_parts:
-                entry = line_parts.pop(0)
-                if entry.color == grouped[-1].color and entry.style == grouped[-1].style:
-                    grouped[-1].chars += entry.chars
-                else:
-                    grouped.append(entry)
-            results.append(grouped)
+            results.append(line_parts)
         else:
-            results.append([SimpleLinePart(chars=line[1], color=None, column=0, style=None)])
-
-    # Update the column in each line part, based on the total of the preceding text lengths
-    for result in results:
-        column = 0
-        for line_part in result:
-            line_part.column = column
-            column += len(line_part.chars)
+            results.append([SimpleLinePart(chars=text, color=None, column=0, style=None)])
 
     return results
 
@@ -410,6 +586,85 @@ def ansi_to_curses(line: str) -> CursesLine:
     return CursesLine(tuple(printable))
 
 
+class AnsiLines(Sequence[CursesLine]):
+    """Lines of ansi colored text, converted into curses lines as they are accessed.
+
+    The lines are appended to as output arrives. Converted lines are kept, so only the
+    lines appended since they were last accessed are converted.
+    """
+
+    def __init__(self, lines: list[str]) -> None:
+        """Initialize the ansi lines.
+
+        Args:
+            lines: The lines of text, appended to by the caller
+        """
+        self._lines = lines
+        self._converted: list[CursesLine] = []
+
+    def __len__(self) -> int:
+        """Provide the number of lines.
+
+        Returns:
+            The number of lines
+        """
+        return len(self._lines)
+
+    def __str__(self) -> str:
+        """Provide the text of the lines.
+
+        Returns:
+            The lines joined as one string
+        """
+        return "\n".join(self._lines)
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> CursesLine: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CursesLines: ...
+
+    def __getitem__(self, index: SupportsIndex | slice) -> CursesLine | CursesLines:
+        """Convert and provide one line or a range of lines.
+
+        Args:
+            index: The index of the line or a slice of lines
+
+        Raises:
+            IndexError: If the line index is out of range
+
+        Returns:
+            The line, or the lines for a slice
+        """
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self._lines)))
+            if indices:
+                self._convert(stop=max(indices) + 1)
+            return CursesLines(tuple(self._converted[line_idx] for line_idx in indices))
+
+        line_idx = operator.index(index)
+        if line_idx < 0:
+            line_idx += len(self._lines)
+        if not 0 <= line_idx < len(self._lines):
+            msg = "line index out of range"
+            raise IndexError(msg)
+        self._convert(stop=line_idx + 1)
+        return self._converted[line_idx]
+
+    def _convert(self, stop: int) -> None:
+        """Convert the lines not yet converted, up to an index.
+
+        Args:
+            stop: The index after the last line to convert
+        """
+        if len(self._converted) > len(self._lines):
+            # The lines were cleared and are being appended to again
+            self._converted.clear()
+        self._converted.extend(
+            ansi_to_curses(line) for line in self._lines[len(self._converted) : stop]
+        )
+
+
 def strip_markdown(lines: list[list[SimpleLinePart]]) -> list[list[SimpleLinePart]]:
     """Strip some markdown from the regions.
 
@@ -20,15 +20,20 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import NamedTuple
 from typing import Protocol
+from typing import SupportsIndex
+from typing import overload
 
 from ansible_navigator.content_defs import ContentFormat
 from ansible_navigator.content_defs import ContentType
 from ansible_navigator.content_defs import ContentTypeSequence
 from ansible_navigator.content_defs import ContentView
 from ansible_navigator.utils.functions import templar
+from ansible_navigator.utils.log_tail import AppendOnlyLines
 from ansible_navigator.utils.serialize import serialize
 
+from .colorize import AnsiLines
 from .colorize import Colorize
+from .colorize import RenderedLines
 from .colorize import rgb_to_ansi
 from .curses_defs import CursesLine
 from .curses_defs import CursesLinePart
@@ -65,10 +70,32 @@ class Action(NamedTuple):
     match: Match[str]
 
 
-class Content(NamedTuple):
-    """what's on the screen, when showing content."""
+class Content:
+    """what's on the screen, when showing content.
 
-    showing: Any
+    Lines of output are only joined into a single string when read.
+    """
+
+    def __init__(self, showing: Any) -> None:
+        """Initialize the content.
+
+        Args:
+            showing: The object being shown
+        """
+        self._showing = showing
+
+    @property
+    def showing(self) -> Any:
+        """Get the object being shown, with lines of output joined.
+
+        Returns:
+            The object being shown
+        """
+        if isinstance(self._showing, AnsiLines):
+            self._showing = str(self._showing)
+        elif isinstance(self._showing, AppendOnlyLines):
+            self._showing = "\n".join(self._showing)
+        return self._showing
 
 
 class Menu(NamedTuple):
@@ -145,6 +172,51 @@ class Interaction(NamedTuple):
     menu: Menu | None = None
 
 
+class ColoredLines(Sequence[CursesLine]):
+    """Rendered lines, colored and decorated for curses as they are shown."""
+
+    def __init__(
+        self,
+        lines: Sequence[list[SimpleLinePart]],
+        color_decorate: Callable[[list[list[SimpleLinePart]]], CursesLines],
+    ) -> None:
+        """Initialize the colored lines.
+
+        Args:
+            lines: The rendered lines
+            color_decorate: The function used to color and decorate a list of lines
+        """
+        self._lines = lines
+        self._color_decorate = color_decorate
+
+    def __len__(self) -> int:
+        """Provide the number of lines.
+
+        Returns:
+            The number of lines
+        """
+        return len(self._lines)
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> CursesLine: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> CursesLines: ...
+
+    def __getitem__(self, index: SupportsIndex | slice) -> CursesLine | CursesLines:
+        """Color and decorate one line or a range of lines.
+
+        Args:
+            index: The index of the line or a slice of lines
+
+        Returns:
+            The line, or the lines for a slice
+        """
+        if isinstance(index, slice):
+            return self._color_decorate(list(self._lines[index]))
+        return self._color_decorate([self._lines[index]])[0]
+
+
 class UserInterface(CursesWindow):
     # pylint: disable=too-many-instance-attributes
     # pylint: disable=too-many-arguments
@@ -188,6 +260,7 @@ class UserInterface(CursesWindow):
         self._menu_indices: tuple[int, ...] = ()
 
         self._progress_bar_width = progress_bar_width
+        self._append_only_rendered: tuple[AppendOnlyLines, str, RenderedLines] | None = None
         self._status_width = status_width
         self._prefix_color = 8
         self._refresh = [refresh]
@@ -313,7 +386,9 @@ class UserInterface(CursesWindow):
             The footer line
         """
         column_widths = [len(f"{k!s}: {v!s}") for k, v in key_dict.items()]
-        status_width = self._progress_bar_width if self._status else 0
+        # A status too long for the status indicator widens it
+        extra_width = max(0, len(self._status) + 1 - self._status_width)
+        status_width = self._progress_bar_width + extra_width if self._status else 0
         gap = floor((self._screen_width - status_width - sum(column_widths)) / len(key_dict))
         adjusted_column_widths = [c + gap for c in column_widths]
         col_starts = [0]
@@ -344,13 +419,13 @@ class UserInterface(CursesWindow):
             # place the status to the far right -1 for the scrollbar
             # center place the uneven extra on the right, so flip it twice
             status = self._status.capitalize()
-            status = status[0 : self._status_width - 1]  # max
+            status = status[0 : self._status_width + extra_width - 1]  # max
             status = status[::-1]  # reverse
-            status = status.center(self._status_width)  # pad
+            status = status.center(self._status_width + extra_width)  # pad
             status = status[::-1]  # reverse
             footer.append(
                 CursesLinePart(
-                    column=self._screen_width - self._status_width - 1,
+                    column=self._screen_width - self._status_width - extra_width - 1,
                     string=status,
                     color=self._status_color,
                     decoration=curses.A_REVERSE,
@@ -579,9 +654,11 @@ class UserInterface(CursesWindow):
         self._show_form(warning_notification(msgs))
         return None, None
 
-    def _serialize_color(self, obj: Any) -> CursesLines:
+    def _serialize_color(self, obj: Any) -> Sequence[CursesLine]:
         """Serialize, if necessary and color an obj.
 
+        Lines are tokenized, colored and decorated as they are shown.
+
         Args:
             obj: the object to color
 
@@ -589,8 +666,20 @@ class UserInterface(CursesWindow):
             The generated lines
         """
         if self.content_format() is ContentFormat.ANSI:
+            if isinstance(obj, AnsiLines):
+                return obj
             return self._colorizer.render_ansi(doc=obj)
 
+        scope = "no_color"
+        if self._ui_config.color:
+            scope = self.content_format().value.scope
+
+        if isinstance(obj, AppendOnlyLines):
+            return ColoredLines(
+                lines=self._render_append_only(lines=obj, scope=scope),
+                color_decorate=self._cache_and_color_decorate_lines,
+            )
+
         content_view = ContentView.NORMAL if self._hide_keys else ContentView.FULL
         current_format = self.content_format()
         if current_format.value.serialization:
@@ -602,13 +691,38 @@ class UserInterface(CursesWindow):
         else:
             string = obj
 
-        scope = "no_color"
-        if self._ui_config.color:
-            scope = self.content_format().value.scope
+        rendered = self._colorizer.render_lazy(doc=string, scope=scope)
+        return ColoredLines(lines=rendered, color_decorate=self._cache_and_color_decorate_lines)
 
-        rendered = self._colorizer.render(doc=string, scope=scope)
-        self._cache_init_colors(rendered)
-        return self._color_decorate_lines(rendered)
+    def _render_append_only(self, lines: AppendOnlyLines, scope: str) -> RenderedLines:
+        """Render append only lines, reusing the lines rendered when last shown.
+
+        Args:
+            lines: The lines to render
+            scope: The scope, aka the format of the lines
+
+        Returns:
+            The lines, rendered as they are accessed
+        """
+        if self._append_only_rendered is not None:
+            previous_lines, previous_scope, rendered = self._append_only_rendered
+            if previous_lines is lines and previous_scope == scope:
+                return rendered
+        rendered = self._colorizer.render_lines(lines=lines, scope=scope)
+        self._append_only_rendered = (lines, scope, rendered)
+        return rendered
+
+    def _cache_and_color_decorate_lines(self, lines: list[list[SimpleLinePart]]) -> CursesLines:
+        """Cache and init the colors of the lines, then color and decorate them.
+
+        Args:
+            lines: The lines to transform
+
+        Returns:
+            All lines colored
+        """
+        self._cache_init_colors(lines)
+        return self._color_decorate_lines(lines)
 
     def _cache_init_colors(self, lines: list[list[SimpleLinePart]]) -> None:
         """Cache and init the unique colors for future use.
@@ -695,7 +809,10 @@ class UserInterface(CursesWindow):
             decoration=decoration,
         )
 
-    def _filter_and_serialize(self, obj: Any) -> tuple[CursesLines | None, CursesLines]:
+    def _filter_and_serialize(
+        self,
+        obj: Any,
+    ) -> tuple[CursesLines | None, Sequence[CursesLine]]:
         """Filter an obj and serialize.
 
         Args:
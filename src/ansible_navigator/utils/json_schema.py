@@ -18,6 +18,8 @@ from .definitions import ExitMessage
 if TYPE_CHECKING:
     from collections import deque
 
+    from jsonschema.protocols import Validator
+
 
 def to_path(schema_path: deque[Any]) -> str:
     """Flatten a path to a dot delimited string.
@@ -117,7 +119,36 @@ def validate(schema: str | dict[str, Any], data: dict[str, Any]) -> list[JsonSch
         errors.append(error)
         return errors
 
-    validation_errors = sorted(validator(schema).iter_errors(data), key=lambda e: e.path)
+    return validate_with(validator=validator(schema), data=data)
+
+
+def compile_validator(schema: dict[str, Any]) -> Validator:
+    """Create a validator for a JSON schema, without checking the schema.
+
+    The validator can be reused to validate any number of documents. This is intended for
+    a schema which is known to be valid, eg. one built from the application's own schema.
+
+    Args:
+        schema: The JSON schema
+
+    Returns:
+        The validator
+    """
+    return validator_for(schema)(schema)
+
+
+def validate_with(validator: Validator, data: dict[str, Any]) -> list[JsonSchemaError]:
+    """Validate some data with a validator.
+
+    Args:
+        validator: The validator for the JSON schema
+        data: The data to validate
+
+    Returns:
+        Any errors encountered
+    """
+    errors: list[JsonSchemaError] = []
+    validation_errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
 
     if not validation_errors:
         return errors
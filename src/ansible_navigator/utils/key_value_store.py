@@ -1,21 +1,38 @@
-"""An interface to use a sqlite database as a key-value store."""
+"""An interface to use a sqlite database as a key-value store.
+
+A database only used on this host can be used in write-ahead log mode. Readers are not
+blocked by a writer, and a transaction is committed without syncing the database file.
+The write-ahead log relies on shared memory, so a database also used from within an
+execution environment, through a bind mount, keeps the default rollback journal.
+"""
 
 from __future__ import annotations
 
+import copy
 import sqlite3
 
 from collections.abc import ItemsView
 from collections.abc import Iterator
 from collections.abc import KeysView
+from collections.abc import Mapping
 from collections.abc import MutableMapping
 from collections.abc import ValuesView
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
 
+WRITE_AHEAD_LOG_PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL")
+"""The pragmas set for each connection to a database used in write-ahead log mode"""
+
+MAX_VARIABLES = 500
+"""The number of keys looked up in one statement, below sqlite's limit of 999 variables"""
+
+
 class KVSKeysView(KeysView[str]):
     """A glorified KeysView specific to, and returned by, methods in KeyValueStore."""
 
@@ -31,16 +48,174 @@ class KVSValuesView(ValuesView[str]):
 class KeyValueStore(MutableMapping[str, str]):
     """An interface to use a sqlite database as a key-value store."""
 
-    def __init__(self, filename: str | Path) -> None:
+    def __init__(
+        self,
+        filename: str | Path,
+        table: str = "kv",
+        write_ahead_log: bool = False,
+    ) -> None:
         """Initialize the key-value store.
 
         Args:
             filename: The full path to the sqlite database file
+            table: The name of the table, several key-value stores can share a database
+            write_ahead_log: Use the database in write-ahead log mode, only for a database
+                not shared with an execution environment
+
+        Raises:
+            ValueError: If the table name is not an identifier
         """
         self._path = str(filename)
-        self.conn = sqlite3.connect(self._path)
+        self._write_ahead_log = write_ahead_log
+        self._transactions: list[KeyValueStore] = []
+        self.conn = self._connect()
+        self._use_table(table)
+
+    def _use_table(self, table: str) -> None:
+        """Use a table for the key-value store, creating it if needed.
+
+        Args:
+            table: The name of the table
+
+        Raises:
+            ValueError: If the table name is not an identifier
+        """
+        if not table.isidentifier():
+            msg = f"Invalid key-value store table name: {table}"
+            raise ValueError(msg)
+        self._table = table
+        self._execute("CREATE TABLE IF NOT EXISTS {table} (key text unique, value text)")
+
+    def table(self, table: str) -> KeyValueStore:
+        """Provide a key-value store for another table, sharing this store's connection.
+
+        Changes to both tables can be grouped in one transaction of either store, and the
+        connection is closed when either store is closed.
+
+        Args:
+            table: The name of the other table
+
+        Returns:
+            The key-value store for the other table
+        """
+        other = copy.copy(self)
+        other._use_table(table)  # noqa: SLF001
+        return other
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the database and set the pragmas for the connection.
+
+        Returns:
+            A connection to the database
+        """
+        conn = sqlite3.connect(self._path)
+        if self._write_ahead_log:
+            for pragma in WRITE_AHEAD_LOG_PRAGMAS:
+                conn.execute(pragma)
+        return conn
+
+    def _execute(self, statement: str, parameters: tuple[str, ...] = ()) -> sqlite3.Cursor:
+        """Execute a statement against the key-value store's table.
+
+        sqlite caches the prepared statement for each statement's text, so statements are
+        only prepared the first time they are executed.
+
+        Args:
+            statement: The statement, with a ``{table}`` placeholder for the table name and
+                a ``{placeholders}`` placeholder for one parameter marker per parameter
+            parameters: The parameters for the statement
+
+        Returns:
+            The cursor used to execute the statement
+        """
         cursor = self.conn.cursor()
-        cursor.execute("CREATE TABLE IF NOT EXISTS kv (key text unique, value text)")
+        placeholders = ",".join("?" * len(parameters))
+        return cursor.execute(
+            statement.format(table=self._table, placeholders=placeholders),
+            parameters,
+        )
+
+    @contextmanager
+    def transaction(self) -> Iterator[KeyValueStore]:
+        """Group changes to the key-value store in a transaction.
+
+        The transaction is committed when the context exits, or rolled back if an
+        exception is raised. A transaction started while another is in progress on the same
+        connection is part of the one in progress.
+
+        Yields:
+            The key-value store
+        """
+        if self._transactions:
+            yield self
+            return
+        self._transactions.append(self)
+        try:
+            with self.conn:
+                yield self
+        finally:
+            self._transactions.pop()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Return the values for several keys from the key-value store.
+
+        Args:
+            keys: The keys to find
+
+        Returns:
+            The value for each key found, keys that do not exist are omitted
+        """
+        found: dict[str, str] = {}
+        for chunk in self._chunks(keys):
+            statement = "SELECT key, value FROM {table} WHERE key IN ({placeholders})"
+            found.update(self._execute(statement, chunk).fetchall())
+        return found
+
+    def contains_many(self, keys: Iterable[str]) -> set[str]:
+        """Check which of several keys are in the key-value store.
+
+        Args:
+            keys: The keys to search for
+
+        Returns:
+            The keys that exist in the key-value store
+        """
+        found: set[str] = set()
+        for chunk in self._chunks(keys):
+            statement = "SELECT key FROM {table} WHERE key IN ({placeholders})"
+            found.update(row[0] for row in self._execute(statement, chunk))
+        return found
+
+    def set_many(self, items: Mapping[str, str] | Iterable[tuple[str, str]]) -> None:
+        """Place several key-value combinations in the key-value store in one transaction.
+
+        Args:
+            items: The key-value combinations to set
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        statement = "REPLACE INTO {table} (key, value) VALUES (?,?)"
+        with self.transaction():
+            self.conn.executemany(statement.format(table=self._table), items)
+
+    @staticmethod
+    def _chunks(keys: Iterable[str]) -> Iterator[tuple[str, ...]]:
+        """Split keys into chunks small enough to be looked up in one statement.
+
+        Args:
+            keys: The keys
+
+        Yields:
+            Each chunk of keys
+        """
+        chunk: list[str] = []
+        for key in keys:
+            chunk.append(key)
+            if len(chunk) == MAX_VARIABLES:
+                yield tuple(chunk)
+                chunk = []
+        if chunk:
+            yield tuple(chunk)
 
     @property
     def path(self) -> str:
@@ -62,7 +237,7 @@ class KeyValueStore(MutableMapping[str, str]):
         Returns:
             A connection to the database
         """
-        self.conn = sqlite3.connect(self.path)
+        self.conn = self._connect()
         return self.conn
 
     def __len__(self) -> int:
@@ -74,8 +249,7 @@ class KeyValueStore(MutableMapping[str, str]):
         Raises:
             TypeError: If there is a typing error.
         """
-        cursor = self.conn.cursor()
-        rows = cursor.execute("SELECT COUNT(*) FROM kv").fetchone()[0]
+        rows = self._execute("SELECT COUNT(*) FROM {table}").fetchone()[0]
         if not isinstance(rows, int):
             raise TypeError
         return rows if rows is not None else 0
@@ -86,8 +260,7 @@ class KeyValueStore(MutableMapping[str, str]):
         Yields:
             The keys in the key-value store
         """
-        cursor = self.conn.cursor()
-        for row in cursor.execute("SELECT key FROM kv"):
+        for row in self._execute("SELECT key FROM {table}"):
             yield row[0]
 
     def itervalues(self) -> Iterator[str]:
@@ -96,8 +269,7 @@ class KeyValueStore(MutableMapping[str, str]):
         Yields:
             The values in the key-value store
         """
-        cursor = self.conn.cursor()
-        for row in cursor.execute("SELECT value FROM kv"):
+        for row in self._execute("SELECT value FROM {table}"):
             yield row[0]
 
     def iteritems(self) -> Iterator[tuple[str, str]]:
@@ -106,8 +278,7 @@ class KeyValueStore(MutableMapping[str, str]):
         Yields:
             The key-value store as items (key, value)
         """
-        cursor = self.conn.cursor()
-        for row in cursor.execute("SELECT key, value FROM kv"):
+        for row in self._execute("SELECT key, value FROM {table}"):
             yield row[0], row[1]
 
     def keys(self) -> KVSKeysView:
@@ -151,8 +322,7 @@ class KeyValueStore(MutableMapping[str, str]):
             An indication of the provided key's existence in the key-
             value store
         """
-        cursor = self.conn.cursor()
-        return cursor.execute("SELECT 1 FROM kv WHERE key = ?", (key,)).fetchone() is not None
+        return self._execute("SELECT 1 FROM {table} WHERE key = ?", (key,)).fetchone() is not None
 
     def __getitem__(self, key: str) -> str:
         """Return a value from the key-value store given a key.
@@ -166,8 +336,7 @@ class KeyValueStore(MutableMapping[str, str]):
         Returns:
             The value for the key provided
         """
-        cursor = self.conn.cursor()
-        item = cursor.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        item = self._execute("SELECT value FROM {table} WHERE key = ?", (key,)).fetchone()
         if item is None:
             raise KeyError(key)
         return item[0]
@@ -179,8 +348,7 @@ class KeyValueStore(MutableMapping[str, str]):
             key: The key of the combination to set
             value: The value of the combination to set
         """
-        cursor = self.conn.cursor()
-        cursor.execute("REPLACE INTO kv (key, value) VALUES (?,?)", (key, value))
+        self._execute("REPLACE INTO {table} (key, value) VALUES (?,?)", (key, value))
 
     def __delitem__(self, key: str) -> None:
         """Delete a key-value combination in the key-value store.
@@ -194,8 +362,7 @@ class KeyValueStore(MutableMapping[str, str]):
         """
         if key not in self:
             raise KeyError(key)
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM kv WHERE key = ?", (key,))
+        self._execute("DELETE FROM {table} WHERE key = ?", (key,))
 
     def __iter__(self) -> Iterator[str]:
         """Yield values extracted from the key-value store one by one.
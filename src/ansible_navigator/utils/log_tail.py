@@ -0,0 +1,233 @@
+"""Follow a growing log file, keeping a window of its most recent lines in memory.
+
+Only the bytes appended to the file since it was last read are read. The window of lines
+is capped, older lines can be paged in from the file on request. If the file is replaced,
+eg. rotated, or truncated, the window is reloaded from the end of the file.
+
+The last lines of a file can also be read once, bounded by both a number of lines and a
+number of bytes.
+"""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+WINDOW_LINES = 10000
+"""The number of lines kept in memory, more are kept after paging in older lines"""
+
+TRIM_LINES = 1000
+"""The number of lines beyond the window collected before the oldest are dropped"""
+
+READ_BLOCK_SIZE = 64 * 1024
+"""The number of bytes read at a time when reading backwards through the file"""
+
+
+class AppendOnlyLines(list[str]):
+    """Lines of text that are only appended to, eg. those read from a growing file.
+
+    When shown, lines already rendered are kept and only the lines appended since are
+    rendered. To change or remove lines, replace the instance.
+    """
+
+
+class LogTail:
+    """A window of lines from the end of a log file, updated as the file grows."""
+
+    def __init__(self, file: Path, window: int = WINDOW_LINES) -> None:
+        """Initialize the log tail.
+
+        Args:
+            file: The log file
+            window: The number of lines to keep in memory
+        """
+        self.file = file
+        self.lines = AppendOnlyLines()
+        self._sizes: list[int] = []
+        self._window_size = window
+        self._window = window
+        self._inode: int | None = None
+        self._start = 0
+        self._offset = 0
+        self._partial = b""
+
+    @property
+    def at_start(self) -> bool:
+        """Determine if the window starts at the beginning of the file.
+
+        Returns:
+            True if there are no older lines to page in
+        """
+        return self._start == 0
+
+    def update(self, trim: bool = True) -> int:
+        """Read the lines appended to the file since it was last read.
+
+        Args:
+            trim: Drop the oldest lines beyond the window, replacing the window
+
+        Returns:
+            The number of lines appended to the window, the window is replaced if the file
+            was replaced or truncated
+        """
+        try:
+            stat = self.file.stat()
+        except FileNotFoundError:
+            # Between the rotation of the file and the creation of a new one
+            return 0
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reload(inode=stat.st_ino, size=stat.st_size)
+            return len(self.lines)
+
+        complete: list[bytes] = []
+        if stat.st_size > self._offset:
+            with self.file.open(mode="rb") as file_handle:
+                file_handle.seek(self._offset)
+                data = file_handle.read(stat.st_size - self._offset)
+            self._offset += len(data)
+            *complete, self._partial = (self._partial + data).split(b"\n")
+            self._append(complete)
+
+        if trim and len(self.lines) > self._window + TRIM_LINES:
+            self._trim()
+        return len(complete)
+
+    def read_older(self, count: int = WINDOW_LINES) -> int:
+        """Page in older lines from the file, before those in the window.
+
+        The window is replaced and grows by the number of lines read.
+
+        Args:
+            count: The number of older lines to read
+
+        Returns:
+            The number of lines read
+        """
+        older, _tail = self._read_before_start(count)
+        if older:
+            self.lines = AppendOnlyLines(self._decode(older) + self.lines)
+            self._sizes = [len(line) + 1 for line in older] + self._sizes
+            self._window += len(older)
+        return len(older)
+
+    def _reload(self, inode: int, size: int) -> None:
+        """Reload the window from the end of the file.
+
+        Args:
+            inode: The inode of the file
+            size: The size of the file
+        """
+        self._inode = inode
+        self._start = self._offset = size
+        self._window = self._window_size
+        self.lines = AppendOnlyLines()
+        self._sizes = []
+        lines, self._partial = self._read_before_start(self._window)
+        self._append(lines)
+
+    def _append(self, lines: list[bytes]) -> None:
+        """Append complete lines read from the file to the window.
+
+        Args:
+            lines: The lines, without their newlines
+        """
+        self.lines.extend(self._decode(lines))
+        self._sizes.extend(len(line) + 1 for line in lines)
+
+    @staticmethod
+    def _decode(lines: list[bytes]) -> list[str]:
+        """Decode lines read from the file.
+
+        Args:
+            lines: The lines
+
+        Returns:
+            The decoded lines
+        """
+        return [line.decode("utf-8", errors="replace") for line in lines]
+
+    def _trim(self) -> None:
+        """Drop the oldest lines beyond the window, replacing the window."""
+        drop = len(self.lines) - self._window
+        self._start += sum(self._sizes[:drop])
+        self.lines = AppendOnlyLines(self.lines[drop:])
+        self._sizes = self._sizes[drop:]
+
+    def _read_before_start(self, count: int) -> tuple[list[bytes], bytes]:
+        """Read lines backwards from the start of the window.
+
+        Args:
+            count: The number of lines to read
+
+        Returns:
+            The lines in the order they appear in the file, and any bytes after the last
+            newline, eg. a line being written at the end of the file
+        """
+        position = self._start
+        blocks: list[bytes] = []
+        newlines = 0
+        with self.file.open(mode="rb") as file_handle:
+            while position > 0 and newlines <= count:
+                block_size = min(READ_BLOCK_SIZE, position)
+                position -= block_size
+                file_handle.seek(position)
+                blocks.append(file_handle.read(block_size))
+                newlines += blocks[-1].count(b"\n")
+
+        lines = b"".join(reversed(blocks)).split(b"\n")
+        tail = lines.pop()
+        if position > 0:
+            # The first line read is incomplete, it starts before the position
+            position += len(lines.pop(0)) + 1
+        if len(lines) > count:
+            position += sum(len(line) + 1 for line in lines[:-count])
+            lines = lines[-count:]
+        self._start = position
+        return lines, tail
+
+
+def read_tail(file: Path, lines: int, max_bytes: int) -> tuple[list[str], bool]:
+    """Read the last lines of a file, reading backwards from the end of the file.
+
+    Args:
+        file: The file
+        lines: The maximum number of lines to read
+        max_bytes: The maximum number of bytes to read
+
+    Returns:
+        The lines in the order they appear in the file, and an indication the start of the
+        file was not reached
+    """
+    with file.open(mode="rb") as file_handle:
+        position = file_handle.seek(0, os.SEEK_END)
+        blocks: list[bytes] = []
+        newlines = read = 0
+        while position > 0 and newlines <= lines and read < max_bytes:
+            block_size = min(READ_BLOCK_SIZE, position, max_bytes - read)
+            position -= block_size
+            file_handle.seek(position)
+            blocks.append(file_handle.read(block_size))
+            newlines += blocks[-1].count(b"\n")
+            read += block_size
+        # The first line read is complete if the position is at the start of a line
+        at_line_start = position == 0
+        if not at_line_start:
+            file_handle.seek(position - 1)
+            at_line_start = file_handle.read(1) == b"\n"
+
+    tail = b"".join(reversed(blocks)).split(b"\n")
+    if not tail[-1]:
+        tail.pop()
+    if not at_line_start and tail:
+        # The first line read is incomplete, it starts before the position
+        tail.pop(0)
+    truncated = position > 0 or len(tail) > lines
+    decoded = [line.decode("utf-8", errors="replace") for line in tail[-lines:]] if lines else []
+    return decoded, truncated
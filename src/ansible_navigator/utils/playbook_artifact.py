@@ -0,0 +1,388 @@
+"""Playbook artifacts written incrementally and replayed lazily.
+
+A version 3 playbook artifact is a JSON lines file, each line is a record. The first
+record is a header with the version, followed by batches of stdout lines and task
+results appended as the playbook runs. When the artifact is saved, a footer with the
+plays, a summary of each task and the offset of each task's record is appended, followed
+by a trailer with the offset of the footer.
+
+A replay reads the trailer and footer to build the plays menu and seeks to a task's
+record only when the task is shown.
+
+An artifact saved with a ``.gz`` or ``.xz`` extension is compressed. Offsets within the
+artifact refer to the uncompressed records. A compressed artifact is detected by its
+content when replayed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import lzma
+import os
+import shutil
+import tempfile
+import zlib
+
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import SupportsIndex
+from typing import overload
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+ARTIFACT_VERSION = "3.0.0"
+"""The version of the playbook artifact format"""
+
+STDOUT_BATCH_SIZE = 1000
+"""The number of stdout lines collected before they are appended as a record"""
+
+HEADER_MAX_SIZE = 1024
+"""The number of bytes read from the start of the artifact to find the header"""
+
+TRAILER_MAX_SIZE = 1024
+"""The number of bytes read from the end of the artifact to find the trailer"""
+
+COMPRESSION_OPENERS: dict[str, tuple[bytes, Callable[..., IO[bytes]]]] = {
+    ".gz": (b"\x1f\x8b", gzip.open),
+    ".xz": (b"\xfd7zXZ\x00", lzma.open),
+}
+"""The file extension, magic number and opener for each supported compression"""
+
+CORRUPT_ARTIFACT_ERRORS = (gzip.BadGzipFile, EOFError, lzma.LZMAError, zlib.error)
+"""The errors raised when a corrupt or truncated compressed artifact is read"""
+
+STDOUT_RECORD_PREFIX = b'{"type": "stdout"'
+"""The start of a stdout record, used to skip other records without decoding them"""
+
+
+def _detect_opener(file: Path) -> Callable[..., IO[bytes]] | None:
+    """Detect the compression of an artifact from the start of the file.
+
+    Args:
+        file: The artifact file
+
+    Returns:
+        The opener for the compression, None if the artifact is not compressed
+    """
+    with file.open(mode="rb") as file_handle:
+        start = file_handle.read(8)
+    return next(
+        (opener for magic, opener in COMPRESSION_OPENERS.values() if start.startswith(magic)),
+        None,
+    )
+
+
+def open_artifact(file: Path, mode: str = "rb") -> IO[bytes]:
+    """Open an artifact, compressed or not.
+
+    When writing, the compression is chosen by the file extension. When reading, it is
+    detected from the start of the file.
+
+    Args:
+        file: The artifact file
+        mode: The binary mode to open the file with
+
+    Returns:
+        The file handle for the uncompressed content
+    """
+    if "r" in mode:
+        opener = _detect_opener(file)
+    else:
+        opener = COMPRESSION_OPENERS.get(file.suffix, (b"", None))[1]
+    if opener is None:
+        return file.open(mode=mode)
+    return opener(file, mode)
+
+
+def is_compressed(file: Path) -> bool:
+    """Determine if an artifact is compressed.
+
+    Args:
+        file: The artifact file
+
+    Returns:
+        True if the artifact is compressed
+    """
+    return _detect_opener(file) is not None
+
+
+def _append_record(file_handle: IO[bytes], record: dict[str, Any]) -> int:
+    """Append a record at the current position of a file.
+
+    Args:
+        file_handle: The file handle to write to
+        record: The record to write
+
+    Returns:
+        The offset of the record in the uncompressed file
+    """
+    offset = file_handle.tell()
+    file_handle.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+    return offset
+
+
+class PlaybookArtifactWriter:
+    """Collect the records of a running playbook in a journal, save them as an artifact."""
+
+    def __init__(self) -> None:
+        """Initialize the writer and its journal."""
+        self._journal: IO[bytes] = tempfile.TemporaryFile()  # noqa: SIM115
+        self._task_offsets: dict[int, int] = {}
+        self._stdout_offsets: list[int] = []
+        self._stdout_lines: list[str] = []
+        _append_record(self._journal, {"type": "header", "version": ARTIFACT_VERSION})
+
+    def add_stdout(self, lines: Iterable[str]) -> None:
+        """Add lines of stdout, they are appended to the journal in batches.
+
+        Args:
+            lines: The lines of stdout
+        """
+        self._stdout_lines.extend(lines)
+        if len(self._stdout_lines) >= STDOUT_BATCH_SIZE:
+            self._flush_stdout()
+
+    def _flush_stdout(self) -> None:
+        """Append the pending lines of stdout to the journal."""
+        if self._stdout_lines:
+            record = {"type": "stdout", "lines": self._stdout_lines}
+            self._stdout_offsets.append(_append_record(self._journal, record))
+            self._stdout_lines = []
+
+    def add_task(self, task: dict[str, Any]) -> None:
+        """Append a task to the journal, replacing any previous record for the task.
+
+        Args:
+            task: The task
+        """
+        self._task_offsets[id(task)] = _append_record(self._journal, {"type": "task", "task": task})
+
+    def save(
+        self,
+        *,
+        file: Path,
+        plays: list[dict[str, Any]],
+        summary_keys: Iterable[str],
+        status: str,
+        status_color: int,
+        settings_entries: dict[str, Any],
+        settings_sources: dict[str, str],
+    ) -> None:
+        # pylint: disable=too-many-arguments
+        """Save the artifact, the journal is copied and completed with the footer.
+
+        Tasks not yet in the journal, eg. those in progress, are appended to the artifact.
+
+        Args:
+            file: The file to save the artifact as
+            plays: The plays and their tasks
+            summary_keys: The task keys to include in each task's summary
+            status: The playbook status
+            status_color: The color of the playbook status
+            settings_entries: The effective settings
+            settings_sources: The source of each setting
+        """
+        summary_keys = tuple(summary_keys)
+        self._flush_stdout()
+        with open_artifact(file, mode="wb") as file_handle:
+            self._journal.seek(0)
+            try:
+                shutil.copyfileobj(self._journal, file_handle)
+            finally:
+                # Records are appended to the journal at its current position
+                self._journal.seek(0, os.SEEK_END)
+            footer_plays = []
+            for play in plays:
+                summaries = []
+                for task in play["tasks"]:
+                    offset = self._task_offsets.get(id(task))
+                    if offset is None:
+                        offset = _append_record(file_handle, {"type": "task", "task": task})
+                    summary = {key: task[key] for key in summary_keys if key in task}
+                    summary["__record"] = offset
+                    summaries.append(summary)
+                footer_plays.append({**play, "tasks": summaries})
+            footer = {
+                "type": "footer",
+                "plays": footer_plays,
+                "stdout": self._stdout_offsets,
+                "status": status,
+                "status_color": status_color,
+                "settings_entries": settings_entries,
+                "settings_sources": settings_sources,
+            }
+            footer_offset = _append_record(file_handle, footer)
+            _append_record(file_handle, {"type": "trailer", "footer": footer_offset})
+
+    def close(self) -> None:
+        """Close and remove the journal."""
+        self._journal.close()
+
+
+class PlaybookArtifactReader:
+    """Read the records of a saved playbook artifact on demand."""
+
+    def __init__(self, file: Path) -> None:
+        """Initialize the reader.
+
+        Args:
+            file: The artifact file
+        """
+        self.file = file
+        self._file_handle: IO[bytes] | None = None
+
+    @property
+    def _records(self) -> IO[bytes]:
+        """Provide a seekable file handle for the records.
+
+        A compressed artifact is decompressed once to a temporary file, seeking within
+        the compressed stream would require decompressing it again for each record.
+
+        Returns:
+            The file handle
+        """
+        if self._file_handle is None:
+            if is_compressed(self.file):
+                self._file_handle = tempfile.TemporaryFile()  # noqa: SIM115
+                with open_artifact(self.file) as file_handle:
+                    shutil.copyfileobj(file_handle, self._file_handle)
+            else:
+                self._file_handle = self.file.open(mode="rb")
+        return self._file_handle
+
+    def close(self) -> None:
+        """Close the artifact."""
+        if self._file_handle is not None:
+            self._file_handle.close()
+            self._file_handle = None
+
+    @staticmethod
+    def version(file: Path) -> str | None:
+        """Determine the version of an artifact written as records.
+
+        Args:
+            file: The artifact file
+
+        Returns:
+            The version from the header record, None if the file is not written as records
+        """
+        with open_artifact(file) as file_handle:
+            first_line = file_handle.readline(HEADER_MAX_SIZE)
+        try:
+            header = json.loads(first_line)
+        except ValueError:
+            return None
+        if isinstance(header, dict) and header.get("type") == "header":
+            return str(header.get("version", ""))
+        return None
+
+    def read_record(self, offset: int) -> dict[str, Any]:
+        """Read the record at an offset.
+
+        Args:
+            offset: The offset of the record
+
+        Returns:
+            The record
+        """
+        self._records.seek(offset)
+        record: dict[str, Any] = json.loads(self._records.readline())
+        return record
+
+    def read_footer(self) -> dict[str, Any]:
+        """Read the footer, found using the trailer at the end of the artifact.
+
+        Raises:
+            ValueError: If the trailer is missing, eg. the artifact was not saved completely
+
+        Returns:
+            The footer
+        """
+        self._records.seek(0, os.SEEK_END)
+        self._records.seek(max(0, self._records.tell() - TRAILER_MAX_SIZE))
+        last_line = self._records.read().splitlines()[-1]
+        trailer = json.loads(last_line)
+        if not isinstance(trailer, dict) or trailer.get("type") != "trailer":
+            msg = "The artifact trailer is missing"
+            raise ValueError(msg)
+        return self.read_record(trailer["footer"])
+
+    def stdout(self, offsets: Iterable[int]) -> Iterator[str]:
+        """Read the lines of stdout using the offsets from the footer.
+
+        Args:
+            offsets: The offsets of the stdout records
+
+        Yields:
+            Each line of stdout
+        """
+        for offset in offsets:
+            yield from self.read_record(offset)["lines"]
+
+    def stream_stdout(self) -> Iterator[str]:
+        """Read the lines of stdout in a single pass through the artifact.
+
+        The footer is not used and a compressed artifact is decompressed as it is read.
+
+        Yields:
+            Each line of stdout
+        """
+        with open_artifact(self.file) as file_handle:
+            for line in file_handle:
+                if line.startswith(STDOUT_RECORD_PREFIX):
+                    yield from json.loads(line)["lines"]
+
+    def copy(self, file: Path) -> None:
+        """Copy the artifact, compressing it as needed for the new file's extension.
+
+        Args:
+            file: The file to copy the artifact to
+        """
+        with open_artifact(self.file) as source, open_artifact(file, mode="wb") as destination:
+            shutil.copyfileobj(source, destination)
+
+
+class TaskRecords(list[dict[str, Any]]):
+    """A list of task summaries, indexing an entry reads the task's record."""
+
+    def __init__(self, summaries: Iterable[dict[str, Any]], reader: PlaybookArtifactReader) -> None:
+        """Initialize the task records.
+
+        Args:
+            summaries: The task summaries from the artifact's footer
+            reader: The artifact reader
+        """
+        super().__init__(summaries)
+        self._reader = reader
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(
+        self,
+        index: SupportsIndex | slice,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Read the record for a task.
+
+        Args:
+            index: The index of the task
+
+        Returns:
+            The task, or the task summaries for a slice
+        """
+        if isinstance(index, slice):
+            return list.__getitem__(self, index)
+        summary = list.__getitem__(self, index)
+        task: dict[str, Any] = self._reader.read_record(summary["__record"])["task"]
+        return task
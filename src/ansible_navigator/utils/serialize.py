@@ -401,8 +401,10 @@ def write_diagnostics_json(path: str, mode: int, content: object) -> None:
     oldmask = os.umask(0)
 
     opener_func = partial(opener, mode=mode)
+    encoder = json.JSONEncoder(indent=4, sort_keys=True)
     with open(path, "w", encoding="utf-8", opener=opener_func) as f:
-        f.write(json.dumps(content, indent=4, sort_keys=True))
+        # Written as it is encoded, the encoded document is not held in memory
+        f.writelines(encoder.iterencode(content))
     os.umask(oldmask)
 
 
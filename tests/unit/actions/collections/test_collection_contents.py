@@ -0,0 +1,38 @@
+"""Test the plugin docs of a collection are read from the cache when shown."""
+
+from __future__ import annotations
+
+import json
+
+from typing import TYPE_CHECKING
+
+from ansible_navigator.actions.collections import CollectionContents
+from ansible_navigator.utils.key_value_store import KeyValueStore
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_collection_contents(tmp_path: Path) -> None:
+    """Test a plugin's doc is read the first time the plugin is shown.
+
+    Args:
+        tmp_path: The tmp path
+    """
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    plugin = {"doc": {"module": "ping"}, "examples": "", "returndocs": {}, "metadata": {}}
+    collection_cache["checksum"] = json.dumps({"plugin": plugin})
+    collection_cache.close()
+
+    menu_entry = {"__checksum": "checksum", "full_name": "ns.coll.ping", "__type": "module"}
+    role = {"short_name": "role", "__type": "role"}
+    missing = {"__checksum": "missing", "full_name": "ns.coll.missing", "__type": "module"}
+    contents = CollectionContents([menu_entry, role, missing], collection_cache)
+
+    assert contents[:2] == [menu_entry, role]
+    shown = contents[0]
+    assert shown == {**plugin, "full_name": "ns.coll.ping", "__type": "module"}
+    assert contents[0] is shown
+    assert contents[1] is role
+    assert contents[-1] == {"full_name": "ns.coll.missing", "__type": "module"}
@@ -214,7 +214,7 @@ def test_artifact_path(
     monkeypatch.setattr(pathlib.Path, "mkdir", make_dirs)
     monkeypatch.setattr(action, "_get_status", get_status)
     mocked_write = mocker.patch(
-        "ansible_navigator.actions.run.serialize_write_file",
+        "ansible_navigator.actions.run.PlaybookArtifactWriter.save",
         return_value=None,
     )
 
@@ -264,7 +264,7 @@ def test_artifact_contents(monkeypatch: pytest.MonkeyPatch, mocker: MockerFixtur
     monkeypatch.setattr(os, "makedirs", make_dirs)
     monkeypatch.setattr(action, "_get_status", get_status)
     mocked_write = mocker.patch(
-        "ansible_navigator.actions.run.serialize_write_file",
+        "ansible_navigator.actions.run.PlaybookArtifactWriter.save",
         return_value=None,
     )
 
@@ -276,8 +276,8 @@ def test_artifact_contents(monkeypatch: pytest.MonkeyPatch, mocker: MockerFixtur
     run_action = action(args=settings)
     run_action.write_artifact(filename="artifact.json")
 
-    settings_entries = mocked_write.call_args[1]["content"]["settings_entries"]
+    settings_entries = mocked_write.call_args[1]["settings_entries"]
     assert settings_entries["ansible-navigator"]["app"] == "run"
 
-    settings_sources = mocked_write.call_args[1]["content"]["settings_sources"]
+    settings_sources = mocked_write.call_args[1]["settings_sources"]
     assert settings_sources["ansible-navigator.app"] == Constants.USER_CLI.value
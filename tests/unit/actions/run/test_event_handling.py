@@ -0,0 +1,462 @@
+"""Unit tests for runner event handling in the run action."""
+
+from __future__ import annotations
+
+import gc
+import gzip
+import lzma
+import time
+import uuid
+
+from copy import deepcopy
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from ansible_navigator.actions.run import DEQUEUE_CHUNK_SIZE
+from ansible_navigator.actions.run import PLAY_RESULT_COUNTERS
+from ansible_navigator.actions.run import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.steps import Step
+from ansible_navigator.utils.playbook_artifact import PlaybookArtifactReader
+from ansible_navigator.utils.playbook_artifact import PlaybookArtifactWriter
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def play_start(play_uuid: str, name: str) -> dict[str, Any]:
+    """Build a playbook_on_play_start message.
+
+    Args:
+        play_uuid: The uuid of the play
+        name: The name of the play
+
+    Returns:
+        The runner message
+    """
+    return {
+        "event": "playbook_on_play_start",
+        "event_data": {"name": name, "uuid": play_uuid, "playbook": "site.yml"},
+    }
+
+
+def runner_event(
+    event: str,
+    play_uuid: str,
+    task_uuid: str,
+    host: str,
+    *,
+    res: dict[str, Any] | None = None,
+    ignore_errors: bool = False,
+) -> dict[str, Any]:
+    """Build a runner_on_* message.
+
+    Args:
+        event: The runner event suffix, eg. start, ok, failed
+        play_uuid: The uuid of the parent play
+        task_uuid: The uuid of the task
+        host: The host the task ran against
+        res: The task result
+        ignore_errors: Whether the task ignores errors
+
+    Returns:
+        The runner message
+    """
+    return {
+        "event": f"runner_on_{event}",
+        "event_data": {
+            "duration": 1.5,
+            "host": host,
+            "ignore_errors": ignore_errors,
+            "play_uuid": play_uuid,
+            "res": res or {},
+            "task": "debug",
+            "task_action": "ansible.builtin.debug",
+            "task_uuid": task_uuid,
+        },
+    }
+
+
+def event_stream(plays: int, tasks: int, hosts: int) -> list[dict[str, Any]]:
+    """Build a synthetic stream of runner messages.
+
+    Every host starts each task before any host finishes it, as with the linear strategy.
+
+    Args:
+        plays: The number of plays
+        tasks: The number of tasks per play
+        hosts: The number of hosts
+
+    Returns:
+        The runner messages
+    """
+    messages = []
+    for play_number in range(plays):
+        play_uuid = str(uuid.uuid4())
+        messages.append(play_start(play_uuid, f"play_{play_number}"))
+        for _task_number in range(tasks):
+            task_uuid = str(uuid.uuid4())
+            messages.extend(
+                runner_event("start", play_uuid, task_uuid, f"host_{host}") for host in range(hosts)
+            )
+            messages.extend(
+                runner_event("ok", play_uuid, task_uuid, f"host_{host}", res={"changed": True})
+                for host in range(hosts)
+            )
+    return messages
+
+
+def new_run_action() -> action:
+    """Create a run action instance without a runner.
+
+    Returns:
+        The run action
+    """
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("mode").value.current = "interactive"
+    args.entry("playbook").value.current = "site.yml"
+    args.entry("time_zone").value.current = "UTC"
+    return action(args=args)
+
+
+@pytest.fixture(name="run_action")
+def fixture_run_action() -> action:
+    """Provide a run action instance without a runner.
+
+    Returns:
+        The run action
+    """
+    return new_run_action()
+
+
+def test_event_stream(run_action: action) -> None:
+    """Test every task in a synthetic event stream is matched and completed.
+
+    Args:
+        run_action: The run action
+    """
+    for message in event_stream(plays=3, tasks=10, hosts=50):
+        run_action._handle_message(message)
+
+    assert len(run_action._plays.value) == 3
+    assert len(run_action._play_index) == 3
+    assert len(run_action._task_index) == 3 * 10 * 50
+    for play in run_action._plays.value:
+        assert run_action._play_index[play["uuid"]] is play
+        assert len(play["tasks"]) == 10 * 50
+        assert [task["__number"] for task in play["tasks"]] == list(range(10 * 50))
+        assert all(task["__result"] == "Ok" for task in play["tasks"])
+        assert all(task["__changed"] is True for task in play["tasks"])
+
+
+def handling_seconds(tasks: int) -> float:
+    """Time handling the runner messages of a play, taking the fastest of three runs.
+
+    Garbage collection is disabled while timing, its cost grows with the number of objects
+    alive rather than the number of messages handled.
+
+    Args:
+        tasks: The number of tasks in the play
+
+    Returns:
+        The seconds taken to handle the messages
+    """
+    timings = []
+    for _ in range(3):
+        run_action = new_run_action()
+        messages = event_stream(plays=1, tasks=tasks, hosts=20)
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for message in messages:
+                run_action._handle_message(message)
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return min(timings)
+
+
+def test_event_handling_benchmark(record_property: Callable[[str, object], None]) -> None:
+    """Benchmark handling runner messages for a play and for one twice the size.
+
+    The seconds taken each way, and their ratio, are recorded as properties of the test in
+    the junit report. Handling should scale linearly, matching each message to its task by
+    a search of the tasks handled so far would make the ratio about four.
+
+    Args:
+        record_property: The fixture to record a property of the test
+    """
+    single = handling_seconds(tasks=150)
+    double = handling_seconds(tasks=300)
+    record_property("single_seconds", single)
+    record_property("double_seconds", double)
+    record_property("ratio", double / single)
+
+
+def test_event_without_parent(run_action: action, caplog: pytest.LogCaptureFixture) -> None:
+    """Test events without a known play or task are discarded.
+
+    Args:
+        run_action: The run action
+        caplog: The log capture fixture
+    """
+    play_uuid = str(uuid.uuid4())
+    run_action._handle_message(runner_event("start", play_uuid, "task", "host"))
+    assert "Playbook event without parent play" in caplog.text
+
+    run_action._handle_message(play_start(play_uuid, "play"))
+    run_action._handle_message(runner_event("ok", play_uuid, "task", "host"))
+    assert "Task event without parent task" in caplog.text
+    assert not run_action._plays.value[0]["tasks"]
+
+
+def test_rerun_clears_indexes(run_action: action) -> None:
+    """Test the play and task indexes are cleared for a rerun.
+
+    Args:
+        run_action: The run action
+    """
+
+    class Runner:
+        """A finished runner."""
+
+        finished = True
+
+    for message in event_stream(plays=1, tasks=1, hosts=2):
+        run_action._handle_message(message)
+
+    run_action._subaction_type = "run"
+    run_action.runner = Runner()  # type: ignore[assignment]
+    run_action._run_runner = lambda: None  # type: ignore[method-assign]
+    run_action.rerun()
+
+    assert not run_action._plays.value
+    assert not run_action._play_index
+    assert not run_action._task_index
+
+
+def test_play_stats(run_action: action) -> None:
+    """Test the play counters follow tasks from in progress to their final result.
+
+    Args:
+        run_action: The run action
+    """
+    play_uuid = str(uuid.uuid4())
+    run_action._handle_message(play_start(play_uuid, "play"))
+    for host in ("ok", "changed", "failed", "ignored", "skipped", "running"):
+        run_action._handle_message(runner_event("start", play_uuid, "task", host))
+
+    play = run_action._plays.value[0]
+    run_action._play_stats()
+    assert play["__in progress"] == 6
+    assert play["__task_count"] == 6
+    assert play["__progress"] == "0%"
+
+    run_action._handle_message(runner_event("ok", play_uuid, "task", "ok"))
+    run_action._handle_message(
+        runner_event("ok", play_uuid, "task", "changed", res={"changed": True}),
+    )
+    run_action._handle_message(runner_event("failed", play_uuid, "task", "failed"))
+    run_action._handle_message(
+        runner_event("failed", play_uuid, "task", "ignored", ignore_errors=True),
+    )
+    run_action._handle_message(runner_event("skipped", play_uuid, "task", "skipped"))
+    run_action._play_stats()
+
+    expected = {
+        "__ok": 2,
+        "__changed": 1,
+        "__failed": 1,
+        "__ignored": 1,
+        "__skipped": 1,
+        "__unreachable": 0,
+        "__in progress": 1,
+        "__task_count": 6,
+        "__progress": "83%",
+    }
+    assert {key: play[key] for key in expected} == expected
+
+    # A play loaded from an artifact written in stdout mode has no counters
+    replayed = {"tasks": play["tasks"]}
+    run_action._recount_play_stats(replayed)
+    counters = (*PLAY_RESULT_COUNTERS, "__changed")
+    assert {key: replayed[key] for key in counters} == {key: play[key] for key in counters}
+
+
+def test_dequeue_time_budget(run_action: action) -> None:
+    """Test a backlog is drained in chunks when a time budget is set.
+
+    Args:
+        run_action: The run action
+    """
+    messages = event_stream(plays=1, tasks=5, hosts=50)
+    for message in messages:
+        run_action._queue.put(message)
+
+    run_action._dequeue(time_budget=0)
+    assert run_action._first_message_received
+    assert run_action._queue.qsize() == len(messages) - DEQUEUE_CHUNK_SIZE
+
+    run_action._dequeue()
+    assert run_action._queue.empty()
+    assert len(run_action._plays.value[0]["tasks"]) == 5 * 50
+
+
+def test_status_backlog(run_action: action, mocker: MockerFixture) -> None:
+    """Test the status shows the backlog of runner events.
+
+    Args:
+        run_action: The run action
+        mocker: The mocker fixture
+    """
+    mocker.patch.object(run_action, "_get_status", return_value=("running", 10))
+    run_action._interaction = mocker.MagicMock()
+    for message in event_stream(plays=1, tasks=13, hosts=50):
+        run_action._queue.put(message)
+
+    run_action._set_status()
+    run_action._interaction.ui.update_status.assert_called_with("running, backlog 1k", 10)
+
+    run_action._dequeue()
+    run_action._set_status()
+    run_action._interaction.ui.update_status.assert_called_with("running", 10)
+
+
+@pytest.mark.parametrize(
+    ("mode", "enable", "journaled"),
+    (
+        pytest.param("interactive", True, True, id="interactive"),
+        pytest.param("interactive", False, False, id="interactive-disabled"),
+        pytest.param("stdout", True, True, id="stdout-with-artifact"),
+        pytest.param("stdout", False, False, id="stdout"),
+    ),
+)
+def test_artifact_journal_created(
+    run_action: action,
+    mocker: MockerFixture,
+    mode: str,
+    enable: bool,
+    journaled: bool,
+) -> None:
+    """Test an artifact journal is only kept for a run when the artifact will be written.
+
+    Args:
+        run_action: The run action
+        mocker: The mocker fixture
+        mode: The mode
+        enable: Whether playbook artifact creation is enabled
+        journaled: Whether a journal is expected
+    """
+    mocker.patch("ansible_navigator.actions.run.CommandAsync")
+    run_action._args.entry("mode").value.current = mode
+    run_action._args.entry("playbook_artifact_enable").value.current = enable
+    run_action._args.entry("execution_environment").value.current = True
+    run_action._run_runner()
+    assert (run_action._artifact_journal is not None) is journaled
+
+
+@pytest.mark.parametrize("file_name", ("artifact.json", "artifact.json.gz"))
+def test_artifact_replay(
+    run_action: action,
+    tmp_path: Path,
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+    file_name: str,
+) -> None:
+    """Test an artifact journaled during a run is replayed with task details read on demand.
+
+    Args:
+        run_action: The run action
+        tmp_path: The tmp path
+        mocker: The mocker fixture
+        capsys: The capture fixture
+        file_name: The artifact file name
+    """
+    mocker.patch.object(run_action, "_get_status", return_value=("successful", 10))
+    run_action._artifact_journal = PlaybookArtifactWriter()
+    run_action._handle_message({"stdout": "PLAY [play_0]"})
+    for message in event_stream(plays=1, tasks=2, hosts=3):
+        run_action._handle_message(message)
+    artifact = tmp_path / file_name
+    run_action.write_artifact(filename=str(artifact))
+
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("app").value.current = "replay"
+    args.entry("mode").value.current = "stdout"
+    args.entry("playbook_artifact_replay").value.current = str(artifact)
+    assert action(args=args)._init_replay()
+    assert capsys.readouterr().out == "PLAY [play_0]\n"
+
+    replay = action(args=args)
+    replay._interaction = mocker.MagicMock()
+    mocker.patch.object(type(replay), "mode", "interactive")
+    assert replay._init_replay_records(artifact_file=artifact, version="3.0.0")
+    play = replay._plays.value[0]
+    assert play["__ok"] == 2 * 3
+    assert "res" not in play["tasks"][0]
+
+    replay.steps.append(Step(name="task_list", step_type="menu", value=play["tasks"], index=4))
+    step = replay._task_from_task_list()
+    assert step.value[step.index] == run_action._plays.value[0]["tasks"][4]
+
+    reader = replay._artifact_reader
+    assert reader is not None
+    close = mocker.spy(reader, "close")
+    replay._previous_scroll = 0
+    replay._previous_filter = None
+    replay._prepare_to_exit(mocker.MagicMock())
+    close.assert_called_once()
+    assert replay._artifact_reader is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    (
+        pytest.param(gzip.compress(b'{"version": "2.0.0"}')[:-12], id="gzip_truncated"),
+        pytest.param(b"\x1f\x8b\x08\x00" + b"corrupt" * 10, id="gzip_corrupt"),
+        pytest.param(lzma.compress(b'{"version": "2.0.0"}')[:-20], id="xz_truncated"),
+        pytest.param(b"\xfd7zXZ\x00" + b"corrupt" * 10, id="xz_corrupt"),
+    ),
+)
+def test_corrupt_artifact_replay(tmp_path: Path, content: bytes) -> None:
+    """Test a corrupt or truncated compressed artifact is not replayed.
+
+    Args:
+        tmp_path: The tmp path
+        content: The content of the artifact file
+    """
+    artifact = tmp_path / "artifact.json.gz"
+    artifact.write_bytes(content)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("app").value.current = "replay"
+    args.entry("mode").value.current = "stdout"
+    args.entry("playbook_artifact_replay").value.current = str(artifact)
+    assert action(args=args)._init_replay() is False
+
+
+def test_truncated_records_replay(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test the artifact is closed when an artifact written as records cannot be replayed.
+
+    Args:
+        tmp_path: The tmp path
+        mocker: The mocker fixture
+    """
+    artifact = tmp_path / "artifact.json.gz"
+    records = b'{"type": "header", "version": "3.0.0"}\n{"type": "stdout"'
+    artifact.write_bytes(gzip.compress(records))
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("app").value.current = "replay"
+    replay = action(args=args)
+    replay._interaction = mocker.MagicMock()
+    mocker.patch.object(type(replay), "mode", "interactive")
+    close = mocker.spy(PlaybookArtifactReader, "close")
+
+    assert replay._init_replay_records(artifact_file=artifact, version="3.0.0") is False
+    close.assert_called_once()
+    assert replay._artifact_reader is None
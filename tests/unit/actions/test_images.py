@@ -0,0 +1,93 @@
+"""Unit tests for the ``images`` action."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+from ansible_navigator.actions.images import Action as action
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.image_manager import IntrospectionCache
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+DETAILS = {"errors": [], "python_version": {"details": {"version": "3.11"}}}
+
+
+def test_introspection_cached(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test image introspection is reused for an image ID until refreshed.
+
+    Args:
+        tmp_path: The tmp path
+        mocker: The mocker fixture
+    """
+    args = deepcopy(NavigatorConfiguration)
+    args.internals.cache_path = tmp_path
+    images = action(args=args)
+    run_runner = mocker.patch.object(
+        images,
+        "_run_runner",
+        return_value=("warning\n" + json.dumps(DETAILS), "", 0),
+    )
+
+    assert images._introspect(image_name="ee:latest", image_id="sha256:1") == (DETAILS, "", 0)
+    assert images._introspect(image_name="ee:latest", image_id="sha256:1") == (DETAILS, "", 0)
+    assert run_runner.call_count == 1
+
+    # An unknown ID or a failed introspection is not cached
+    images._introspect(image_name="ee:latest", image_id="")
+    run_runner.return_value = ("", "failed", 1)
+    assert images._introspect(image_name="other:latest", image_id="sha256:2") == (
+        None,
+        "failed",
+        1,
+    )
+    assert run_runner.call_count == 3
+
+    # A refresh discards the cached details, even if introspection then fails
+    images._args.entry("images_refresh").value.current = True
+    images._introspect(image_name="ee:latest", image_id="sha256:1")
+    assert run_runner.call_count == 4
+    cache = IntrospectionCache(cache_path=tmp_path)
+    assert cache.get("sha256:1") is None
+    assert cache.get("sha256:2") is None
+    cache.close()
+
+
+def test_introspection_cache_script(tmp_path: Path) -> None:
+    """Test cached details from another version of the introspection script are ignored.
+
+    Args:
+        tmp_path: The tmp path
+    """
+    cache = IntrospectionCache(cache_path=tmp_path)
+    cache.set("sha256:1", DETAILS)
+    assert cache.get("sha256:1") == DETAILS
+    cache._script = "another"
+    assert cache.get("sha256:1") is None
+    cache.close()
+
+
+SCRIPT_NOT_IMPORTED = """
+import sys, tempfile
+from pathlib import Path
+from ansible_navigator.image_manager.introspection_cache import IntrospectionCache
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    IntrospectionCache(cache_path=Path(tmp_dir)).close()
+assert "ansible_navigator.data.image_introspect" not in sys.modules
+"""
+
+
+def test_introspection_cache_script_not_imported() -> None:
+    """Test the introspection script is checksummed without importing it on the host."""
+    subprocess.run([sys.executable, "-c", SCRIPT_NOT_IMPORTED], check=True)
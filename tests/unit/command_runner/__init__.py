@@ -0,0 +1 @@
+"""Unit tests for the command_runner subsystem."""
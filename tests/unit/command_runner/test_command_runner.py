@@ -0,0 +1,134 @@
+"""Unit tests for the command runner."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+
+from typing import TYPE_CHECKING
+
+from ansible_navigator.command_runner import Command
+from ansible_navigator.command_runner import CommandRunner
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def post_process(command: Command) -> None:
+    """Set the details of a command from its output.
+
+    Args:
+        command: The command
+    """
+    command.details = command.stdout.strip()
+
+
+def sleep_commands(count: int, seconds: float) -> list[Command]:
+    """Create commands which sleep and then print their number.
+
+    Args:
+        count: The number of commands
+        seconds: The number of seconds each command sleeps
+
+    Returns:
+        The commands
+    """
+    return [
+        Command(
+            identity=str(number),
+            command=f"sleep {seconds} && echo {number}",
+            post_process=post_process,
+        )
+        for number in range(count)
+    ]
+
+
+def test_run_multi_thread() -> None:
+    """Test commands are run concurrently by threads and returned in order."""
+    commands = sleep_commands(count=8, seconds=0.2)
+    start = time.monotonic()
+    results = CommandRunner.run_multi_thread(commands, max_workers=8)
+    assert time.monotonic() - start < 8 * 0.2
+    assert [command.details for command in results] == [str(number) for number in range(8)]
+    assert CommandRunner.run_multi_thread([]) == []
+
+
+def test_iter_multi_thread() -> None:
+    """Test commands are yielded as they complete."""
+    commands = [
+        Command(identity="slow", command="sleep 0.5", post_process=post_process),
+        Command(identity="fast", command="true", post_process=post_process),
+    ]
+    results = CommandRunner.iter_multi_thread(commands, max_workers=2)
+    assert next(results).identity == "fast"
+    assert next(results).identity == "slow"
+
+
+def test_timeout() -> None:
+    """Test a command which does not complete in time is reported as an error."""
+    command = Command(
+        identity="timeout",
+        command="echo started && sleep 5",
+        post_process=post_process,
+        timeout=0.2,
+    )
+    start = time.monotonic()
+    (result,) = CommandRunner.run_multi_thread([command])
+    assert time.monotonic() - start < 5
+    assert result.return_code == -1
+    assert "timed out after 0.2 seconds" in result.errors
+    assert result.stdout == "started\n"
+
+
+BENCHMARK = """
+import json, resource, sys, time
+from ansible_navigator.command_runner import Command, CommandRunner
+
+def post_process(command):
+    command.details = command.stdout
+
+
+commands = [
+    Command(identity=str(number), command="sleep 0.05", post_process=post_process)
+    for number in range(16)
+]
+if sys.argv[1] == "threads":
+    run = CommandRunner.run_multi_thread
+else:
+    run = CommandRunner().run_multi_process
+start = time.perf_counter()
+results = run(commands)
+seconds = time.perf_counter() - start
+print(json.dumps({
+    "seconds": seconds,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "children_max_rss_kb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    "results": len(results),
+}))
+"""
+
+
+def test_thread_process_benchmark(record_property: Callable[[str, object], None]) -> None:
+    """Benchmark running 16 commands with threads and with processes.
+
+    Each is run in a new interpreter, so the peak resident set size of the interpreter
+    and of its child processes is that of running the commands. The wall time and peak
+    sizes are recorded as properties of the test in the junit report.
+
+    Args:
+        record_property: The fixture to record a property of the test
+    """
+    for name in ("threads", "processes"):
+        proc = subprocess.run(
+            [sys.executable, "-c", BENCHMARK, name],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        benchmark = json.loads(proc.stdout.splitlines()[-1])
+        assert benchmark.pop("results") == 16
+        for key, value in benchmark.items():
+            record_property(f"{name}_{key}", value)
@@ -108,6 +108,17 @@ def _generate_config(
     )
 
 
+@pytest.fixture(autouse=True)
+def _cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the application's cache in a temporary directory.
+
+    Args:
+        tmp_path: A temporary directory for this test
+        monkeypatch: Fixture for patching
+    """
+    monkeypatch.setattr(NavigatorConfiguration.internals, "cache_path", tmp_path / "cache")
+
+
 @pytest.fixture(name="generate_config")
 def fixture_generate_config() -> Callable[..., GenerateConfigResponse]:
     """Generate a configuration.
@@ -227,81 +227,86 @@ CLI_DATA = cli_data()
 
 ENV_VAR_DATA = [
     pytest.param("ansible_runner_artifact_dir", "/tmp/test1", "/tmp/test1", id="0"),
-    pytest.param("ansible_runner_rotate_artifacts_count", "10", 10, id="1"),
-    pytest.param("ansible_runner_timeout", "300", 300, id="2"),
-    pytest.param("ansible_runner_write_job_events", "false", False, id="3"),
-    pytest.param("app", "config", "config", id="4"),
-    pytest.param("cmdline", "--forks 15", ["--forks", "15"], id="5"),
-    pytest.param("collection_doc_cache_path", "/tmp/cache.db", "/tmp/cache.db", id="6"),
-    pytest.param("config", "/tmp/ansible.cfg", "/tmp/ansible.cfg", id="7"),
-    pytest.param("container_engine", "docker", "docker", id="8"),
-    pytest.param("container_options", "--net=host", ["--net=host"], id="9"),
-    pytest.param("display_color", "yellow is the color of a banana", False, id="10"),
-    pytest.param("editor_command", "nano_env_var", "nano_env_var", id="11"),
-    pytest.param("editor_console", "false", False, id="12"),
-    pytest.param("enable_prompts", "false", False, id="13"),
-    pytest.param("exec_command", "/bin/foo", "/bin/foo", id="14"),
-    pytest.param("exec_shell", "false", False, id="15"),
-    pytest.param("execution_environment", "false", False, id="16"),
-    pytest.param("execution_environment_image", "test_image:latest", "test_image:latest", id="17"),
+    pytest.param("ansible_runner_event_time_budget", "100", 100, id="1"),
+    pytest.param("ansible_runner_rotate_artifacts_count", "10", 10, id="2"),
+    pytest.param("ansible_runner_timeout", "300", 300, id="3"),
+    pytest.param("ansible_runner_write_job_events", "false", False, id="4"),
+    pytest.param("app", "config", "config", id="5"),
+    pytest.param("cmdline", "--forks 15", ["--forks", "15"], id="6"),
+    pytest.param("collection_doc_cache_path", "/tmp/cache.db", "/tmp/cache.db", id="7"),
+    pytest.param("config", "/tmp/ansible.cfg", "/tmp/ansible.cfg", id="8"),
+    pytest.param("container_engine", "docker", "docker", id="9"),
+    pytest.param("container_options", "--net=host", ["--net=host"], id="10"),
+    pytest.param("display_color", "yellow is the color of a banana", False, id="11"),
+    pytest.param("editor_command", "nano_env_var", "nano_env_var", id="12"),
+    pytest.param("editor_console", "false", False, id="13"),
+    pytest.param("enable_prompts", "false", False, id="14"),
+    pytest.param("exec_command", "/bin/foo", "/bin/foo", id="15"),
+    pytest.param("exec_shell", "false", False, id="16"),
+    pytest.param("execution_environment", "false", False, id="17"),
+    pytest.param("execution_environment_image", "test_image:latest", "test_image:latest", id="18"),
+    pytest.param("execution_environment_persistent", "true", True, id="19"),
     pytest.param(
         "execution_environment_volume_mounts",
         "/tmp:/test1:Z;/tmp:/test2:z",
         ["/tmp:/test1:Z", "/tmp:/test2:z"],
-        id="18",
+        id="20",
     ),
-    pytest.param("format", "json", "json", id="19"),
-    pytest.param("help_builder", "false", False, id="20"),
-    pytest.param("help_config", "false", False, id="21"),
-    pytest.param("help_doc", "false", False, id="22"),
-    pytest.param("help_inventory", "false", False, id="23"),
-    pytest.param("help_playbook", "false", False, id="24"),
+    pytest.param("format", "json", "json", id="21"),
+    pytest.param("help_builder", "false", False, id="22"),
+    pytest.param("help_config", "false", False, id="23"),
+    pytest.param("help_doc", "false", False, id="24"),
+    pytest.param("help_inventory", "false", False, id="25"),
+    pytest.param("help_playbook", "false", False, id="26"),
     pytest.param(
         "images_details",
         "ansible_version,python_version",
         ["ansible_version", "python_version"],
-        id="25",
+        id="27",
     ),
+    pytest.param("images_refresh", "true", True, id="28"),
     pytest.param(
         "inventory",
         "/tmp/test1.yaml,/tmp/test2.yml",
         ["/tmp/test1.yaml", "/tmp/test2.yml"],
-        id="26",
+        id="29",
     ),
-    pytest.param("inventory_column", "t1,t2,t3", ["t1", "t2", "t3"], id="27"),
+    pytest.param("inventory_column", "t1,t2,t3", ["t1", "t2", "t3"], id="30"),
     pytest.param(
         "lint_config",
         "/tmp/ansible-lint-config.yml",
         "/tmp/ansible-lint-config.yml",
-        id="28",
+        id="31",
     ),
-    pytest.param("lintables", "/tmp/lintables", "/tmp/lintables", id="29"),
-    pytest.param("log_append", "false", False, id="30"),
-    pytest.param("log_file", "/tmp/app.log", "/tmp/app.log", id="31"),
-    pytest.param("log_level", "info", "info", id="32"),
-    pytest.param("mode", "interactive", "interactive", id="33"),
-    pytest.param("osc4", "false", False, id="34"),
-    pytest.param("pass_environment_variable", "a,b,c", ["a", "b", "c"], id="35"),
-    pytest.param("playbook", "/tmp/site.yaml", "/tmp/site.yaml", id="36"),
-    pytest.param("playbook_artifact_enable", "false", False, id="37"),
-    pytest.param("playbook_artifact_replay", "/tmp/load.json", "/tmp/load.json", id="38"),
-    pytest.param("playbook_artifact_save_as", "/tmp/save.json", "/tmp/save.json", id="39"),
-    pytest.param("plugin_name", "shell", "shell", id="40"),
-    pytest.param("plugin_type", "become", "become", id="41"),
-    pytest.param("pull_arguments", "--tls-verify=false", ["--tls-verify=false"], id="42"),
-    pytest.param("pull_policy", "never", "never", id="43"),
+    pytest.param("lintables", "/tmp/lintables", "/tmp/lintables", id="32"),
+    pytest.param("log_append", "false", False, id="33"),
+    pytest.param("log_diagnostics_bytes", "1024", 1024, id="34"),
+    pytest.param("log_diagnostics_lines", "100", 100, id="35"),
+    pytest.param("log_file", "/tmp/app.log", "/tmp/app.log", id="36"),
+    pytest.param("log_level", "info", "info", id="37"),
+    pytest.param("mode", "interactive", "interactive", id="38"),
+    pytest.param("osc4", "false", False, id="39"),
+    pytest.param("pass_environment_variable", "a,b,c", ["a", "b", "c"], id="40"),
+    pytest.param("playbook", "/tmp/site.yaml", "/tmp/site.yaml", id="41"),
+    pytest.param("playbook_artifact_enable", "false", False, id="42"),
+    pytest.param("playbook_artifact_replay", "/tmp/load.json", "/tmp/load.json", id="43"),
+    pytest.param("playbook_artifact_save_as", "/tmp/save.json", "/tmp/save.json", id="44"),
+    pytest.param("plugin_name", "shell", "shell", id="45"),
+    pytest.param("plugin_type", "become", "become", id="46"),
+    pytest.param("pull_arguments", "--tls-verify=false", ["--tls-verify=false"], id="47"),
+    pytest.param("pull_policy", "never", "never", id="48"),
     pytest.param(
         "set_environment_variable",
         "T1=A,T2=B,T3=C",
         {"T1": "A", "T2": "B", "T3": "C"},
-        id="44",
+        id="49",
     ),
-    pytest.param("settings_effective", "false", False, id="45"),
-    pytest.param("settings_sample", "false", False, id="46"),
-    pytest.param("settings_schema", "json", "json", id="47"),
-    pytest.param("settings_sources", "false", False, id="48"),
-    pytest.param("time_zone", "Japan", "Japan", id="49"),
-    pytest.param("workdir", "/tmp/", "/tmp/", id="50"),
+    pytest.param("settings_effective", "false", False, id="50"),
+    pytest.param("settings_sample", "false", False, id="51"),
+    pytest.param("settings_schema", "json", "json", id="52"),
+    pytest.param("settings_sources", "false", False, id="53"),
+    pytest.param("time_zone", "Japan", "Japan", id="54"),
+    pytest.param("workdir", "/tmp/", "/tmp/", id="55"),
 ]
 
 SETTINGS = [
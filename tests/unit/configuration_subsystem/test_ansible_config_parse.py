@@ -1,5 +1,7 @@
 """Test the basic parsing of an ansible.cfg file."""
 
+import os
+
 from copy import deepcopy
 from pathlib import Path
 
@@ -10,7 +12,10 @@ from ansible_navigator.command_runner.command_runner import run_command
 from ansible_navigator.configuration_subsystem import Configurator
 from ansible_navigator.configuration_subsystem import Constants
 from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.configuration_subsystem.utils import ANSIBLE_VERSION_CACHE_FILE
+from ansible_navigator.configuration_subsystem.utils import ANSIBLE_VERSION_CACHE_TABLE
 from ansible_navigator.configuration_subsystem.utils import parse_ansible_cfg
+from ansible_navigator.utils.key_value_store import KeyValueStore
 
 
 ee_states = pytest.mark.parametrize(
@@ -236,3 +241,55 @@ def test_invalid_path(ee_enabled: bool, tmp_path: Path, monkeypatch: pytest.Monk
         )
     else:
         assert "does not exist" in parsed_cfg.messages[2].message
+
+
+def test_ansible_version_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Confirm the output of ansible --version is cached until a candidate file changes.
+
+    Args:
+        tmp_path: The path to a test temporary directory
+        monkeypatch: The monkeypatch fixture
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "calls"
+    ansible = bin_dir / "ansible"
+    ansible.write_text(
+        "#!/bin/sh\n"
+        f"echo called >> {calls!s}\n"
+        "echo 'ansible [core 2.16.0]'\n"
+        'if [ -f ansible.cfg ]; then echo "config file = $PWD/ansible.cfg";'
+        " else echo 'config file = None'; fi\n",
+    )
+    ansible.chmod(0o755)
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.chdir(project)
+    monkeypatch.setenv("PATH", f"{bin_dir!s}:{os.environ['PATH']}")
+    monkeypatch.delenv("ANSIBLE_CONFIG", raising=False)
+    cache_path = tmp_path / "cache"
+
+    for _ in range(2):
+        parsed_cfg = parse_ansible_cfg(ee_enabled=False, cache_path=cache_path)
+        assert parsed_cfg.config.path is Constants.NONE
+    assert len(calls.read_text().splitlines()) == 1
+
+    (project / "ansible.cfg").write_text(ANSIBLE_CFG_VALID)
+    for _ in range(2):
+        parsed_cfg = parse_ansible_cfg(ee_enabled=False, cache_path=cache_path)
+        assert parsed_cfg.config.path == project / "ansible.cfg"
+    assert len(calls.read_text().splitlines()) == 2
+
+    # Only the latest details are kept for the ansible executable
+    other_project = tmp_path / "other_project"
+    other_project.mkdir()
+    monkeypatch.chdir(other_project)
+    parse_ansible_cfg(ee_enabled=False, cache_path=cache_path)
+    assert len(calls.read_text().splitlines()) == 3
+    store = KeyValueStore(cache_path / ANSIBLE_VERSION_CACHE_FILE, ANSIBLE_VERSION_CACHE_TABLE)
+    assert list(store) == [str(ansible)]
+    store.close()
+
+    # Without a cache directory the command is always run
+    parse_ansible_cfg(ee_enabled=False)
+    assert len(calls.read_text().splitlines()) == 4
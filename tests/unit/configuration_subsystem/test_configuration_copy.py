@@ -0,0 +1,110 @@
+"""Tests for copying an application configuration."""
+
+from __future__ import annotations
+
+import time
+
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansible_navigator.actions.images import Action as images_action
+from ansible_navigator.configuration_subsystem import Configurator
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ansible_navigator.configuration_subsystem.definitions import ApplicationConfiguration
+
+
+LAUNCHES = 200
+"""The number of times an action is launched by the benchmark"""
+
+
+@pytest.fixture(name="configured")
+def fixture_configured() -> ApplicationConfiguration:
+    """Provide an initialized configuration.
+
+    Returns:
+        The configuration
+    """
+    application_configuration = deepcopy(NavigatorConfiguration)
+    application_configuration.internals.initializing = True
+    Configurator(
+        params=["images", "--ee", "false", "--mode", "stdout", "--senv", "ONE=1"],
+        application_configuration=application_configuration,
+    ).configure()
+    return application_configuration
+
+
+def test_copy_isolated(configured: ApplicationConfiguration) -> None:
+    """Confirm a copy can be changed without changing the original.
+
+    Args:
+        configured: An initialized configuration
+    """
+    copied = configured.copy()
+    assert copied.entries is not configured.entries
+    assert copied.internals is not configured.internals
+    assert copied.post_processor is not configured.post_processor
+    assert copied.initial is configured.initial
+    for entry in configured.entries:
+        copied_entry = copied.entry(entry.name)
+        assert copied_entry.value == entry.value
+        assert copied_entry.cli_parameters is entry.cli_parameters
+
+    copied.entry("app").value.current = "inventory"
+    copied.set_environment_variable["TWO"] = "2"
+    copied.original_command.append("--two")
+    copied.internals.initializing = True
+    assert configured.app == "images"
+    assert configured.set_environment_variable == {"ONE": "1"}
+    assert "--two" not in configured.original_command
+    assert configured.internals.initializing is False
+
+
+def test_copy_configure(configured: ApplicationConfiguration) -> None:
+    """Confirm a copy can be reconfigured without changing the original.
+
+    Args:
+        configured: An initialized configuration
+    """
+    copied = configured.copy()
+    _messages, exit_messages = Configurator(
+        params=["settings", "--ee", "false"],
+        application_configuration=copied,
+        apply_previous_cli_entries=["all"],
+    ).configure()
+    assert not exit_messages
+    assert copied.app == "settings"
+    assert configured.app == "images"
+    assert configured.set_environment_variable == {"ONE": "1"}
+    assert configured.initial.app == "images"
+
+
+def test_action_launch_benchmark(
+    configured: ApplicationConfiguration,
+    monkeypatch: pytest.MonkeyPatch,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Benchmark launching an action, with the configuration copied and deep copied.
+
+    The mean time to launch each way is recorded as a property of the test in the junit
+    report.
+
+    Args:
+        configured: An initialized configuration
+        monkeypatch: The monkeypatch fixture
+        record_property: The fixture to record a property of the test
+    """
+    for copier in ("copy", "deepcopy"):
+        if copier == "deepcopy":
+            monkeypatch.setattr(images_action, "_copy_args", staticmethod(deepcopy))
+        start = time.perf_counter()
+        for _ in range(LAUNCHES):
+            action = images_action(args=configured)
+        record_property(f"{copier}_launch_seconds", (time.perf_counter() - start) / LAUNCHES)
+        assert action._args.app == "images"
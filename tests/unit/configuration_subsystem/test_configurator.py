@@ -6,6 +6,7 @@ import os
 # pylint: disable=preferred-module
 from collections.abc import Callable
 from copy import deepcopy
+from pathlib import Path
 from typing import Any
 from unittest import mock
 from unittest.mock import patch
@@ -15,6 +16,7 @@ import pytest
 from ansible_navigator.configuration_subsystem import Configurator
 from ansible_navigator.configuration_subsystem import Constants as C
 from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.configuration_subsystem import configurator
 from ansible_navigator.configuration_subsystem.navigator_configuration import (
     generate_editor_command,
 )
@@ -57,3 +59,78 @@ def test_editor_command_from_editor(_mocked_func: Any, generate_config: Callable
         response = generate_config()
         assert response.exit_messages == []
         assert response.application_configuration.editor_command == "nano {filename}"
+
+
+def test_configuration_memoized(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure an unchanged settings file and ansible.cfg are not loaded again.
+
+    Args:
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.chdir(tmp_path)
+    settings_file = tmp_path / "ansible-navigator.yml"
+    settings_file.write_text("ansible-navigator:\n  logging:\n    level: debug\n")
+    (tmp_path / "ansible.cfg").write_text("[defaults]\n")
+
+    validate = mock.Mock(wraps=configurator.validate_with)
+    monkeypatch.setattr(configurator, "validate_with", validate)
+    parse_ansible_cfg = mock.Mock(wraps=configurator.parse_ansible_cfg)
+    monkeypatch.setattr(configurator, "parse_ansible_cfg", parse_ansible_cfg)
+
+    def configure() -> list[str]:
+        """Configure a new copy of the settings.
+
+        Returns:
+            The log messages
+        """
+        application_configuration = deepcopy(NavigatorConfiguration)
+        application_configuration.internals.initializing = True
+        application_configuration.internals.settings_file_path = str(settings_file)
+        messages, exit_messages = Configurator(
+            params=["images", "--ee", "false"],
+            application_configuration=application_configuration,
+        ).configure()
+        assert not exit_messages
+        assert application_configuration.log_level == "debug"
+        return [message.message for message in messages]
+
+    configure()
+    messages = configure()
+    assert validate.call_count == 1
+    assert parse_ansible_cfg.call_count == 1
+    assert any("reusing its contents" in message for message in messages)
+    assert any("reusing the parsed ansible.cfg" in message for message in messages)
+    assert any("stage 'apply_settings_file' took" in message for message in messages)
+
+    settings_file.write_text("ansible-navigator:\n  logging:\n    level: debug\n\n")
+    (tmp_path / "ansible.cfg").write_text("[defaults]\n\n")
+    configure()
+    assert validate.call_count == 2
+    assert parse_ansible_cfg.call_count == 2
+
+
+def test_settings_validator_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure the settings file schema is built once and each file is still validated.
+
+    Args:
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(configurator, "_settings_validators", {})
+    to_schema = mock.Mock(wraps=configurator.to_schema)
+    monkeypatch.setattr(configurator, "to_schema", to_schema)
+
+    for index, level in enumerate(("debug", "bogus")):
+        settings_file = tmp_path / f"ansible-navigator-{index}.yml"
+        settings_file.write_text(f"ansible-navigator:\n  logging:\n    level: {level}\n")
+        application_configuration = deepcopy(NavigatorConfiguration)
+        application_configuration.internals.initializing = True
+        application_configuration.internals.settings_file_path = str(settings_file)
+        _messages, exit_messages = Configurator(
+            params=["images", "--ee", "false"],
+            application_configuration=application_configuration,
+        ).configure()
+    assert to_schema.call_count == 1
+    assert any("'bogus' is not one of" in exit_message.message for exit_message in exit_messages)
@@ -236,6 +236,32 @@ def test_not_a_bool(
     assert exit_msg in [exit_msg.message for exit_msg in response.exit_messages]
 
 
+@pytest.mark.parametrize(
+    ("value", "exit_msg"),
+    (
+        pytest.param("0", "Value should be a positive integer, found '0'", id="zero"),
+        pytest.param("many", "Value should be valid integer.", id="not-integer"),
+    ),
+)
+def test_not_a_positive_integer(
+    monkeypatch: pytest.MonkeyPatch,
+    generate_config: GenerateConfigCallable,
+    value: str,
+    exit_msg: str,
+) -> None:
+    """Ensure exit_messages generated for a value which is not a positive integer.
+
+    Args:
+        monkeypatch: Fixture for patching
+        generate_config: Fixture to generate a config
+        value: The value provided
+        exit_msg: The start of the expected exit message
+    """
+    monkeypatch.setattr("shutil.which", which)
+    response = generate_config(params=["run", "site.yml", "--retb", value])
+    assert any(exit_message.message.startswith(exit_msg) for exit_message in response.exit_messages)
+
+
 choices = [entry for entry in NavigatorConfiguration.entries if entry.choices]
 
 
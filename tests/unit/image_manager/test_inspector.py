@@ -0,0 +1,130 @@
+"""Unit tests for image inspection."""
+
+from __future__ import annotations
+
+import json
+import sys
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansible_navigator.image_manager import inspect_all
+from ansible_navigator.image_manager import inspector
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+IMAGES = {
+    "1111aaaa": ("quay.io/org/ee", "latest"),
+    "2222bbbb": ("quay.io/org/ee", "v1"),
+    "3333cccc": ("quay.io/org/removed", "latest"),
+    "4444dddd": ("quay.io/org/untagged", "<none>"),
+}
+
+ENGINE = f"""#!{sys.executable}
+import json, sys
+images = {IMAGES!r}
+formatted = FORMATTED
+with open(sys.argv[0] + ".calls", "a") as calls:
+    calls.write(" ".join(sys.argv[1:]) + "\\n")
+if sys.argv[1] == "images" and "--format" in sys.argv:
+    if not formatted:
+        sys.exit(125)
+    for image_id, (repository, tag) in images.items():
+        print(json.dumps({{
+            "repository": repository, "tag": tag, "image_id": image_id,
+            "created": "2 weeks ago", "size": "1 GB",
+        }}))
+elif sys.argv[1] == "images":
+    print("REPOSITORY  TAG  IMAGE ID  CREATED  SIZE")
+    for image_id, (repository, tag) in images.items():
+        print(f"{{repository}}  {{tag}}  {{image_id}}  2 weeks ago  1 GB")
+elif sys.argv[1] == "inspect":
+    found = [arg for arg in sys.argv[2:] if arg != "3333cccc"]
+    print(json.dumps([{{"Id": "sha256:" + arg + "ffff", "RepoTags": []}} for arg in found]))
+    if len(found) < len(sys.argv[2:]):
+        print("Error: no such object: 3333cccc", file=sys.stderr)
+        sys.exit(125)
+"""
+
+
+def install_engine(tmp_path: Path, formatted: bool) -> str:
+    """Install a fake container engine.
+
+    Args:
+        tmp_path: The tmp path
+        formatted: Whether the engine supports formatting the list of images
+
+    Returns:
+        The path to the container engine
+    """
+    engine = tmp_path / "engine"
+    engine.write_text(ENGINE.replace("FORMATTED", str(formatted)))
+    engine.chmod(0o755)
+    return str(engine)
+
+
+@pytest.mark.parametrize("formatted", (True, False), ids=("json", "table"))
+def test_inspect_all(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, formatted: bool) -> None:
+    """Test all images are listed and inspected in chunks.
+
+    Args:
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+        formatted: Whether the engine supports formatting the list of images
+    """
+    monkeypatch.setattr(inspector, "INSPECT_CHUNK_SIZE", 2)
+    engine = install_engine(tmp_path, formatted=formatted)
+
+    images, error = inspect_all(container_engine=engine)
+    assert not error
+    by_id = {image["image_id"]: image for image in images}
+    assert list(by_id) == ["1111aaaa", "2222bbbb", "3333cccc"]
+    assert by_id["2222bbbb"]["repository"] == "quay.io/org/ee"
+    assert by_id["2222bbbb"]["tag"] == "v1"
+    assert by_id["2222bbbb"]["created"] == "2 weeks ago"
+    assert by_id["1111aaaa"]["inspect"] == {
+        "details": {"id": "sha256:1111aaaaffff", "repo_tags": []},
+        "errors": "",
+    }
+    assert by_id["3333cccc"]["inspect"]["details"] == []
+    assert "no such object" in by_id["3333cccc"]["inspect"]["errors"]
+
+    calls = (tmp_path / "engine.calls").read_text().splitlines()
+    inspects = sorted(call for call in calls if call.startswith("inspect"))
+    assert inspects == ["inspect 1111aaaa 2222bbbb", "inspect 3333cccc"]
+    assert len(calls) == (3 if formatted else 4)
+
+
+def test_inspect_all_timeout(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a container engine which hangs is reported as failed.
+
+    Args:
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr(inspector, "COMMAND_TIMEOUT", 0.5)
+    engine = tmp_path / "engine"
+    engine.write_text(f"#!{sys.executable}\nimport time\ntime.sleep(30)\n")
+    engine.chmod(0o755)
+
+    images, error = inspect_all(container_engine=str(engine))
+    assert images == []
+    assert error.startswith("Command timed out after 0.5 seconds")
+
+
+def test_inspect_parse() -> None:
+    """Test inspection output is matched to the requested image ids."""
+    command = inspector.Command(
+        identity="1111aaaa 2222bbbb",
+        command="",
+        post_process=inspector.ImagesInspect.parse,
+        stdout=json.dumps([{"Id": "2222bbbbffff"}]),
+        stderr="Error: no such object",
+    )
+    inspector.ImagesInspect.parse(command)
+    assert command.details == {"2222bbbb": {"id": "2222bbbbffff"}}
+    assert command.errors == "Error: no such object"
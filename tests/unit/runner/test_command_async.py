@@ -0,0 +1,106 @@
+"""Unit tests for the asynchronous runner command."""
+
+from __future__ import annotations
+
+import time
+
+from copy import deepcopy
+from queue import Queue
+from typing import TYPE_CHECKING
+from typing import Any
+
+from ansible_navigator.runner import CommandAsync
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+EVENTS = 50
+"""The number of setup module events handled for the benchmark"""
+
+
+def test_event_handler_copy() -> None:
+    """Test the queued event is isolated from the runner's event where navigator updates it."""
+    queue: Queue[dict[str, Any]] = Queue()
+    command = CommandAsync(executable_cmd="ansible-playbook", queue=queue, write_job_events=True)
+    res = {"ansible_facts": {"packages": {"bash": [{"version": "5.2"}]}}, "changed": False}
+    event = {
+        "event": "runner_on_ok",
+        "stdout": "ok: [localhost]",
+        "event_data": {"host": "localhost", "res": res},
+    }
+
+    assert command._event_handler(event) is True
+    queued = queue.get_nowait()
+    assert queued == event
+
+    queued["event_data"].update({"__result": "Ok", "__host": "localhost"})
+    queued["__extra"] = True
+    assert "__result" not in event["event_data"]
+    assert "__extra" not in event
+
+    # The nested result is shared, it is never updated once queued
+    assert queued["event_data"]["res"] is res
+
+
+def setup_event(host: int) -> dict[str, Any]:
+    """Create an event for the setup module with a result the size gathered from a server.
+
+    Args:
+        host: The number of the host
+
+    Returns:
+        The event
+    """
+    facts: dict[str, Any] = {f"ansible_fact_{index}": f"value {index}" for index in range(300)}
+    facts["ansible_packages"] = {
+        f"package-{index}": [{"arch": "x86_64", "release": "1.el9", "version": f"{index}.0"}]
+        for index in range(1500)
+    }
+    facts["ansible_interfaces"] = [f"eth{index}" for index in range(8)]
+    for index in range(8):
+        facts[f"ansible_eth{index}"] = {
+            "device": f"eth{index}",
+            "ipv4": {"address": f"10.0.{host % 256}.{index}", "netmask": "255.255.255.0"},
+            "features": {f"feature_{feature}": "off [fixed]" for feature in range(60)},
+        }
+    facts["ansible_mounts"] = [
+        {"mount": f"/mnt/{index}", "fstype": "xfs", "size_total": index * 1024}
+        for index in range(30)
+    ]
+    return {
+        "event": "runner_on_ok",
+        "stdout": f"ok: [host{host}]",
+        "event_data": {
+            "host": f"host{host}",
+            "task_action": "ansible.builtin.setup",
+            "res": {"ansible_facts": facts, "changed": False},
+        },
+    }
+
+
+def test_event_handler_benchmark(record_property: Callable[[str, object], None]) -> None:
+    """Benchmark queueing setup module events, copying them as the handler does and deeply.
+
+    The mean time to queue an event each way is recorded as a property of the test in the
+    junit report.
+
+    Args:
+        record_property: The fixture to record a property of the test
+    """
+    events = [setup_event(host) for host in range(EVENTS)]
+    queue: Queue[dict[str, Any]] = Queue()
+    command = CommandAsync(executable_cmd="ansible-playbook", queue=queue, write_job_events=True)
+
+    start = time.perf_counter()
+    for event in events:
+        command._event_handler(event)
+    record_property("handler_event_seconds", (time.perf_counter() - start) / EVENTS)
+
+    start = time.perf_counter()
+    for event in events:
+        queue.put(deepcopy(event))
+    record_property("deepcopy_event_seconds", (time.perf_counter() - start) / EVENTS)
+
+    assert queue.qsize() == 2 * EVENTS
@@ -0,0 +1,227 @@
+"""Unit tests for running commands in a long-lived container."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansible_navigator.runner import AnsibleConfig
+from ansible_navigator.runner import AnsibleInventory
+from ansible_navigator.runner import Command
+from ansible_navigator.runner import command_server
+from ansible_navigator.runner.command_server import CommandServer
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+IMAGE = "test-image:latest"
+
+
+def install_engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, script: str) -> None:
+    """Install a fake podman at the start of the path.
+
+    Args:
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+        script: The content of the podman script
+    """
+    engine = tmp_path / "podman"
+    engine.write_text(script)
+    engine.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+
+@pytest.fixture(name="container_engine")
+def fixture_container_engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Provide a container engine which runs the command after the image locally.
+
+    Args:
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+
+    Yields:
+        The name of the container engine
+    """
+    install_engine(
+        tmp_path,
+        monkeypatch,
+        f"#!{sys.executable}\n"
+        "import os, sys\n"
+        f"command = sys.argv[sys.argv.index({IMAGE!r}) + 1:]\n"
+        "os.execvp(command[0], command)\n",
+    )
+    yield "podman"
+    CommandServer.close_all()
+
+
+def command(container_engine: str, cmdline: list[str]) -> Command:
+    """Create a command run by a persistent container.
+
+    Args:
+        container_engine: The name of the container engine
+        cmdline: The arguments for python
+
+    Returns:
+        The command
+    """
+    return Command(
+        executable_cmd=sys.executable,
+        cmdline=cmdline,
+        container_engine=container_engine,
+        execution_environment=True,
+        execution_environment_image=IMAGE,
+        navigator_mode="interactive",
+        persistent=True,
+    )
+
+
+def test_command_server(container_engine: str) -> None:
+    """Test commands are run by one long-lived server.
+
+    The parent of the command is the server, it is the same for each command.
+
+    Args:
+        container_engine: The name of the container engine
+    """
+    script = "import os, sys; print(os.getppid()); sys.stderr.write('err'); sys.exit(3)"
+    first = command(container_engine, ["-c", script]).run()
+    second = command(container_engine, ["-c", script]).run()
+    assert first == second
+    output, error, return_code = first
+    assert output.strip().isdigit()
+    assert error == "err"
+    assert return_code == 3
+
+
+def test_command_server_failed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a command is run in a container of its own if the server fails.
+
+    Args:
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+    """
+    install_engine(tmp_path, monkeypatch, "#!/bin/sh\nexit 1\n")
+    server = CommandServer.for_args(
+        {"container_image": IMAGE, "process_isolation_executable": "podman"},
+    )
+    assert server.run(sys.executable, ["-c", "print('hello')"]) is None
+    assert server.run(sys.executable, ["-c", "print('hello')"]) is None
+    # The failed server is forgotten, so another is started for the next command
+    assert (
+        CommandServer.for_args(
+            {"container_image": IMAGE, "process_isolation_executable": "podman"},
+        )
+        is not server
+    )
+    CommandServer.close_all()
+
+    output, _error, return_code = command("podman", ["-c", "print('hello')"]).run()
+    assert "hello" not in output
+    assert return_code == 1
+
+
+def test_command_server_timeout(
+    container_engine: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a command is run in a container of its own if the server does not respond in time.
+
+    The command hangs the first time it is run, by the server, and not when run again.
+
+    Args:
+        container_engine: The name of the container engine
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr(command_server, "RESPONSE_TIMEOUT", 1)
+    monkeypatch.setattr(command_server, "SHUTDOWN_TIMEOUT", 1)
+    marker = tmp_path / "marker"
+    script = (
+        "import pathlib, time\n"
+        f"marker = pathlib.Path({str(marker)!r})\n"
+        "if not marker.exists():\n"
+        "    marker.touch()\n"
+        "    time.sleep(5)\n"
+        "print('done')\n"
+    )
+    output, _error, return_code = command(container_engine, ["-c", script]).run()
+    assert output.strip() == "done"
+    assert return_code == 0
+    assert not CommandServer._servers
+
+
+def test_command_server_ansible_config(
+    container_engine: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test ansible-config is run by the server, as ansible-runner would run it.
+
+    Args:
+        container_engine: The name of the container engine
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+    """
+    calls = tmp_path / "calls"
+    ansible_config = tmp_path / "ansible-config"
+    ansible_config.write_text(
+        f'#!/bin/sh\necho "$@" >> {calls}\necho "$PPID"\necho warning >&2\n',
+    )
+    ansible_config.chmod(0o755)
+    runner = AnsibleConfig(
+        container_engine=container_engine,
+        execution_environment=True,
+        execution_environment_image=IMAGE,
+        navigator_mode="interactive",
+        persistent=True,
+    )
+    first = runner.fetch_ansible_config("dump", config_file="ansible.cfg", only_changed=True)
+    second = runner.fetch_ansible_config("list")
+    assert first[0] == second[0]
+    assert first[1] == "warning\n"
+    assert calls.read_text().splitlines() == ["dump -c ansible.cfg --only-changed", "list"]
+
+
+def test_command_server_ansible_inventory(
+    container_engine: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test ansible-inventory is run by the server, as ansible-runner would run it.
+
+    Args:
+        container_engine: The name of the container engine
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+    """
+    calls = tmp_path / "calls"
+    ansible_inventory = tmp_path / "ansible-inventory"
+    ansible_inventory.write_text(
+        f'#!/bin/sh\necho "$@" >> {calls}\necho "{{\\"ppid\\": $PPID}}"\necho warning >&2\n',
+    )
+    ansible_inventory.chmod(0o755)
+    runner = AnsibleInventory(
+        container_engine=container_engine,
+        execution_environment=True,
+        execution_environment_image=IMAGE,
+        navigator_mode="interactive",
+        persistent=True,
+    )
+    first = runner.fetch_inventory("list", inventories=["one.yml", "two.yml"], playbook_dir="/pb")
+    second = runner.fetch_inventory(
+        "host", inventories=["one.yml"], host="web", response_format="json"
+    )
+    assert first[0].strip() == '{"ppid": ' + str(second[0]["ppid"]) + "}"
+    assert first[1] == "warning\n"
+    assert calls.read_text().splitlines() == [
+        "--list -i one.yml -i two.yml --playbook-dir /pb",
+        "--host web -i one.yml",
+    ]
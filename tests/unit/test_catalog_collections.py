@@ -1,58 +1,125 @@
 """Unit tests for catalog collections."""
 
-import multiprocessing
+import shutil
 
 from pathlib import Path
-from typing import Any
 
-from ansible_navigator.data.catalog_collections import worker
+import pytest
 
+from ansible_navigator.data import catalog_collections
+from ansible_navigator.data.catalog_collections import CATALOG_INDEX_TABLE
+from ansible_navigator.data.catalog_collections import PLUGIN_SUMMARY_TABLE
+from ansible_navigator.data.catalog_collections import CollectionCatalog
+from ansible_navigator.data.catalog_collections import extract_docs
+from ansible_navigator.data.catalog_collections import summarize_doc
+from ansible_navigator.utils.key_value_store import KeyValueStore
 
-def test_worker_with_failed_get_docstring() -> None:
-    """Test worker function.
 
-    Test worker function when get_docstring fails and
+def test_extract_docs_with_failed_get_docstring() -> None:
+    """Test extract docs function.
+
+    Test extract docs function when get_docstring fails and
      get_doc_withast method is used to parse the content.
     """
-    # Create the queues
-    pending_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
-    completed_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
-
     plugin_path = Path("tests/fixtures/common/module_1.py")
     collection_name = "microsoft.ad"
     checksum = "12345"
 
-    # Add an entry to the pending queue
-    entry = collection_name, checksum, plugin_path
-    pending_queue.put(entry)
-
-    # Add a None entry to signal the end of processing
-    pending_queue.put(None)
-
-    worker(pending_queue, completed_queue)
-
-    plugin_path, data = completed_queue.get()
+    (message_type, data), *_rest = extract_docs(
+        [(collection_name, checksum, plugin_path, "module")]
+    )
+    assert message_type == "plugin"
     assert "vCenter" in data[1]
+    assert data[2]["name"] == "vcenter_mod"
 
 
-def test_worker_with_invalid_plugin_path() -> None:
-    """Test the worker function when get_docstring has invalid plugin_path."""
-    pending_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
-    completed_queue: multiprocessing.Queue[Any] = multiprocessing.Queue()
-
+def test_extract_docs_with_invalid_plugin_path() -> None:
+    """Test the extract docs function when get_docstring has invalid plugin_path."""
     plugin_path = Path("tests/fixtures/common/xyz.py")
     collection_name = "microsoft.ad"
     checksum = "12345"
 
-    # Add an entry to the pending queue
-    entry = collection_name, checksum, plugin_path
-    pending_queue.put(entry)
+    (message_type, data), *_rest = extract_docs(
+        [(collection_name, checksum, plugin_path, "module")]
+    )
+    assert message_type == "error"
+    assert "FileNotFoundError (get_docstring)" in data[2]
 
-    # Add a None entry to signal the end of processing
-    pending_queue.put(None)
 
-    worker(pending_queue, completed_queue)
+def test_retrieve_docs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test plugins are extracted in batches and written to the cache.
 
-    plugin_path, data = completed_queue.get()
-    assert plugin_path == "error"
-    assert "FileNotFoundError (get_docstring)" in data[2]
+    Args:
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr(catalog_collections, "BATCH_SIZE", 2)
+    missing = [
+        ("microsoft.ad", f"checksum_{number}", Path("tests/fixtures/common/module_1.py"), "module")
+        for number in range(4)
+    ]
+    missing.append(
+        ("microsoft.ad", "checksum_error", Path("tests/fixtures/common/xyz.py"), "module"),
+    )
+    collection_cache = KeyValueStore(tmp_path / "collection_doc_cache.db")
+    plugin_summaries = collection_cache.table(PLUGIN_SUMMARY_TABLE)
+    errors: list[dict[str, str]] = []
+    stats = {"cache_added_success": 0, "cache_added_errors": 0}
+    messages: list[str] = []
+
+    catalog_collections.retrieve_docs(
+        collection_cache,
+        plugin_summaries,
+        errors,
+        missing,
+        stats=stats,
+        messages=messages,
+    )
+    assert stats == {"cache_added_success": 4, "cache_added_errors": 1}
+    assert sorted(collection_cache.keys()) == sorted(entry[1] for entry in missing)
+    assert sorted(plugin_summaries.keys()) == [f"checksum_{number}" for number in range(4)]
+    assert [error["path"] for error in errors] == ["tests/fixtures/common/xyz.py"]
+    assert messages[-1].startswith("Retrieved docs for 5/5 plugins")
+
+
+def test_catalog_index(tmp_path: Path) -> None:
+    """Test unchanged collections are reused from the catalog index.
+
+    Args:
+        tmp_path: The tmp path
+    """
+    directory = tmp_path / "collections"
+    shutil.copytree("tests/fixtures/common/collections", directory)
+    index = KeyValueStore(tmp_path / "collection_doc_cache.db", table=CATALOG_INDEX_TABLE)
+
+    catalog = CollectionCatalog(directories=[directory], index=index)
+    collections, errors = catalog.process_directories()
+    assert catalog.stats["collections_reused"] == 0
+    assert catalog.stats["files_hashed"] > 0
+
+    catalog = CollectionCatalog(directories=[directory], index=index)
+    assert catalog.process_directories() == (collections, errors)
+    assert catalog.stats["collections_reused"] == len(collections)
+    assert catalog.stats["files_hashed"] == 0
+
+    plugin_file = next(directory.glob("ansible_collections/*/*/plugins/modules/*.py"))
+    plugin_file.write_text(plugin_file.read_text() + "\n# changed\n")
+    catalog = CollectionCatalog(directories=[directory], index=index)
+    reprocessed, _errors = catalog.process_directories()
+    assert catalog.stats["collections_reused"] == len(collections) - 1
+    assert catalog.stats["files_hashed"] == 1
+    assert reprocessed.keys() == collections.keys()
+
+
+def test_summarize_doc() -> None:
+    """Test a plugin's doc is summarized for the menu of a collection's content."""
+    doc = {"module": "ping", "short_description": "Try to connect", "version_added": "1.0"}
+    assert summarize_doc(doc, "module") == {
+        "name": "ping",
+        "version_added": "1.0",
+        "short_description": "Try to connect",
+    }
+    summary = summarize_doc({**doc, "name": "renamed"}, "module")
+    assert summary is not None
+    assert summary["name"] == "renamed"
+    assert summarize_doc(None, "module") is None
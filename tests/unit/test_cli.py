@@ -9,11 +9,14 @@ from typing import Literal
 from typing import NamedTuple
 
 # pylint: disable=preferred-module
+from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
 
+from ansible_navigator import cli
 from ansible_navigator.cli import NavigatorConfiguration
+from ansible_navigator.cli import log_dependencies
 from ansible_navigator.cli import main
 from ansible_navigator.initialization import parse_and_update
 from tests.defaults import FIXTURES_DIR
@@ -283,8 +286,68 @@ def test_for_version_logged(
         "never",
     ]
     monkeypatch.setattr("sys.argv", command_line)
+    monkeypatch.setattr(NavigatorConfiguration.internals, "cache_path", tmp_path / "cache")
     with pytest.raises(SystemExit):
         # A SystemExit happens here because the container vanishes quickly
         main()
     assert "ansible-navigator==" in caplog.text
     assert "ansible-runner==" in caplog.text
+
+
+def test_log_dependencies_cached(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Ensure the installed packages are found again only when sys.path changes.
+
+    Args:
+        monkeypatch: The monkey patch fixture
+        tmp_path: A temporary director for this test
+    """
+    packages_distributions = Mock(wraps=cli.importlib_metadata.packages_distributions)
+    monkeypatch.setattr(
+        cli.importlib_metadata,
+        "packages_distributions",
+        packages_distributions,
+    )
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    monkeypatch.syspath_prepend(str(site_packages))
+    cache_path = tmp_path / "cache"
+
+    messages = log_dependencies(cache_path=cache_path)
+    assert any(message.message.startswith("ansible-runner==") for message in messages)
+    assert log_dependencies(cache_path=cache_path) == messages
+    assert packages_distributions.call_count == 1
+
+    (site_packages / "new_package").mkdir()
+    assert log_dependencies(cache_path=cache_path) == messages
+    assert packages_distributions.call_count == 2
+
+
+def test_dependencies_not_logged(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    tmp_path: Path,
+) -> None:
+    """Ensure the installed packages are not found unless debug logging is enabled.
+
+    Args:
+        monkeypatch: The monkey patch fixture
+        caplog: The log capture fixture
+        tmp_path: A temporary director for this test
+    """
+    monkeypatch.setattr(cli, "log_dependencies", Mock(side_effect=AssertionError))
+    command_line = [
+        "ansible-navigator",
+        "settings",
+        "--effective",
+        "--ee",
+        "false",
+        "--mode",
+        "stdout",
+        "--ll",
+        "info",
+        "--lf",
+        str(tmp_path / "log.txt"),
+    ]
+    monkeypatch.setattr("sys.argv", command_line)
+    main()
+    assert "ansible-runner==" not in caplog.text
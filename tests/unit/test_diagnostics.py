@@ -0,0 +1,142 @@
+"""Unit tests for the diagnostics collector."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+from copy import deepcopy
+from typing import TYPE_CHECKING
+
+from ansible_navigator import diagnostics
+from ansible_navigator.configuration_subsystem import NavigatorConfiguration
+from ansible_navigator.diagnostics import Collector
+from ansible_navigator.diagnostics import DiagnosticsCollector
+from ansible_navigator.diagnostics import FailedCollectionError
+from ansible_navigator.diagnostics import JSONTypes
+from ansible_navigator.diagnostics import diagnostic_runner
+from ansible_navigator.diagnostics import register
+from ansible_navigator.utils.serialize import write_diagnostics_json
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+RELEASE = threading.Event()
+
+
+class Collectors(DiagnosticsCollector):
+    """Collectors which wait, fail or hang."""
+
+    @diagnostic_runner
+    @register(Collector(name="first"))
+    def _first(self) -> dict[str, JSONTypes]:
+        """Wait before returning.
+
+        Returns:
+            The result
+        """
+        time.sleep(0.5)
+        return {"name": "first"}
+
+    @diagnostic_runner
+    @register(Collector(name="second"))
+    def _second(self) -> dict[str, JSONTypes]:
+        """Wait and then fail.
+
+        Raises:
+            FailedCollectionError: Always
+        """
+        time.sleep(0.5)
+        raise FailedCollectionError({"name": "second"})
+
+    @diagnostic_runner
+    @register(Collector(name="hung", timeout=1))
+    def _hung(self) -> dict[str, JSONTypes]:
+        """Wait until released and then fail.
+
+        Raises:
+            FailedCollectionError: Always
+        """
+        RELEASE.wait()
+        raise FailedCollectionError({"name": "hung"})
+
+
+def test_collect(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test collectors run concurrently and a collector which hangs times out.
+
+    The collector which timed out is reported as failed once, when it times out.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+        capsys: The capture fixture
+    """
+    monkeypatch.setattr(diagnostics, "DIAGNOSTIC_FAILURES", 0)
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("display_color").value.current = False
+    collectors = Collectors(args=args, messages=[], exit_messages=[])
+
+    start = time.monotonic()
+    results = collectors._collect(
+        {
+            "first": collectors._first,
+            "second": collectors._second,
+            "hung": collectors._hung,
+        },
+    )
+    assert time.monotonic() - start < 1.5
+    RELEASE.set()
+    hung = next(thread for thread in threading.enumerate() if thread.name == "diagnostics_hung")
+    hung.join(timeout=5)
+    assert not hung.is_alive()
+
+    assert results["first"]["name"] == "first"
+    assert results["second"]["name"] == "second"
+    assert results["hung"] == {"error": "Collection timed out after 1 seconds", "duration": 1}
+    assert results["first"]["duration"] >= 0.5  # type: ignore[operator]
+    assert diagnostics.DIAGNOSTIC_FAILURES == 2
+
+    output = capsys.readouterr().out
+    assert "First information collected" in output
+    assert "Second information collection failed" in output
+    assert output.count("Hung information collection failed") == 1
+
+
+def test_log_collector(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test only the end of each log file is collected and the report is written.
+
+    Args:
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+        capsys: The capture fixture
+    """
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "ansible-navigator.log").write_text(
+        "".join(f"line {number}\n" for number in range(1000)),
+    )
+    args = deepcopy(NavigatorConfiguration)
+    args.entry("display_color").value.current = False
+    args.entry("log_file").value.current = str(tmp_path / "ansible-navigator.log")
+    args.entry("log_diagnostics_lines").value.current = 10
+    collector = DiagnosticsCollector(args=args, messages=[], exit_messages=[])
+    # Settings which could not be resolved fall back to their default
+    assert collector._log_bytes == args.entry("log_diagnostics_bytes").value.default
+
+    logs = collector._log_collector()
+    capsys.readouterr()
+    assert len(logs["logs"]) == 1  # type: ignore[arg-type]
+    log = logs["logs"][0]  # type: ignore[index]
+    assert log["contents"] == [f"line {number}" for number in range(990, 1000)]
+    assert log["truncated"] is True
+    assert log["size"] == (tmp_path / "ansible-navigator.log").stat().st_size
+
+    report = tmp_path / "diagnostics.json"
+    write_diagnostics_json(str(report), 0o600, {"logs": logs})
+    assert report.read_text() == json.dumps({"logs": logs}, indent=4, sort_keys=True)
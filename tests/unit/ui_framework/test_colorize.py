@@ -2,25 +2,41 @@
 
 from __future__ import annotations
 
+import base64
+import json
+import time
+
 from typing import TYPE_CHECKING
 from typing import NamedTuple
 from unittest.mock import MagicMock  # pylint: disable=W0407
 from unittest.mock import patch  # pylint: disable=W0407
 
-
-if TYPE_CHECKING:
-    import pytest
+import pytest
 
 from ansible_navigator.constants import GRAMMAR_DIR
 from ansible_navigator.constants import THEME_PATH
 from ansible_navigator.content_defs import ContentFormat
 from ansible_navigator.content_defs import ContentView
 from ansible_navigator.content_defs import SerializationFormat
+from ansible_navigator.tm_tokenize.grammars import Grammars
+from ansible_navigator.tm_tokenize.region import Region
+from ansible_navigator.tm_tokenize.tokenize import tokenize
+from ansible_navigator.ui_framework.colorize import AnsiLines
 from ansible_navigator.ui_framework.colorize import Colorize
+from ansible_navigator.ui_framework.colorize import ColorSchema
+from ansible_navigator.ui_framework.colorize import RenderedLines
+from ansible_navigator.ui_framework.colorize import columns_and_colors
 from ansible_navigator.ui_framework.curses_defs import SimpleLinePart
+from ansible_navigator.utils.log_tail import AppendOnlyLines
 from ansible_navigator.utils.serialize import serialize
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ansible_navigator.tm_tokenize.region import Regions
+
+
 class Sample(NamedTuple):
     """Sample data for colorize tests."""
 
@@ -191,3 +207,228 @@ def test_styled_markdown() -> None:
     assert result == [
         [SimpleLinePart(chars="This is a header\n", column=0, color=(86, 156, 214), style="bold")],
     ]
+
+
+def test_render_lazy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure lines rendered on demand match the document rendered in full.
+
+    Lines are accessed out of order, so tokenizing resumes from a checkpoint.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr("ansible_navigator.ui_framework.colorize.CHECKPOINT_INTERVAL", 5)
+    monkeypatch.setattr("ansible_navigator.ui_framework.colorize.RENDERED_CACHE_SIZE", 10)
+    doc = YAML_TXT * 10
+    scope = ContentFormat.YAML_TXT.value.scope
+    colorize = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    expected = colorize.render(doc=doc, scope=scope)
+
+    lazy = colorize.render_lazy(doc=doc, scope=scope)
+    assert isinstance(lazy, RenderedLines)
+    assert len(lazy) == len(expected) == len(YAML_TXT_EXPECTED) * 10
+    assert lazy[60:70] == expected[60:70]
+    assert lazy[12] == expected[12]
+    assert lazy[-1] == expected[-1]
+    assert lazy[3:40:3] == expected[3:40:3]
+    assert lazy[:] == expected
+
+
+@patch("ansible_navigator.ui_framework.colorize.tokenize")
+def test_render_lazy_graceful_failure(
+    mocked_func: MagicMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Ensure a tokenization error while rendering on demand renders without color.
+
+    Args:
+        mocked_func: Mocked fixture
+        caplog: Capture log
+    """
+    mocked_func.side_effect = ValueError()
+    sample = serialize(**SAMPLE_JSON)
+
+    lazy = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH).render_lazy(
+        doc=sample,
+        scope="source.json",
+    )
+    assert [line[0].chars for line in lazy[:]] == sample.splitlines()
+    assert "rendered without color" in caplog.text
+
+
+def test_columns_and_colors_overlapping_regions() -> None:
+    """Ensure later regions take precedence for color and style independently."""
+    schema = ColorSchema(
+        {
+            "tokenColors": [
+                {"scope": "outer", "settings": {"foreground": "#010101"}},
+                {"scope": "inner", "settings": {"foreground": "#020202"}},
+                {"scope": "bold", "settings": {"fontStyle": "bold"}},
+            ],
+        },
+    )
+    regions = (
+        Region(0, 10, ("outer",)),
+        Region(2, 4, ("inner",)),
+        Region(3, 6, ("bold",)),
+        Region(6, 6, ("inner",)),
+        Region(8, 10, ("unknown",)),
+    )
+    result = columns_and_colors([(regions, "0123456789\n")], schema)
+    assert result == [
+        [
+            SimpleLinePart(chars="01", column=0, color=(1, 1, 1), style=None),
+            SimpleLinePart(chars="2", column=2, color=(2, 2, 2), style=None),
+            SimpleLinePart(chars="3", column=3, color=(2, 2, 2), style="bold"),
+            SimpleLinePart(chars="45", column=4, color=(1, 1, 1), style="bold"),
+            SimpleLinePart(chars="6789", column=6, color=(1, 1, 1), style=None),
+            SimpleLinePart(chars="\n", column=10, color=None, style=None),
+        ],
+    ]
+    assert columns_and_colors([((), "")], schema) == [
+        [SimpleLinePart(chars="", column=0, color=None, style=None)],
+    ]
+
+
+LONG_LINE_LENGTH = 20_000
+
+LONG_LINES = {
+    "source.json": json.dumps(
+        {"blob": base64.b64encode(bytes(range(256)) * 40).decode(), "items": list(range(1500))},
+    ),
+    "source.yaml": "certificate: "
+    + "MIIDdzCCAl+gAwIBAgIEAgAAuTANBgkqhkiG9w0BAQUFADBaMQswCQYDVQQGEwJJ" * 320,
+    "source.shell": " && ".join(f'echo "item {item}" | grep -v item' for item in range(700)),
+    "text.html.markdown": "Some `code` and *emphasis* " * 800,
+}
+
+
+def per_character_parts(
+    lines: list[tuple[Regions, str]],
+    schema: ColorSchema,
+) -> list[list[SimpleLinePart]]:
+    """Assemble the parts of lines one character at a time, as a reference.
+
+    Each character is colored for every region and the characters are then grouped.
+
+    Args:
+        lines: Lines of text and their regions
+        schema: The color schema
+
+    Returns:
+        Lines of text, each broken into parts
+    """
+    results = []
+    for regions, text in lines:
+        characters = [
+            SimpleLinePart(chars=character, color=None, column=0, style=None) for character in text
+        ]
+        for region in regions:
+            color, style = schema.get_color_and_style(region.scope)
+            for character in characters[region.start : region.end]:
+                character.color = color or character.color
+                character.style = style or character.style
+        grouped: list[SimpleLinePart] = []
+        for column, character in enumerate(characters):
+            if grouped and (character.color, character.style) == (
+                grouped[-1].color,
+                grouped[-1].style,
+            ):
+                grouped[-1].chars += character.chars
+            else:
+                character.column = column
+                grouped.append(character)
+        results.append(grouped or [SimpleLinePart(chars=text, color=None, column=0, style=None)])
+    return results
+
+
+def fastest(func: Callable[[], object]) -> float:
+    """Time a function, taking the fastest of three runs.
+
+    Args:
+        func: The function
+
+    Returns:
+        The seconds taken by the fastest run
+    """
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.mark.parametrize("scope", LONG_LINES)
+def test_long_line_benchmark(scope: str, record_property: Callable[[str, object], None]) -> None:
+    """Benchmark assembling the parts of a long line with each of the bundled grammars.
+
+    The line is tokenized first, only assembling the parts is timed. The parts are compared
+    to, and timed against, a reference which colors each character for every region. Both
+    timings are recorded as properties of the test in the junit report.
+
+    Args:
+        scope: The scope of the grammar
+        record_property: The fixture to record a property of the test
+    """
+    line = LONG_LINES[scope] + "\n"
+    assert len(line) > LONG_LINE_LENGTH
+    compiler = Grammars(str(GRAMMAR_DIR)).compiler_for_scope(scope)
+    _state, regions = tokenize(compiler, compiler.root_state, line, True)
+    schema = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)._schema
+    lines = [(regions, line)]
+
+    result = columns_and_colors(lines, schema)
+    assert result == per_character_parts(lines, schema)
+
+    seconds = fastest(lambda: columns_and_colors(lines, schema))
+    reference_seconds = fastest(lambda: per_character_parts(lines, schema))
+    record_property("columns_and_colors_seconds", seconds)
+    record_property("per_character_seconds", reference_seconds)
+
+    assert "".join(part.chars for part in result[0]) == line
+    column = 0
+    for part in result[0]:
+        assert part.column == column
+        column += len(part.chars)
+
+
+def test_ansi_lines() -> None:
+    """Ensure ansi lines are converted once, as they are appended."""
+    stdout = ["\x1b[0;32mok: [localhost]\x1b[0m", "plain"]
+    lines = AnsiLines(stdout)
+    assert len(lines) == 2
+    assert lines[-1] == Colorize.render_ansi(doc="plain")[0]
+    assert lines[0:2] == Colorize.render_ansi(doc="\n".join(stdout))
+
+    stdout.extend(["\x1b[0;31mfailed\x1b[0m", "more"])
+    converted = lines[0]
+    assert lines[:] == Colorize.render_ansi(doc="\n".join(stdout))
+    assert str(lines) == "\n".join(stdout)
+    assert lines[0] is converted
+
+    stdout.clear()
+    stdout.append("again")
+    assert lines[:] == Colorize.render_ansi(doc="again")
+    with pytest.raises(IndexError):
+        lines[1]  # pylint: disable=pointless-statement
+
+
+def test_render_lines_appended(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure lines appended after rendering are rendered as when rendered in full.
+
+    Args:
+        monkeypatch: The monkeypatch fixture
+    """
+    monkeypatch.setattr("ansible_navigator.ui_framework.colorize.CHECKPOINT_INTERVAL", 4)
+    scope = ContentFormat.YAML_TXT.value.scope
+    colorize = Colorize(grammar_dir=GRAMMAR_DIR, theme_path=THEME_PATH)
+    doc_lines = (YAML_TXT * 3).splitlines()
+
+    lines = AppendOnlyLines(doc_lines[:5])
+    rendered = colorize.render_lines(lines=lines, scope=scope)
+    assert rendered[:] == YAML_TXT_EXPECTED[:5]
+    lines.extend(doc_lines[5:])
+    assert len(rendered) == len(doc_lines)
+    assert rendered[-3:] == YAML_TXT_EXPECTED[-3:]
+    assert rendered[:] == YAML_TXT_EXPECTED * 3
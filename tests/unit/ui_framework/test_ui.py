@@ -0,0 +1,30 @@
+"""Tests for the main UI renderer."""
+
+from __future__ import annotations
+
+from ansible_navigator.ui_framework import AnsiLines
+from ansible_navigator.ui_framework import AppendOnlyLines
+from ansible_navigator.ui_framework import Content
+
+
+def test_content_joins_lines_when_read() -> None:
+    """Ensure lines of output are only joined into a string when the content is read."""
+    lines = ["one"]
+    content = Content(showing=AnsiLines(lines))
+    lines.append("two")
+    assert content.showing == "one\ntwo"
+    assert content.showing is content.showing
+
+
+def test_content_other_objects() -> None:
+    """Ensure objects other than lines of output are shown unchanged."""
+    showing = {"task_action": "debug"}
+    assert Content(showing=showing).showing is showing
+
+
+def test_content_joins_append_only_lines_when_read() -> None:
+    """Ensure lines read from a growing file are only joined when the content is read."""
+    lines = AppendOnlyLines(["one"])
+    content = Content(showing=lines)
+    lines.append("two")
+    assert content.showing == "one\ntwo"
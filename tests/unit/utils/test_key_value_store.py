@@ -1,10 +1,23 @@
 """Test KVS from ansible_navigator.utils."""
 
+from __future__ import annotations
+
+import time
 import types
 
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansible_navigator.utils.key_value_store import MAX_VARIABLES
 from ansible_navigator.utils.key_value_store import KeyValueStore
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
 def test_kvs_save_restore(empty_kvs: KeyValueStore) -> None:
     """Test basic KVS write to disk and restore.
 
@@ -144,3 +157,149 @@ def test_kvs_repr(kvs: KeyValueStore, empty_kvs: KeyValueStore) -> None:
     )
 
     assert repr(empty_kvs) == "KeyValueStore()"
+
+
+def test_kvs_tables(empty_kvs: KeyValueStore) -> None:
+    """Test key-value stores in different tables of one database are separate.
+
+    Args:
+        empty_kvs: An empty key-value store
+    """
+    empty_kvs["hello"] = "whoop"
+    empty_kvs.close()
+
+    other = KeyValueStore(empty_kvs.path, table="other")
+    assert "hello" not in other
+    other["hello"] = "there"
+    other.close()
+
+    assert KeyValueStore(empty_kvs.path)["hello"] == "whoop"
+    assert KeyValueStore(empty_kvs.path, table="other")["hello"] == "there"
+
+    with pytest.raises(ValueError, match="Invalid key-value store table name"):
+        KeyValueStore(empty_kvs.path, table="kv; DROP TABLE kv")
+
+
+def test_kvs_bulk(kvs: KeyValueStore) -> None:
+    """Test KVS get_many(), contains_many() and set_many().
+
+    Args:
+        kvs: A key-value store populated with data
+    """
+    keys = [f"key_{number}" for number in range(MAX_VARIABLES * 2 + 1)]
+    kvs.set_many((key, key.upper()) for key in keys)
+    kvs.set_many({"apple": "green"})
+    assert len(kvs) == len(keys) + 4
+
+    assert kvs.get_many(["apple", "cherry", "key_0"]) == {"apple": "green", "key_0": "KEY_0"}
+    assert kvs.get_many(keys) == {key: key.upper() for key in keys}
+    assert kvs.contains_many([*keys, "cherry"]) == set(keys)
+    assert kvs.contains_many([]) == set()
+
+
+def test_kvs_transaction(empty_kvs: KeyValueStore) -> None:
+    """Test KVS changes in a transaction are rolled back on an exception.
+
+    Args:
+        empty_kvs: An empty key-value store
+    """
+    with empty_kvs.transaction() as kvs:
+        kvs["hello"] = "whoop"
+
+    def write_and_fail() -> None:
+        with empty_kvs.transaction() as kvs:
+            kvs["hello"] = "there"
+            kvs["i_am_a_key"] = "and I am a value"
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        write_and_fail()
+
+    assert dict(empty_kvs.items()) == {"hello": "whoop"}
+
+
+def test_kvs_shared_transaction(empty_kvs: KeyValueStore) -> None:
+    """Test changes to two tables sharing a connection are made in one transaction.
+
+    Args:
+        empty_kvs: An empty key-value store
+    """
+    other = empty_kvs.table("other")
+    assert other.conn is empty_kvs.conn
+
+    def write_and_fail() -> None:
+        with empty_kvs.transaction():
+            empty_kvs.set_many({"hello": "whoop"})
+            other.set_many({"hello": "there"})
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        write_and_fail()
+    assert "hello" not in empty_kvs
+    assert "hello" not in other
+
+    with empty_kvs.transaction():
+        empty_kvs.set_many({"hello": "whoop"})
+        other.set_many({"hello": "there"})
+    empty_kvs.close()
+
+    assert KeyValueStore(empty_kvs.path)["hello"] == "whoop"
+    assert KeyValueStore(empty_kvs.path, table="other")["hello"] == "there"
+
+
+def test_kvs_journal_mode(tmp_path: Path) -> None:
+    """Test the write-ahead log is used only when requested.
+
+    Args:
+        tmp_path: The tmp path
+    """
+    shared = KeyValueStore(tmp_path / "shared.db")
+    assert shared.conn.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+    shared.close()
+
+    local = KeyValueStore(tmp_path / "local.db", write_ahead_log=True)
+    assert local.conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    local.close()
+
+
+def test_kvs_catalog_benchmark(
+    tmp_path: Path,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Benchmark caching the docs of 10k plugins, one row at a time and in bulk.
+
+    The plugins are checked against the cache and their docs are written in batches, as
+    they are when collections are cataloged. Both timings are recorded as properties of the
+    test in the junit report. The stores use the write-ahead log, so syncing the database
+    on each commit does not dominate the timings.
+
+    Args:
+        tmp_path: The tmp path
+        record_property: The fixture to record a property of the test
+    """
+    docs = {f"checksum_{number}": f"doc_{number}" * 20 for number in range(10000)}
+    batches = [list(docs)[idx : idx + 32] for idx in range(0, len(docs), 32)]
+
+    per_row = KeyValueStore(tmp_path / "per_row.db", write_ahead_log=True)
+    start = time.perf_counter()
+    missing = [checksum for checksum in docs if checksum not in per_row]
+    for batch in batches:
+        for checksum in batch:
+            per_row[checksum] = docs[checksum]
+        per_row.conn.commit()
+    found = [checksum for checksum in docs if checksum in per_row]
+    per_row_seconds = time.perf_counter() - start
+    record_property("per_row_seconds", per_row_seconds)
+
+    bulk = KeyValueStore(tmp_path / "bulk.db", write_ahead_log=True)
+    start = time.perf_counter()
+    bulk_missing = set(docs) - bulk.contains_many(docs)
+    for batch in batches:
+        bulk.set_many({checksum: docs[checksum] for checksum in batch})
+    bulk_found = bulk.contains_many(docs)
+    bulk_seconds = time.perf_counter() - start
+    record_property("bulk_seconds", bulk_seconds)
+
+    assert bulk_missing == set(missing) == set(docs)
+    assert bulk_found == set(found) == set(docs)
+    assert bulk.get_many(docs) == docs
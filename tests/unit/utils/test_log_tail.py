@@ -0,0 +1,123 @@
+"""Test following a growing log file."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansible_navigator.utils import log_tail as log_tail_module
+from ansible_navigator.utils.log_tail import LogTail
+from ansible_navigator.utils.log_tail import read_tail
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(name="log_file")
+def fixture_log_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Provide a log file with 50 lines and a partial line.
+
+    The file is read backwards in small blocks, so lines span blocks.
+
+    Args:
+        tmp_path: The tmp path
+        monkeypatch: The monkeypatch fixture
+
+    Returns:
+        The log file
+    """
+    monkeypatch.setattr(log_tail_module, "READ_BLOCK_SIZE", 7)
+    monkeypatch.setattr(log_tail_module, "TRIM_LINES", 5)
+    log_file = tmp_path / "ansible-navigator.log"
+    log_file.write_text("".join(f"line {number}\n" for number in range(50)) + "part")
+    return log_file
+
+
+def append(log_file: Path, text: str) -> None:
+    """Append text to the log file.
+
+    Args:
+        log_file: The log file
+        text: The text to append
+    """
+    with log_file.open(mode="a", encoding="utf-8") as file_handle:
+        file_handle.write(text)
+
+
+def test_tail(log_file: Path) -> None:
+    """Test the window follows the end of the file and older lines are paged in.
+
+    Args:
+        log_file: The log file
+    """
+    tail = LogTail(file=log_file, window=10)
+    assert tail.update() == 10
+    assert tail.lines == [f"line {number}" for number in range(40, 50)]
+    assert tail.update() == 0
+
+    append(log_file, "ial\nline 51\nline")
+    assert tail.update() == 2
+    assert tail.lines[-2:] == ["partial", "line 51"]
+
+    lines = tail.lines
+    append(log_file, "".join(f" {number}\n" for number in range(52, 55)))
+    assert tail.update() == 3
+    assert tail.lines is lines
+    assert tail.lines[-1] == " 54"
+    assert len(tail.lines) == 15
+
+    append(log_file, "line 55\n")
+    tail.update(trim=False)
+    assert len(tail.lines) == 16
+    tail.update()
+    assert tail.lines is not lines
+    assert tail.lines[0] == "line 46"
+    assert len(tail.lines) == 10
+
+    assert tail.read_older(count=4) == 4
+    assert tail.lines[:5] == ["line 42", "line 43", "line 44", "line 45", "line 46"]
+    assert tail.read_older() == 42
+    assert tail.at_start
+    assert tail.lines[0] == "line 0"
+    assert tail.read_older() == 0
+
+
+def test_tail_replaced(log_file: Path) -> None:
+    """Test the window is reloaded when the file is truncated or replaced.
+
+    Args:
+        log_file: The log file
+    """
+    tail = LogTail(file=log_file, window=10)
+    tail.update()
+
+    log_file.write_text("truncated\n")
+    tail.update()
+    assert tail.lines == ["truncated"]
+
+    log_file.unlink()
+    assert tail.update() == 0
+    assert tail.lines == ["truncated"]
+
+    log_file.write_text("new\nfile\n")
+    assert tail.update() == 2
+    assert tail.lines == ["new", "file"]
+
+
+def test_read_tail(log_file: Path) -> None:
+    """Test the end of a file is read, bounded by lines and bytes.
+
+    Args:
+        log_file: The log file
+    """
+    assert read_tail(file=log_file, lines=2, max_bytes=1024) == (["line 49", "part"], True)
+    assert read_tail(file=log_file, lines=100, max_bytes=11) == (["part"], True)
+    # The bytes read start at the start of a line
+    assert read_tail(file=log_file, lines=100, max_bytes=12) == (["line 49", "part"], True)
+    assert read_tail(file=log_file, lines=100, max_bytes=0) == ([], True)
+
+    lines, truncated = read_tail(file=log_file, lines=100, max_bytes=1024)
+    assert lines == [*(f"line {number}" for number in range(50)), "part"]
+    assert not truncated
@@ -0,0 +1,111 @@
+"""Test the playbook artifact writer and reader."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ansible_navigator.utils.playbook_artifact import ARTIFACT_VERSION
+from ansible_navigator.utils.playbook_artifact import STDOUT_BATCH_SIZE
+from ansible_navigator.utils.playbook_artifact import PlaybookArtifactReader
+from ansible_navigator.utils.playbook_artifact import PlaybookArtifactWriter
+from ansible_navigator.utils.playbook_artifact import TaskRecords
+from ansible_navigator.utils.playbook_artifact import is_compressed
+from ansible_navigator.utils.playbook_artifact import open_artifact
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("file_name", "compressed"),
+    (("artifact.json", False), ("artifact.json.gz", True), ("artifact.json.xz", True)),
+)
+def test_round_trip(tmp_path: Path, file_name: str, compressed: bool) -> None:
+    """Test an artifact is saved from the journal and read back lazily.
+
+    Args:
+        tmp_path: The tmp path
+        file_name: The artifact file name
+        compressed: Whether the artifact should be compressed
+    """
+    done = {"__number": 0, "__result": "Ok", "res": {"msg": "done"}}
+    running = {"__number": 1, "__result": "In progress", "res": {}}
+    plays = [{"__play_name": "play", "__ok": 1, "tasks": [done, running]}]
+    stdout = [f"line {number}" for number in range(STDOUT_BATCH_SIZE + 5)]
+
+    writer = PlaybookArtifactWriter()
+    writer.add_stdout(stdout)
+    writer.add_task(done)
+    done["res"]["msg"] = "updated"
+    writer.add_task(done)
+
+    artifact = tmp_path / file_name
+    writer.save(
+        file=artifact,
+        plays=plays,
+        summary_keys=("__number", "__result"),
+        status="successful",
+        status_color=10,
+        settings_entries={"ansible-navigator": {}},
+        settings_sources={},
+    )
+    writer.close()
+
+    assert is_compressed(artifact) is compressed
+    assert PlaybookArtifactReader.version(artifact) == ARTIFACT_VERSION
+    with open_artifact(artifact) as file_handle:
+        assert all(json.loads(line) for line in file_handle)
+
+    reader = PlaybookArtifactReader(file=artifact)
+    footer = reader.read_footer()
+    assert footer["status"] == "successful"
+    assert list(reader.stdout(footer["stdout"])) == stdout
+    assert list(reader.stream_stdout()) == stdout
+
+    play = footer["plays"][0]
+    assert play["__ok"] == 1
+    assert [set(task) for task in play["tasks"]] == [{"__number", "__result", "__record"}] * 2
+
+    tasks = TaskRecords(summaries=play["tasks"], reader=reader)
+    assert len(tasks) == 2
+    assert tasks[0] == done
+    assert tasks[1] == running
+    assert tasks[-1] == running
+    assert tasks[:1] == play["tasks"][:1]
+    reader.close()
+
+    copied = tmp_path / "copied.json"
+    PlaybookArtifactReader(file=artifact).copy(file=copied)
+    assert not is_compressed(copied)
+    assert PlaybookArtifactReader(file=copied).read_footer() == footer
+
+
+def test_version_single_document(tmp_path: Path) -> None:
+    """Test an artifact written as a single document has no record version.
+
+    Args:
+        tmp_path: The tmp path
+    """
+    artifact = tmp_path / "artifact.json"
+    artifact.write_text(json.dumps({"version": "2.0.0", "plays": []}, indent=4), encoding="utf-8")
+    assert PlaybookArtifactReader.version(artifact) is None
+
+
+def test_version_compressed_document(tmp_path: Path) -> None:
+    """Test a compressed artifact written as a single document is read transparently.
+
+    Args:
+        tmp_path: The tmp path
+    """
+    artifact = tmp_path / "artifact.json.gz"
+    with gzip.open(artifact, "wt", encoding="utf-8") as file_handle:
+        json.dump({"version": "2.0.0", "plays": []}, file_handle, indent=4)
+    assert PlaybookArtifactReader.version(artifact) is None
+    with open_artifact(artifact) as file_handle:
+        assert json.load(file_handle)["version"] == "2.0.0"